@@ -0,0 +1,102 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Almacenamiento de arreglos según el tipo declarado en declare_array
+#int/long usan array('q') y float/double array('d') (8 bytes por elemento, sin objetos por
+#elemento); el resto de tipos usan listas. Opcionalmente NumPy guarda los arreglos numéricos.
+#Índices fuera de rango y valores que no caben en el tipo del arreglo son SemanticError
+
+from array import array
+
+from errors import SemanticError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#Tipo declarado -> código de tipo del módulo array
+TYPECODES = {
+    'int': 'q',
+    'long': 'q',
+    'float': 'd',
+    'double': 'd',
+}
+
+_NUMPY_DTYPES = {
+    'q': 'int64',
+    'd': 'float64',
+}
+
+#'array' (módulo array), 'numpy' o 'list' (listas de Python, como antes, con verificación de rango).
+#Por omisión 'list': con almacenamiento tipado un arreglo double/float guarda 5 como 5.0 y uno int
+#guarda true como 1, así que la salida del programa cambia; se pide con --arrays
+BACKENDS = ('array', 'numpy', 'list')
+DEFAULT_BACKEND = 'list'
+
+#Clases de arreglo cuyos elementos se leen y escriben directamente en los ciclos de despacho;
+#numpy.ndarray pasa siempre por load/store para devolver valores de Python
+FAST_ARRAYS = frozenset((list, array))
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+def new_array(datatype, size, backend=DEFAULT_BACKEND):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown array backend {backend!r}")
+    if size < 0:
+        raise SemanticError(f"Invalid array size {size}")
+    typecode = TYPECODES.get(datatype)
+    if typecode is None or backend == 'list':
+        return [0] * size
+    if backend == 'numpy':
+        if numpy is None:
+            raise ImportError("The numpy array backend requires NumPy to be installed")
+        return numpy.zeros(size, dtype=_NUMPY_DTYPES[typecode])
+    return array(typecode, (0,)) * size
+
+#Código de tipo de un arreglo ('q', 'd' o None para listas)
+def _typecode(storage):
+    if storage.__class__ is array:
+        return storage.typecode
+    if numpy is not None and storage.__class__ is numpy.ndarray:
+        return 'q' if storage.dtype.kind == 'i' else 'd'
+    return None
+
+def is_storage(value):
+    return value.__class__ in FAST_ARRAYS or (numpy is not None and value.__class__ is numpy.ndarray)
+
+def _check_index(storage, index, name):
+    if not isinstance(index, int):
+        raise SemanticError(f"Array index for {name} must be int, got {type(index).__name__}")
+    if not 0 <= index < len(storage):
+        raise SemanticError(f"Index {index} out of bounds for array {name} of size {len(storage)}")
+
+#Lectura de un elemento con verificación de índice
+def load(storage, index, name):
+    if not is_storage(storage):
+        return storage[index]
+    _check_index(storage, index, name)
+    if storage.__class__ in FAST_ARRAYS:
+        return storage[index]
+    return storage.item(index)
+
+#Escritura de un elemento con verificación de índice y de tipo
+def store(storage, index, value, name):
+    if not is_storage(storage):
+        storage[index] = value
+        return
+    _check_index(storage, index, name)
+    typecode = _typecode(storage)
+    if typecode == 'q':
+        if not isinstance(value, int):
+            raise SemanticError(f"Cannot store {type(value).__name__} value {value!r} in int array {name}")
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            raise SemanticError(f"Value {value} out of range for int array {name}")
+    elif typecode == 'd':
+        if not isinstance(value, (int, float)):
+            raise SemanticError(f"Cannot store {type(value).__name__} value {value!r} in double array {name}")
+        try:
+            value = float(value)
+        except OverflowError:
+            raise SemanticError(f"Value {value} out of range for double array {name}") from None
+    storage[index] = value
@@ -0,0 +1,392 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Nodos del AST - clases con __slots__ y número de línea que construye el parser
+#Cada clase tiene el mismo nombre de tipo (kind) y los mismos campos, en el mismo orden, que las
+#tuplas que generaba antes el parser: node[0] es el tipo y node[i] el campo i, y repr(node) imprime
+#la tupla equivalente, así el AST que se muestra no cambia. Las listas de sentencias son listas
+
+class Node:
+    __slots__ = ('lineno',)
+    kind = None
+    fields = ()
+
+    def __init__(self, lineno=0):
+        self.lineno = lineno
+
+    #Tipo y campos sin convertir los hijos
+    def items(self):
+        return (self.kind,) + tuple(getattr(self, name) for name in self.fields)
+
+    #Acceso como tupla: node[0] es el tipo, node[1:] los campos
+    def __getitem__(self, index):
+        return self.items()[index]
+
+    def __len__(self):
+        return len(self.items())
+
+    #Siempre verdadero, como una tupla no vacía (sin pasar por __len__)
+    def __bool__(self):
+        return True
+
+    def to_tuple(self):
+        return _plain(self)
+
+    #Comparación campo por campo sin recursión; la línea no cuenta
+    def __eq__(self, other):
+        stack = [(self, other)]
+        while stack:
+            left, right = stack.pop()
+            if isinstance(left, (Node, list)):
+                if left.__class__ is not right.__class__:
+                    return False
+                if isinstance(left, Node):
+                    left, right = left.items(), right.items()
+                if len(left) != len(right):
+                    return False
+                stack.extend(zip(left, right))
+            elif left != right:
+                return False
+        return True
+
+    __hash__ = None
+
+    def __repr__(self):
+        return _format(self)
+
+    #Pickle compacto (para el cache de compilación): clase, línea y argumentos del constructor
+    def __reduce__(self):
+        return (_rebuild, (self.__class__, self.lineno, self.items()[1:]))
+
+def _rebuild(cls, lineno, values):
+    return cls(*values, lineno=lineno)
+
+#Forma en tuplas de un valor (listas de sentencias -> tuplas de tuplas).
+#Recorrido en postorden con pila explícita: sirve para expresiones de cualquier profundidad
+def _plain(root):
+    results = []
+    stack = [(root, None)]
+    while stack:
+        value, count = stack.pop()
+        if count is not None:
+            start = len(results) - count
+            children = tuple(results[start:])
+            del results[start:]
+            results.append(children)
+            continue
+        if isinstance(value, Node):
+            children = value.items()
+        elif isinstance(value, list):
+            children = value
+        else:
+            results.append(value)
+            continue
+        stack.append((None, len(children)))
+        stack.extend((child, None) for child in reversed(children))
+    return results[0]
+
+#repr de la forma en tuplas, igual al de la tupla anidada pero sin recursión
+def _format(root):
+    parts = []
+    stack = [(False, root)]
+    while stack:
+        is_text, value = stack.pop()
+        if is_text:
+            parts.append(value)
+            continue
+        if isinstance(value, Node):
+            children = value.items()
+        elif isinstance(value, list):
+            children = value
+        else:
+            parts.append(repr(value))
+            continue
+        parts.append('(')
+        stack.append((True, ',)' if len(children) == 1 else ')'))
+        for index in range(len(children) - 1, -1, -1):
+            stack.append((False, children[index]))
+            if index:
+                stack.append((True, ', '))
+    return ''.join(parts)
+
+class Program(Node):
+    __slots__ = ('name', 'body')
+    kind = 'programstart'
+    fields = ('name', 'body')
+
+    def __init__(self, name, body, lineno=0):
+        self.name = name
+        self.body = body
+        self.lineno = lineno
+
+class Statement(Node):
+    __slots__ = ('node',)
+    kind = 'statement'
+    fields = ('node',)
+
+    def __init__(self, node, lineno=0):
+        self.node = node
+        self.lineno = lineno
+
+class Declaration(Node):
+    __slots__ = ('datatype', 'declareid')
+    kind = 'declaration'
+    fields = ('datatype', 'declareid')
+
+    def __init__(self, datatype, declareid, lineno=0):
+        self.datatype = datatype
+        self.declareid = declareid
+        self.lineno = lineno
+
+class DeclareSingle(Node):
+    __slots__ = ('name',)
+    kind = 'declareid_single'
+    fields = ('name',)
+
+    def __init__(self, name, lineno=0):
+        self.name = name
+        self.lineno = lineno
+
+class DeclareSingleValue(Node):
+    __slots__ = ('assignment',)
+    kind = 'declareid_single_d'
+    fields = ('assignment',)
+
+    def __init__(self, assignment, lineno=0):
+        self.assignment = assignment
+        self.lineno = lineno
+
+class DeclareMultiple(Node):
+    __slots__ = ('rest', 'name')
+    kind = 'declareid_multiple'
+    fields = ('rest', 'name')
+
+    def __init__(self, rest, name, lineno=0):
+        self.rest = rest
+        self.name = name
+        self.lineno = lineno
+
+class DeclareMultipleValue(Node):
+    __slots__ = ('rest', 'assignment')
+    kind = 'declareid_multiple_d'
+    fields = ('rest', 'assignment')
+
+    def __init__(self, rest, assignment, lineno=0):
+        self.rest = rest
+        self.assignment = assignment
+        self.lineno = lineno
+
+class Assignment(Node):
+    __slots__ = ('target', 'operator', 'value')
+    kind = 'assignment'
+    fields = ('target', 'operator', 'value')
+
+    def __init__(self, target, operator, value, lineno=0):
+        self.target = target
+        self.operator = operator
+        self.value = value
+        self.lineno = lineno
+
+class DataType(Node):
+    __slots__ = ('name',)
+    kind = 'datatype'
+    fields = ('name',)
+
+    def __init__(self, name, lineno=0):
+        self.name = name
+        self.lineno = lineno
+
+#Operaciones binarias; kind es el tipo de la tupla original ('plus', 'lt', 'and', ...)
+class BinaryOp(Node):
+    __slots__ = ('kind', 'left', 'right')
+    fields = ('left', 'right')
+
+    def __init__(self, kind, left, right, lineno=0):
+        self.kind = kind
+        self.left = left
+        self.right = right
+        self.lineno = lineno
+
+    def __reduce__(self):
+        return (_rebuild, (BinaryOp, self.lineno, self.items()))
+
+class Factor(Node):
+    __slots__ = ('value',)
+    kind = 'factor'
+    fields = ('value',)
+
+    def __init__(self, value, lineno=0):
+        self.value = value
+        self.lineno = lineno
+
+class Increment(Node):
+    __slots__ = ('name',)
+    kind = 'increment'
+    fields = ('name',)
+
+    def __init__(self, name, lineno=0):
+        self.name = name
+        self.lineno = lineno
+
+class Decrement(Node):
+    __slots__ = ('name',)
+    kind = 'decrement'
+    fields = ('name',)
+
+    def __init__(self, name, lineno=0):
+        self.name = name
+        self.lineno = lineno
+
+class Arrow(Node):
+    __slots__ = ('value', 'name')
+    kind = 'arrow'
+    fields = ('value', 'name')
+
+    def __init__(self, value, name, lineno=0):
+        self.value = value
+        self.name = name
+        self.lineno = lineno
+
+class If(Node):
+    __slots__ = ('condition', 'body')
+    kind = 'if'
+    fields = ('condition', 'body')
+
+    def __init__(self, condition, body, lineno=0):
+        self.condition = condition
+        self.body = body
+        self.lineno = lineno
+
+class IfElse(Node):
+    __slots__ = ('condition', 'body', 'orelse')
+    kind = 'if-else'
+    fields = ('condition', 'body', 'orelse')
+
+    def __init__(self, condition, body, orelse, lineno=0):
+        self.condition = condition
+        self.body = body
+        self.orelse = orelse
+        self.lineno = lineno
+
+class While(Node):
+    __slots__ = ('condition', 'body')
+    kind = 'while'
+    fields = ('condition', 'body')
+
+    def __init__(self, condition, body, lineno=0):
+        self.condition = condition
+        self.body = body
+        self.lineno = lineno
+
+class For(Node):
+    __slots__ = ('init', 'condition', 'step', 'body')
+    kind = 'for'
+    fields = ('init', 'condition', 'step', 'body')
+
+    def __init__(self, init, condition, step, body, lineno=0):
+        self.init = init
+        self.condition = condition
+        self.step = step
+        self.body = body
+        self.lineno = lineno
+
+class ArrayDeclaration(Node):
+    __slots__ = ('datatype', 'name', 'size')
+    kind = 'array_declaration'
+    fields = ('datatype', 'name', 'size')
+
+    def __init__(self, datatype, name, size, lineno=0):
+        self.datatype = datatype
+        self.name = name
+        self.size = size
+        self.lineno = lineno
+
+class ArrayAssignment(Node):
+    __slots__ = ('name', 'index', 'value')
+    kind = 'array_assignment'
+    fields = ('name', 'index', 'value')
+
+    def __init__(self, name, index, value, lineno=0):
+        self.name = name
+        self.index = index
+        self.value = value
+        self.lineno = lineno
+
+class ArrayAccess(Node):
+    __slots__ = ('name', 'index')
+    kind = 'array_access'
+    fields = ('name', 'index')
+
+    def __init__(self, name, index, lineno=0):
+        self.name = name
+        self.index = index
+        self.lineno = lineno
+
+class Write(Node):
+    __slots__ = ('value',)
+    kind = 'write'
+    fields = ('value',)
+
+    def __init__(self, value, lineno=0):
+        self.value = value
+        self.lineno = lineno
+
+class WriteLine(Node):
+    __slots__ = ('value',)
+    kind = 'writeln'
+    fields = ('value',)
+
+    def __init__(self, value, lineno=0):
+        self.value = value
+        self.lineno = lineno
+
+class Break(Node):
+    __slots__ = ()
+    kind = 'break'
+
+#return sin expresión se imprime como ('return',)
+class Return(Node):
+    __slots__ = ('value',)
+    kind = 'return'
+    fields = ('value',)
+
+    def __init__(self, value=None, lineno=0):
+        self.value = value
+        self.lineno = lineno
+
+    def items(self):
+        if self.value is None:
+            return (self.kind,)
+        return (self.kind, self.value)
+
+#Número de nodos de un AST (recorrido sin recursión)
+def count_nodes(root):
+    count = 0
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Node):
+            count += 1
+            stack.extend(getattr(value, name) for name in value.fields)
+        elif isinstance(value, list):
+            stack.extend(value)
+    return count
+
+#Tipos de las operaciones binarias
+BINARY_KINDS = ('plus', 'minus', 'mult', 'divide', 'mod', 'lt', 'gt', 'le', 'ge', 'ne', 'booleq', 'and', 'or')
+
+_CLASSES = {cls.kind: cls for cls in (
+    Program, Statement, Declaration, DeclareSingle, DeclareSingleValue, DeclareMultiple, DeclareMultipleValue,
+    Assignment, DataType, Factor, Increment, Decrement, Arrow, If, IfElse, While, For, ArrayDeclaration,
+    ArrayAssignment, ArrayAccess, Write, WriteLine, Break, Return)}
+
+#Convierte un AST de tuplas (formato anterior del parser) a nodos
+def from_tuple(value):
+    if isinstance(value, tuple):
+        if value and isinstance(value[0], str) and (value[0] in _CLASSES or value[0] in BINARY_KINDS):
+            kind = value[0]
+            children = [from_tuple(item) for item in value[1:]]
+            if kind in BINARY_KINDS:
+                return BinaryOp(kind, *children)
+            return _CLASSES[kind](*children)
+        return [from_tuple(item) for item in value]
+    return value
@@ -0,0 +1,53 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark de arreglos - memoria y tiempo de los backends de arrays.py
+#Llena un arreglo int y uno double de n elementos y mide el pico de memoria con tracemalloc
+
+import argparse
+import time
+import tracemalloc
+
+from parse import run_parse
+from codegen import CodeGen
+from vm import BytecodeVM
+from arrays import BACKENDS, numpy
+from output import StringOutput
+
+PROGRAM = """program main{
+	int i;
+	int a[%d];
+	double d[%d];
+	for (i = 0; i < %d; i++) {
+		a[i] = i * 3;
+		d[i] = i / 2;
+	}
+	writeln(a[%d] + d[%d]);
+}"""
+
+def main():
+    argparser = argparse.ArgumentParser(description="Memoria y tiempo de los backends de arreglos")
+    argparser.add_argument('-n', type=int, default=1_000_000, help='elementos por arreglo')
+    args = argparser.parse_args()
+    n = args.n
+
+    quadruples = CodeGen(run_parse(PROGRAM % (n, n, n, n - 1, n - 1))).generate()
+    for backend in BACKENDS:
+        if backend == 'numpy' and numpy is None:
+            print(f"{backend:6} skipped (NumPy not installed)")
+            continue
+        output = StringOutput()
+        start = time.perf_counter()
+        BytecodeVM(output=output, array_backend=backend).interpret(quadruples)
+        elapsed = time.perf_counter() - start
+
+        #Segunda ejecución solo para medir memoria (tracemalloc vuelve lenta la ejecución)
+        tracemalloc.start()
+        BytecodeVM(output=StringOutput(), array_backend=backend).interpret(quadruples)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{backend:6} n={n:<9} peak {peak / 2 ** 20:8.1f} MiB ({peak / (2 * n):5.1f} B/element)   "
+              f"{elapsed:7.3f} s   output {output.getvalue().strip()}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark de CompileCache - front end en frío (parse + CodeGen) contra en caliente (cache)
+
+import argparse
+import shutil
+import tempfile
+import time
+
+from parse import Parser
+from codegen import CodeGen
+from cache import CompileCache
+
+#Programa sintético con n asignaciones y un ciclo cada 10 sentencias
+def generate(n):
+    lines = ["program main{", "\tint i, x, y;", "\tx = 0;", "\ty = 1;"]
+    for k in range(n):
+        if k % 10 == 0:
+            lines.append(f"\tfor (i = 0; i < {k % 7 + 1}; i++) {{ x = x + i * {k}; }}")
+        else:
+            lines.append(f"\ty = (x + {k}) * 2 - y / 3;")
+    lines.append("\twriteln(x);")
+    lines.append("}")
+    return "\n".join(lines)
+
+def main():
+    argparser = argparse.ArgumentParser(description="Front end en frío contra cache en disco")
+    argparser.add_argument('-n', type=int, default=5000, help='sentencias en el programa')
+    argparser.add_argument('--repeat', type=int, default=5, help='recompilaciones en caliente')
+    args = argparser.parse_args()
+
+    data = generate(args.n)
+    parser = Parser()
+    directory = tempfile.mkdtemp(prefix='csc-cache-')
+    try:
+        compile_cache = CompileCache(directory)
+
+        start = time.perf_counter()
+        ast = parser.parse(data)
+        generator = CodeGen(ast)
+        quadruples = generator.generate()
+        cold = time.perf_counter() - start
+        compile_cache.put(data, ast, quadruples, generator.temp_counter)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            cached = compile_cache.get(data)
+        warm = (time.perf_counter() - start) / args.repeat
+
+        if [str(quad) for quad in cached.quadruples] != [str(quad) for quad in quadruples] or cached.ast != ast:
+            raise SystemExit("cached front end differs from a fresh compile")
+        print(f"n={args.n:<7} {len(quadruples)} quadruples   cold {cold:7.3f} s   warm {warm:7.4f} s   "
+              f"speedup {cold / warm:6.1f}x   (hits {compile_cache.hits}, misses {compile_cache.misses})")
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    main()
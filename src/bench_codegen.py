@@ -0,0 +1,68 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark de escalamiento de CodeGen - profundidad de expresiones y largo del programa
+#Serie "depth": una sola expresión a + b + c + ... (árbol profundo hacia la izquierda) de n términos.
+#Serie "length": programas de n sentencias. Falla (código 1) con RecursionError o si el tiempo
+#por nodo crece más que linealmente entre el tamaño menor y el mayor de una serie
+
+import argparse
+import gc
+import time
+
+from parse import Parser
+from codegen import CodeGen
+from astnodes import count_nodes
+from bench_cache import generate
+
+#Crecimiento máximo permitido del tiempo por nodo dentro de una serie
+MAX_GROWTH = 2.0
+
+def deep_expression(n):
+    terms = ' + '.join(f"x{k % 7}" for k in range(n))
+    return f"program main{{ int x0, x1, x2, x3, x4, x5, x6, y; y = {terms}; writeln(y); }}"
+
+SERIES = {
+    'depth': deep_expression,
+    'length': generate,
+}
+
+def run(parser, name, build, sizes):
+    per_node = []
+    for n in sizes:
+        ast = parser.parse(build(n))
+        nodes = count_nodes(ast)
+        #Como timeit, sin el recolector cíclico: con millones de objetos vivos sus pasadas
+        #completas se vuelven más largas y ocultan el costo propio de CodeGen
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            quadruples = CodeGen(ast).generate()
+            generated = time.perf_counter() - start
+        finally:
+            gc.enable()
+        #Imprimir el AST (show_ast) tampoco depende de la profundidad
+        start = time.perf_counter()
+        text = repr(ast)
+        shown = time.perf_counter() - start
+        per_node.append(generated / nodes)
+        print(f"{name:6} n={n:<7} {nodes:8} nodes  codegen {generated:7.3f} s  {nodes / generated:10,.0f} nodes/s  "
+              f"{len(quadruples):8} quads  repr {shown:6.3f} s ({len(text) / 2**20:5.1f} MB)")
+    growth = per_node[-1] / per_node[0]
+    print(f"{name:6} time per node x{growth:4.2f} from n={sizes[0]} to n={sizes[-1]}")
+    return growth <= MAX_GROWTH
+
+def main():
+    argparser = argparse.ArgumentParser(description="Escalamiento de CodeGen por profundidad y largo")
+    argparser.add_argument('--depths', type=int, nargs='*', default=[1000, 10000, 100000], help='términos de la expresión')
+    argparser.add_argument('--lengths', type=int, nargs='*', default=[10000, 50000, 100000], help='sentencias del programa')
+    args = argparser.parse_args()
+
+    parser = Parser()
+    sizes = {'depth': args.depths, 'length': args.lengths}
+    failed = [name for name, build in SERIES.items() if not run(parser, name, build, sizes[name])]
+    if failed:
+        raise SystemExit(f"superlinear code generation: {', '.join(failed)}")
+
+if __name__ == '__main__':
+    main()
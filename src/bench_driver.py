@@ -0,0 +1,51 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark del driver - archivos por segundo según el número de procesos
+
+import argparse
+import glob
+import os
+import shutil
+import tempfile
+import time
+
+from driver import CompileOptions, run_batch
+
+def main():
+    argparser = argparse.ArgumentParser(description="Throughput de driver.run_batch por número de procesos")
+    argparser.add_argument('-n', type=int, default=400, help='archivos en el lote')
+    argparser.add_argument('--jobs', type=int, nargs='*', default=None,
+                           help='números de procesos a probar (por omisión 1, 2, 4, ... hasta los núcleos)')
+    args = argparser.parse_args()
+
+    cores = os.cpu_count() or 1
+    jobs_list = args.jobs or sorted({1 << k for k in range(cores.bit_length()) if 1 << k <= cores} | {cores})
+
+    #Lote con copias de los programas de prueba que compilan sin errores
+    here = os.path.dirname(os.path.abspath(__file__))
+    programs = [path for path in sorted(glob.glob(os.path.join(here, '..', 'test', 'test_case*.txt')))
+                if not path.endswith('test_case7.txt')]
+    directory = tempfile.mkdtemp(prefix='csc-bench-')
+    try:
+        paths = []
+        for n in range(args.n):
+            path = os.path.join(directory, f"program{n:05d}.txt")
+            shutil.copyfile(programs[n % len(programs)], path)
+            paths.append(path)
+
+        options = CompileOptions(show_ast=False, show_ir=False, show_pseudo=False)
+        base = None
+        for jobs in jobs_list:
+            start = time.perf_counter()
+            results = list(run_batch(paths, options, jobs))
+            elapsed = time.perf_counter() - start
+            if [result.path for result in results] != paths or not all(result.ok for result in results):
+                raise SystemExit(f"jobs={jobs}: results out of order or failed")
+            base = base or elapsed
+            print(f"jobs={jobs:<3} {args.n} files {elapsed:7.3f} s   {args.n / elapsed:8.1f} files/s   "
+                  f"speedup {base / elapsed:5.2f}x (cores: {cores})")
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    main()
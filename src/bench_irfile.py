@@ -0,0 +1,54 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark de irfile - compilar desde el fuente contra cargar IR binario (mmap y decodificación perezosa)
+
+import argparse
+import os
+import tempfile
+import time
+
+from parse import Parser
+from codegen import CodeGen
+from irfile import dump, load
+from bench_cache import generate
+
+def main():
+    argparser = argparse.ArgumentParser(description="Front end contra carga de IR precompilado")
+    argparser.add_argument('-n', type=int, default=20000, help='sentencias en el programa')
+    args = argparser.parse_args()
+
+    data = generate(args.n)
+    parser = Parser()
+    start = time.perf_counter()
+    quadruples = CodeGen(parser.parse(data)).generate()
+    front_end = time.perf_counter() - start
+
+    fd, path = tempfile.mkstemp(suffix='.csir')
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        dump(quadruples, path)
+        dumped = time.perf_counter() - start
+
+        #Primer cuadruplo: solo se lee el encabezado y un registro
+        start = time.perf_counter()
+        with load(path) as program:
+            first = program[0]
+        first_quad = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with load(path) as program:
+            decoded = list(program)
+        full = time.perf_counter() - start
+
+        if repr(decoded) != repr(quadruples) or repr(first) != repr(quadruples[0]):
+            raise SystemExit("decoded IR differs from the compiled quadruples")
+        print(f"n={args.n:<7} {len(quadruples)} quadruples   {os.path.getsize(path) / len(quadruples):5.1f} bytes/quad   "
+              f"{os.path.getsize(path) / len(data):4.2f}x the source text size")
+        print(f"front end {front_end:7.3f} s   dump {dumped:7.3f} s   first quad {first_quad * 1e3:7.3f} ms   "
+              f"full decode {full:7.3f} s   speedup {front_end / full:5.1f}x")
+    finally:
+        os.remove(path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark del lexer - tokens por segundo sobre fuentes generadas de varios megabytes
+#Con --pathological se lexean entradas patológicas de tamaño n, 2n, 4n y 8n y el benchmark falla
+#(código 1) si el tiempo de alguna crece más que linealmente, como pasaba con la expresión anterior de
+#comentarios. Una sola duplicación puede saltar de 2x a 6x en un lexer lineal (la entrada deja de caber
+#en un cache del procesador), así que se compara la mediana de las duplicaciones y no solo una
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import tempfile
+import time
+
+from lexer import make_lexer, tokenize
+from fastlex import FastLexer
+
+#Programa sintético de al menos size bytes con declaraciones, ciclos, comentarios y literales
+def generate(size):
+    lines = ["program main{", "\tint i, x, y;", "\tdouble d;", "\tchar c;"]
+    length = sum(len(line) + 1 for line in lines)
+    k = 0
+    while length < size:
+        block = [
+            f"\t// iteración {k}",
+            f"\tfor (i = 0; i < {k % 97 + 1}; i++) {{ x = x + i * {k}; }}",
+            f"\t/* bloque {k}\n\t   varias líneas */",
+            f"\ty = (x + {k}) * 2 - y / 3 % 5;",
+            f"\td = {k}.25d; c = 'z';",
+            f"\tif (x >= y && y != {k}) {{ writeln(\"valor {k}\"); }} else {{ write(x); }}",
+        ]
+        lines.extend(block)
+        length += sum(len(line) + 1 for line in block)
+        k += 1
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+#Entradas patológicas de aproximadamente size caracteres
+PATHOLOGICAL = {
+    'huge_comment': lambda size: "/*" + "comentario largo\n" * (size // 17) + "*/",
+    'star_comment': lambda size: "/*" + "*a" * (size // 2) + "*/",
+    'open_comment': lambda size: "x /*" + "y z\n" * (size // 4),
+    'long_string': lambda size: '"' + "a" * size + '"',
+    'escaped_string': lambda size: '"' + '\\"' * (size // 2) + '"',
+    'open_string': lambda size: '"' + "a b\n" * (size // 4),
+    'operators': lambda size: "<= >= == != ++ -- && || " * (size // 24),
+    'long_identifier': lambda size: "a" * size,
+    'chars': lambda size: "'c' " * (size // 4),
+}
+
+#Crecimiento máximo permitido de la mediana del tiempo al duplicar la entrada (lineal ~2, cuadrático ~4)
+MAX_GROWTH = 3.0
+
+#Duplicaciones medidas a partir de n
+GROWTH_STEPS = 3
+
+#Tamaño mínimo de n: por debajo el costo por carácter todavía da saltos (64K -> 128K y 128K -> 256K
+#llegaron a 6x y 8x en lexers lineales) y unas duplicaciones bastan para cambiar la mediana
+MIN_SIZE = 128 * 1024
+
+#Mediana de repeat mediciones; las entradas rápidas se repiten hasta sumar al menos 50 ms
+def lex_time(data, repeat=3, minimum=0.05):
+    times = []
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            lex_state = make_lexer()
+            lex_state.input(data)
+            #Los caracteres ilegales de las entradas abiertas se reportan con print
+            with contextlib.redirect_stdout(io.StringIO()):
+                count = sum(1 for _ in iter(lex_state.token, None))
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= minimum:
+                break
+        times.append(elapsed / loops)
+    return statistics.median(times), count
+
+def pathological(size):
+    if size < MIN_SIZE:
+        print(f"-n {size} is below the minimum of {MIN_SIZE} characters, using {MIN_SIZE}")
+        size = MIN_SIZE
+    failed = []
+    for name, build in PATHOLOGICAL.items():
+        times = []
+        for step in range(GROWTH_STEPS + 1):
+            elapsed, count = lex_time(build(size << step))
+            times.append(elapsed)
+        growths = [large / max(small, 1e-6) for small, large in zip(times, times[1:])]
+        growth = statistics.median(growths)
+        status = 'ok' if growth <= MAX_GROWTH else 'SUPERLINEAR'
+        if status != 'ok':
+            failed.append(name)
+        largest = size << GROWTH_STEPS
+        print(f"{name:16} {size:>9}..{largest:<9} chars {count:8} tokens  {times[0]:8.4f} .. {times[-1]:8.4f} s  "
+              f"growth x2 {' '.join(f'{value:4.2f}' for value in growths)} (median {growth:4.2f})  "
+              f"{largest / times[-1] / 2**20:7.2f} MB/s  {status}")
+    if failed:
+        raise SystemExit(f"superlinear lexing: {', '.join(failed)}")
+
+def whole_string(path):
+    with open(path) as source:
+        data = source.read()
+    lex_state = make_lexer()
+    lex_state.input(data)
+    return sum(1 for _ in iter(lex_state.token, None))
+
+def fast(path):
+    with open(path) as source:
+        data = source.read()
+    lex_state = FastLexer()
+    lex_state.input(data)
+    return sum(1 for _ in iter(lex_state.token, None))
+
+def streamed(path):
+    with open(path) as source:
+        return sum(len(batch) for batch in tokenize(source))
+
+def main():
+    argparser = argparse.ArgumentParser(description="Tokens por segundo del lexer")
+    argparser.add_argument('--sizes', type=float, nargs='*', default=[1, 4], help='tamaños de fuente en MB')
+    argparser.add_argument('--pathological', action='store_true', help='entradas patológicas con verificación de escalamiento')
+    argparser.add_argument('-n', type=int, default=MIN_SIZE,
+                           help=f'tamaño base de las entradas patológicas (mínimo {MIN_SIZE})')
+    args = argparser.parse_args()
+
+    if args.pathological:
+        pathological(args.n)
+        return
+
+    for megabytes in args.sizes:
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w') as source:
+            source.write(generate(int(megabytes * 2**20)))
+        try:
+            counts = {}
+            for name, function in (('input()', whole_string), ('stream', streamed), ('fastlex', fast)):
+                start = time.perf_counter()
+                counts[name] = function(path)
+                elapsed = time.perf_counter() - start
+                print(f"{megabytes:5.1f} MB  {name:8} {counts[name]:9} tokens  {elapsed:7.3f} s  "
+                      f"{counts[name] / elapsed:11,.0f} tokens/s  {megabytes / elapsed:6.2f} MB/s")
+            if len(set(counts.values())) != 1:
+                raise SystemExit(f"token counts differ: {counts}")
+        finally:
+            os.remove(path)
+
+if __name__ == '__main__':
+    main()
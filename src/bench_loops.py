@@ -0,0 +1,108 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark de LoopIdioms - ciclos escalares contra operaciones en bloque
+
+import argparse
+import time
+
+from parse import run_parse
+from codegen import CodeGen
+from loops import LoopIdioms
+from vm import BytecodeVM
+from jit import JITExecuter
+from arrays import BACKENDS, numpy
+from output import StringOutput
+from limits import ExecutionLimits
+from errors import ResourceLimitError
+
+#Límites de la verificación con -O: los ciclos en bloque se cobran como el ciclo escalar
+LIMITS = ExecutionLimits(max_instructions=1000, timeout=60)
+
+#Un ciclo de cada tipo (map, fill, copy, reduce) sobre arreglos de n elementos
+PROGRAMS = {
+    'map_int': """program main{
+	int i, n, k;
+	int a[%(n)d];
+	n = %(n)d;
+	k = 3;
+	for (i = 0; i < n; i++) {
+		a[i] = a[i] * 2 + k;
+	}
+	writeln(a[n - 1]);
+}""",
+    'fill_copy': """program main{
+	int i, n;
+	int a[%(n)d];
+	int b[%(n)d];
+	n = %(n)d;
+	for (i = 0; i < n; i++) {
+		a[i] = 7;
+	}
+	for (i = 0; i < n; i++) {
+		b[i] = a[i];
+	}
+	writeln(b[n - 1]);
+}""",
+    'dot_double': """program main{
+	int i, n;
+	double s, h;
+	double x[%(n)d];
+	double y[%(n)d];
+	n = %(n)d;
+	s = 0.0d;
+	h = 0.5d;
+	for (i = 0; i < n; i++) {
+		x[i] = h;
+	}
+	for (i = 0; i < n; i++) {
+		y[i] = x[i] * 4.0d + h;
+	}
+	for (i = 0; i < n; i++) {
+		s = s + x[i] * y[i];
+	}
+	writeln(s);
+}""",
+}
+
+def timed(quadruples, backend):
+    output = StringOutput()
+    start = time.perf_counter()
+    BytecodeVM(output=output, array_backend=backend).interpret(quadruples)
+    return time.perf_counter() - start, output.getvalue()
+
+#Límite alcanzado (o 'ok') y salida de una ejecución con LIMITS
+def limited(engine, quadruples, backend):
+    output = StringOutput()
+    try:
+        engine(output=output, array_backend=backend, limits=LIMITS).interpret(quadruples)
+    except ResourceLimitError as error:
+        return error.limit, output.getvalue()
+    return 'ok', output.getvalue()
+
+def main():
+    argparser = argparse.ArgumentParser(description="Ciclos escalares contra LoopIdioms")
+    argparser.add_argument('-n', type=int, default=1_000_000, help='elementos por arreglo')
+    args = argparser.parse_args()
+
+    for name, template in PROGRAMS.items():
+        generator = CodeGen(run_parse(template % {'n': args.n}))
+        quadruples = generator.generate()
+        idioms = LoopIdioms(quadruples, generator.temp_counter)
+        lowered = idioms.lower()
+        for backend in BACKENDS:
+            if backend == 'numpy' and numpy is None:
+                continue
+            scalar, expected = timed(quadruples, backend)
+            bulk, output = timed(lowered, backend)
+            if output != expected:
+                raise SystemExit(f"{name}/{backend}: output mismatch {output!r} != {expected!r}")
+            expected = limited(BytecodeVM, quadruples, backend)
+            for engine in (BytecodeVM, JITExecuter):
+                if limited(engine, lowered, backend) != expected:
+                    raise SystemExit(f"{name}/{backend}: {engine.__name__} with {LIMITS!r} does not stop like the"
+                                     f" scalar loops: {limited(engine, lowered, backend)!r} != {expected!r}")
+            print(f"{name:11} {backend:6} n={args.n:<9} loops {len(idioms.kernels)}   scalar {scalar:7.3f} s   "
+                  f"bulk {bulk:7.3f} s   speedup {scalar / bulk:6.1f}x")
+
+if __name__ == '__main__':
+    main()
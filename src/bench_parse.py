@@ -0,0 +1,63 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark del parser - latencia de run_parse en frío contra en caliente
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import ply.yacc as yacc
+
+import parse
+
+SAMPLE = """program main{
+	int a,b,x;
+	a = 5;
+	b = a + 3;
+	x = a * (b + 4);
+	if (a > b) { writeln("mayor"); } else { writeln(x); }
+}"""
+
+#Mide la primera llamada a run_parse en un proceso nuevo (import + tablas + parse)
+def cold_run(cache):
+    code = (
+        "import time; t = time.perf_counter(); import parse; "
+        "parse.run_parse(%r); print(time.perf_counter() - t)" % SAMPLE
+    )
+    env = dict(os.environ, **{parse.CACHE_ENV_VAR: cache})
+    out = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                         env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+#Mide el promedio de n llamadas en el mismo proceso
+def warm_run(func, n):
+    func(SAMPLE)
+    start = time.perf_counter()
+    for _ in range(n):
+        func(SAMPLE)
+    return (time.perf_counter() - start) / n
+
+#Comportamiento anterior: yacc.yacc() en cada llamada
+def legacy_run_parse(data):
+    parser = yacc.yacc(module=parse, debug=False, write_tables=False)
+    return parser.parse(data, lexer=parse.lexer.clone())
+
+def main():
+    argparser = argparse.ArgumentParser(description="Latencia de run_parse en frío y en caliente")
+    argparser.add_argument('-n', type=int, default=200, help='llamadas en caliente')
+    args = argparser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache:
+        build = cold_run(cache)
+        load = cold_run(cache)
+
+    print(f"cold, tables built:        {build * 1e3:9.3f} ms")
+    print(f"cold, tables from cache:   {load * 1e3:9.3f} ms")
+    print(f"warm, legacy yacc() call:  {warm_run(legacy_run_parse, max(args.n // 20, 1)) * 1e3:9.3f} ms")
+    print(f"warm, cached Parser:       {warm_run(parse.run_parse, args.n) * 1e3:9.3f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Escalamiento del parser - tiempo por sentencia en programas generados de hasta 100k sentencias
+#Mide parse, CodeGen y memoria del AST por tamaño, y falla (código 1) si el tiempo por sentencia
+#crece más que linealmente con el tamaño del programa, como pasaba al acumular las sentencias en
+#tuplas (p[1] + (p[2],) copia toda la lista en cada reducción de code)
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from parse import Parser
+from codegen import CodeGen
+from astnodes import count_nodes
+from fastlex import LEXERS
+from bench_cache import generate
+
+#Crecimiento máximo permitido del tiempo por sentencia entre el tamaño menor y el mayor
+MAX_GROWTH = 2.0
+
+#Bytes que ocupa el AST (memoria retenida al terminar el parse)
+def ast_bytes(parser, data):
+    gc.collect()
+    tracemalloc.start()
+    ast = parser.parse(data)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return ast, size
+
+def main():
+    argparser = argparse.ArgumentParser(description="Escalamiento de parse y CodeGen con el número de sentencias")
+    argparser.add_argument('--sizes', type=int, nargs='*', default=[25000, 50000, 100000], help='sentencias por programa')
+    argparser.add_argument('--lexer', choices=sorted(LEXERS), default='ply')
+    args = argparser.parse_args()
+
+    parser = Parser(args.lexer)
+    per_statement = []
+    for n in args.sizes:
+        data = generate(n)
+        start = time.perf_counter()
+        ast = parser.parse(data)
+        parsed = time.perf_counter() - start
+        start = time.perf_counter()
+        quadruples = CodeGen(ast).generate()
+        generated = time.perf_counter() - start
+        del ast
+        ast, size = ast_bytes(parser, data)
+        nodes = count_nodes(ast)
+        per_statement.append(parsed / n)
+        print(f"{n:7} statements  {len(data) / 2**20:5.2f} MB  parse {parsed:7.3f} s ({n / parsed:9,.0f} stmt/s)  "
+              f"codegen {generated:6.3f} s  {len(quadruples):8} quads  {nodes:8} nodes  "
+              f"AST {size / 2**20:6.1f} MiB ({size / nodes:5.1f} B/node)  line of last statement {ast.body[-1].lineno}")
+
+    growth = per_statement[-1] / per_statement[0]
+    print(f"time per statement x{growth:4.2f} from {args.sizes[0]} to {args.sizes[-1]} statements")
+    if growth > MAX_GROWTH:
+        raise SystemExit("superlinear parse time")
+
+if __name__ == '__main__':
+    main()
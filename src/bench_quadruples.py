@@ -0,0 +1,79 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark de representaciones de cuadruplos - memoria y recorrido de
+#objetos con __dict__ (clase original), Quadruple con __slots__ y QuadrupleArray (struct-of-arrays)
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from parse import Parser
+from codegen import CodeGen, Quadruple, QuadrupleArray, quadruple_rows
+from interpreter import IR_Interpret
+from symbols import resolve
+from bench_cache import generate
+
+#Clase original de codegen.py, con un __dict__ por instancia
+class DictQuadruple:
+    def __init__(self, operator, arg1, arg2, result):
+        self.operator = operator
+        self.arg1 = arg1
+        self.arg2 = arg2
+        self.result = result
+
+    def __repr__(self):
+        return f"({self.operator}, {self.arg1}, {self.arg2}, {self.result})"
+
+#Bytes asignados al construir la tabla (los operandos ya existen en rows)
+def measure(build, rows):
+    gc.collect()
+    tracemalloc.start()
+    table = build(rows)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return table, size
+
+def compact(rows):
+    table = QuadrupleArray(Quadruple(*row) for row in rows)
+    table.trim()
+    return table
+
+def timed(function, table):
+    start = time.perf_counter()
+    function(table)
+    return time.perf_counter() - start
+
+#Lectura de los cuatro campos de cada cuadruplo
+def attributes(table):
+    for quad in table:
+        quad.operator, quad.arg1, quad.arg2, quad.result
+
+def main():
+    argparser = argparse.ArgumentParser(description="Memoria y recorrido por representación de cuadruplos")
+    argparser.add_argument('-n', type=int, default=20000, help='sentencias en el programa generado')
+    args = argparser.parse_args()
+
+    rows = list(quadruple_rows(CodeGen(Parser().parse(generate(args.n))).generate()))
+    builds = {
+        'dict': lambda rows: [DictQuadruple(*row) for row in rows],
+        'slots': lambda rows: [Quadruple(*row) for row in rows],
+        'soa': compact,
+    }
+    phases = {
+        'fields': attributes,
+        'rows': lambda table: list(quadruple_rows(table)),
+        'pseudo': lambda table: IR_Interpret(table).interpret(),
+        'resolve': resolve,
+    }
+
+    print(f"{len(rows)} quadruples")
+    base = None
+    for name, build in builds.items():
+        table, size = measure(build, rows)
+        base = base or size
+        times = "   ".join(f"{phase} {timed(function, table):6.3f} s" for phase, function in phases.items())
+        print(f"{name:6} {size / 2**20:7.2f} MiB ({base / size:4.1f}x less)   {size / len(rows):6.1f} B/quad   {times}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Suite de benchmarks - programas generados de varios tamaños, tiempo por fase y baselines JSON
+#Cada carga de trabajo genera un programa válido de tamaño n (if-else anidados, aritmética en línea
+#recta, ciclos for/while anidados, arreglos grandes y mucha salida con writeln). Se mide por separado
+#el lexer, el parser, CodeGen.generate, TempAllocator (la reutilización de temporales de -O), el
+#traductor a pseudocódigo (IR_Interpret) y la ejecución.
+#--save guarda los tiempos como baseline JSON; --baseline compara contra uno guardado, imprime la
+#razón actual/baseline de cada medición y falla (código 1) si alguna pasa de --threshold
+
+import argparse
+import gc
+import io
+import json
+import platform
+import time
+
+from parse import Parser
+from codegen import CodeGen
+from regalloc import TempAllocator
+from interpreter import IR_Interpret
+from driver import ENGINES
+from fastlex import LEXERS
+from output import StringOutput
+
+FORMAT_VERSION = 1
+
+PHASES = ('lex', 'parse', 'codegen', 'regalloc', 'ir_print', 'execute')
+
+#Razón actual/baseline a partir de la cual una medición cuenta como regresión
+DEFAULT_THRESHOLD = 1.25
+#Mediciones más cortas que esto (en las dos corridas) son ruido y no cuentan como regresión
+MIN_SECONDS = 0.01
+
+#if-else anidados n niveles dentro de un ciclo corto
+def nested_if(n):
+    lines = ["program main{", "\tint i, x, y;", "\ty = 0;", "\tfor (i = 0; i < 10; i++){", "\tx = i;"]
+    for k in range(n):
+        lines.append(f"\tif (x < {k + 20}) {{ y = y + {k % 7};")
+    for k in range(n):
+        lines.append(f"\t}} else {{ y = y - {k % 5}; }}")
+    lines.extend(["\t}", "\twriteln(y);", "}"])
+    return "\n".join(lines) + "\n"
+
+#n sentencias aritméticas sin saltos; el módulo mantiene los enteros pequeños
+def straight_line(n):
+    lines = ["program main{", "\tint a, b, c;", "\ta = 1;", "\tb = 2;", "\tc = 3;"]
+    names = ('a', 'b', 'c')
+    for k in range(n):
+        target, left, right = names[k % 3], names[(k + 1) % 3], names[(k + 2) % 3]
+        lines.append(f"\t{target} = ({left} * {k % 13 + 1} + {right} - {k % 5}) % 10007;")
+    lines.extend(["\twriteln(a + b + c);", "}"])
+    return "\n".join(lines) + "\n"
+
+#for con un while adentro: n iteraciones del cuerpo en total
+def nested_loops(n):
+    inner = 100
+    outer = max(1, n // inner)
+    return "\n".join([
+        "program main{",
+        "\tint i, j, s;",
+        "\ts = 0;",
+        f"\tfor (i = 0; i < {outer}; i++){{",
+        "\t\tj = 0;",
+        f"\t\twhile (j < {inner}){{",
+        "\t\t\ts = (s + i * j) % 1000003;",
+        "\t\t\tj++;",
+        "\t\t}",
+        "\t}",
+        "\twriteln(s);",
+        "}",
+    ]) + "\n"
+
+#Arreglo de n enteros: se llena y luego se suma
+def arrays(n):
+    return "\n".join([
+        "program main{",
+        "\tint i, s;",
+        f"\tint a[{n}];",
+        "\ts = 0;",
+        f"\tfor (i = 0; i < {n}; i++){{",
+        "\t\ta[i] = i * 2;",
+        "\t}",
+        f"\tfor (i = 0; i < {n}; i++){{",
+        "\t\ts = s + a[i];",
+        "\t}",
+        "\twriteln(s);",
+        "}",
+    ]) + "\n"
+
+#n líneas de salida
+def output(n):
+    return "\n".join([
+        "program main{",
+        "\tint i;",
+        f"\tfor (i = 0; i < {n}; i++){{",
+        "\t\twrite(\"line \");",
+        "\t\twriteln(i);",
+        "\t}",
+        "}",
+    ]) + "\n"
+
+WORKLOADS = {
+    'nested_if': nested_if,
+    'straight_line': straight_line,
+    'nested_loops': nested_loops,
+    'arrays': arrays,
+    'output': output,
+}
+
+#Mejor tiempo de repeat corridas de function(); devuelve también el resultado de la última
+def best_time(function, repeat):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def count_tokens(make_lexer, data):
+    lex_state = make_lexer()
+    lex_state.input(data)
+    return sum(1 for _ in iter(lex_state.token, None))
+
+#CodeGen de un AST; el generador tiene los cuadruplos y el número de temporales
+def generate(ast):
+    generator = CodeGen(ast)
+    generator.generate()
+    return generator
+
+def execute(engine, quadruples):
+    out = StringOutput()
+    ENGINES[engine](output=out).interpret(quadruples)
+    return out.getvalue()
+
+#Tiempos de cada fase para un programa
+def measure(data, parser, lexer, engine, repeat):
+    times = {}
+    times['lex'], tokens = best_time(lambda: count_tokens(LEXERS[lexer], data), repeat)
+    times['parse'], ast = best_time(lambda: parser.parse(data), repeat)
+    times['codegen'], generator = best_time(lambda: generate(ast), repeat)
+    quadruples = generator.quadruples
+    times['regalloc'], _ = best_time(lambda: TempAllocator(quadruples, generator.temp_counter).allocate(), repeat)
+    times['ir_print'], _ = best_time(lambda: IR_Interpret(quadruples).interpret(), repeat)
+    times['execute'], _ = best_time(lambda: execute(engine, quadruples), repeat)
+    return times, tokens, len(quadruples)
+
+#Un programa generado con errores de sintaxis mediría otra cosa
+def check_syntax(parser, name, n, data):
+    diagnostics = io.StringIO()
+    parser.parse(data, diagnostics)
+    if diagnostics.getvalue():
+        raise SystemExit(f"{name} n={n}: generated program has syntax errors: {diagnostics.getvalue().strip()}")
+
+def run(args):
+    parser = Parser(args.lexer)
+    results = {}
+    for name in args.workloads:
+        build = WORKLOADS[name]
+        results[name] = {}
+        for n in args.sizes:
+            data = build(n)
+            check_syntax(parser, name, n, data)
+            times, tokens, quadruples = measure(data, parser, args.lexer, args.engine, args.repeat)
+            results[name][str(n)] = times
+            print(f"{name:13} n={n:<7} {tokens:8} tokens {quadruples:8} quads  "
+                  + "  ".join(f"{phase} {times[phase]:7.4f} s" for phase in PHASES))
+    return {
+        'format': FORMAT_VERSION,
+        'python': platform.python_version(),
+        'engine': args.engine,
+        'lexer': args.lexer,
+        'repeat': args.repeat,
+        'results': results,
+    }
+
+#Razones actual/baseline de las mediciones que están en los dos; devuelve las regresiones
+def compare(current, baseline, threshold):
+    if baseline.get('format') != FORMAT_VERSION:
+        raise SystemExit(f"Unsupported baseline format {baseline.get('format')} (expected {FORMAT_VERSION})")
+    for key in ('engine', 'lexer'):
+        if baseline.get(key) != current[key]:
+            print(f"warning: baseline {key} is {baseline.get(key)!r}, this run uses {current[key]!r}")
+    regressions = []
+    for name, sizes in current['results'].items():
+        for n, times in sizes.items():
+            before = baseline['results'].get(name, {}).get(n)
+            if before is None:
+                continue
+            ratios = []
+            for phase in PHASES:
+                if phase not in before:
+                    continue
+                ratio = times[phase] / max(before[phase], 1e-9)
+                flag = ''
+                if ratio > threshold and max(times[phase], before[phase]) >= MIN_SECONDS:
+                    flag = '!'
+                    regressions.append(f"{name} n={n} {phase} x{ratio:.2f}")
+                ratios.append(f"{phase} x{ratio:5.2f}{flag or ' '}")
+            print(f"{name:13} n={n:<7} " + "  ".join(ratios))
+    return regressions
+
+def main():
+    argparser = argparse.ArgumentParser(description="Tiempo por fase de programas generados y baselines JSON")
+    argparser.add_argument('--workloads', nargs='*', choices=sorted(WORKLOADS), default=list(WORKLOADS))
+    argparser.add_argument('--sizes', type=int, nargs='*', default=[1000, 5000, 25000], help='tamaño n de cada programa')
+    argparser.add_argument('--engine', choices=sorted(ENGINES), default='vm')
+    argparser.add_argument('--lexer', choices=sorted(LEXERS), default='ply')
+    argparser.add_argument('--repeat', type=int, default=3, help='corridas por fase (se toma la mejor)')
+    argparser.add_argument('--save', metavar='FILE', help='guardar los tiempos como baseline JSON')
+    argparser.add_argument('--baseline', metavar='FILE', help='comparar contra un baseline JSON guardado')
+    argparser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                           help='razón actual/baseline que cuenta como regresión')
+    args = argparser.parse_args()
+
+    current = run(args)
+    if args.save:
+        with open(args.save, 'w') as baseline_file:
+            json.dump(current, baseline_file, indent=2)
+            baseline_file.write("\n")
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            raise SystemExit(f"performance regressions: {', '.join(regressions)}")
+
+if __name__ == '__main__':
+    main()
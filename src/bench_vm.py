@@ -0,0 +1,84 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Benchmark de ejecución - SemanticExecuter contra BytecodeVM y JITExecuter en ciclos grandes
+
+import argparse
+import contextlib
+import io
+import time
+
+from parse import run_parse
+from codegen import CodeGen
+from semantic import SemanticExecuter
+from vm import BytecodeVM, assemble
+from jit import JITExecuter, compile_program
+
+#Ciclos al estilo de test_case1/4/6 escalados a n iteraciones
+PROGRAMS = {
+    'for_sum': """program main{
+	int i, n, x;
+	n = %d;
+	x = 0;
+	for (i = 0; i < n; i++) {
+		x = x + i * 2;
+	}
+	writeln(x);
+}""",
+    'while_parity': """program main{
+	int n, x, p;
+	n = %d;
+	x = 1;
+	p = 0;
+	while (n >= 1) {
+		x = x + n;
+		n--;
+		if ((x %% 2) == 0) {
+			p = p + 1;
+		}
+	}
+	writeln(p);
+}""",
+    'writeln_loop': """program main{
+	int i, n;
+	n = %d;
+	for (i = 0; i < n; i++) {
+		writeln(i);
+	}
+}""",
+}
+
+def timed(engine, runner):
+    buf = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(buf):
+        runner(engine)
+    return time.perf_counter() - start, buf.getvalue()
+
+def main():
+    argparser = argparse.ArgumentParser(description="SemanticExecuter contra BytecodeVM y JITExecuter")
+    argparser.add_argument('-n', type=int, default=1_000_000, help='iteraciones por ciclo')
+    args = argparser.parse_args()
+
+    for name, template in PROGRAMS.items():
+        quadruples = CodeGen(run_parse(template % args.n)).generate()
+        bytecode = assemble(quadruples)
+
+        base, expected = timed(SemanticExecuter(), lambda e: e.interpret(quadruples))
+        fast, output = timed(BytecodeVM(), lambda e: e.run(bytecode))
+        if output != expected:
+            raise SystemExit(f"{name}: output mismatch {output!r} != {expected!r}")
+
+        #La primera llamada genera y compila el código; las siguientes lo toman del cache
+        start = time.perf_counter()
+        compile_program(quadruples)
+        compile_time = time.perf_counter() - start
+        jit, output = timed(JITExecuter(), lambda e: e.interpret(quadruples))
+        if output != expected:
+            raise SystemExit(f"{name}: JIT output mismatch {output!r} != {expected!r}")
+
+        print(f"{name:14} n={args.n:<9} SemanticExecuter {base:8.3f} s   "
+              f"BytecodeVM {fast:8.3f} s ({base / fast:5.2f}x)   "
+              f"JITExecuter {jit:8.3f} s ({base / jit:5.2f}x, compile {compile_time * 1000:.1f} ms)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: CompileCache - Cache en disco del front end (AST de run_parse y cuadruplos de CodeGen)
+#La llave es el hash del texto fuente más la versión del compilador (hash de lexer, parser y
+#CodeGen), así que un programa sin cambios se recompila sin lexer, parser ni CodeGen.
+#Las entradas se escriben de forma atómica (archivo temporal + os.replace) y el tamaño total se
+#limita desalojando las menos usadas (LRU por fecha de modificación, que se actualiza en cada acierto).
+#Cada CompileCache lleva la cuenta del tamaño desde el último recorrido del directorio y solo lo
+#vuelve a recorrer cuando esa cuenta pasa del límite o cada EVICT_INTERVAL escrituras (para ver lo
+#que escriben otros procesos), no en cada put
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+import ply
+
+from codegen import Quadruple
+from parse import cache_dir
+
+#Tamaño máximo del cache en disco
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+#Al desalojar se baja hasta esta fracción del máximo, para que las siguientes escrituras no vuelvan
+#a pasar del límite de inmediato
+EVICT_TARGET = 0.9
+
+#Escrituras entre recorridos completos del directorio
+EVICT_INTERVAL = 64
+
+#Módulos del front end: cualquier cambio en ellos invalida todas las entradas
+_FRONT_END = ('lexer.py', 'parse.py', 'astnodes.py', 'codegen.py')
+
+_version = None
+
+def compiler_version():
+    global _version
+    if _version is None:
+        digest = hashlib.sha256()
+        digest.update(f"ply-{ply.__version__} py-{sys.version_info[0]}.{sys.version_info[1]}".encode())
+        here = os.path.dirname(os.path.abspath(__file__))
+        for name in _FRONT_END:
+            with open(os.path.join(here, name), 'rb') as source:
+                digest.update(source.read())
+        _version = digest.hexdigest()[:16]
+    return _version
+
+#Resultado del front end para un texto fuente.
+#El AST del cache viene serializado (bytes) y se decodifica solo si se usa, p. ej. para imprimirlo
+class FrontEnd:
+    def __init__(self, ast, quadruples, temp_count):
+        self._ast = ast
+        self.quadruples = quadruples
+        self.temp_count = temp_count
+
+    @property
+    def ast(self):
+        if isinstance(self._ast, bytes):
+            self._ast = pickle.loads(self._ast)
+        return self._ast
+
+class CompileCache:
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or cache_dir('compile', compiler_version())
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        #Tamaño del directorio según el último recorrido más lo escrito desde entonces (None: sin recorrer)
+        self._tracked = None
+        self._stores = 0
+
+    def key(self, source):
+        digest = hashlib.sha256(compiler_version().encode())
+        digest.update(b'\0')
+        digest.update(source.encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.pickle")
+
+    #Entrada del cache o None; una entrada ilegible se borra y cuenta como fallo
+    def get(self, source):
+        path = self._path(self.key(source))
+        try:
+            with open(path, 'rb') as entry:
+                ast, quadruples, temp_count = pickle.load(entry)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+            self.misses += 1
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return FrontEnd(ast, [Quadruple(*quad) for quad in quadruples], temp_count)
+
+    def put(self, source, ast, quadruples, temp_count):
+        path = self._path(self.key(source))
+        #pickle es recursivo: un AST con expresiones demasiado profundas no se guarda
+        try:
+            ast = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            return
+        data = pickle.dumps((ast, [(quad.operator, quad.arg1, quad.arg2, quad.result, quad.lineno)
+                                   for quad in quadruples],
+                             temp_count), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmpfile = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        except OSError:
+            #Sin cache en disco (directorio de solo lectura, etc.): se compila normalmente
+            return
+        try:
+            with os.fdopen(fd, 'wb') as entry:
+                entry.write(data)
+            os.replace(tmpfile, path)
+        except OSError:
+            self._remove(tmpfile)
+            return
+        self._stores += 1
+        if self._tracked is not None and self._stores < EVICT_INTERVAL:
+            self._tracked += len(data)
+            if self._tracked <= self.max_bytes:
+                return
+        self.evict()
+
+    #Si el directorio pasa de max_bytes borra las entradas menos usadas hasta EVICT_TARGET del máximo.
+    #Otros procesos pueden estar borrando al mismo tiempo: un archivo que ya no existe se ignora
+    def evict(self):
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.pickle'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+        if total > self.max_bytes:
+            target = self.max_bytes * EVICT_TARGET
+            entries.sort()
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                self._remove(path)
+                total -= size
+        self._tracked = total
+        self._stores = 0
+
+    def clear(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                self._remove(os.path.join(root, name))
+        self._tracked = None
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
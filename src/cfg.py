@@ -0,0 +1,383 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: CFG - Grafo de flujo de control en bloques básicos sobre los cuadruplos de CodeGen
+#Predecesores/sucesores, dominadores, un resolvedor genérico de flujo de datos (worklist)
+#con vivacidad y definiciones alcanzantes, y re-linealización a una tabla de cuadruplos
+
+import functools
+import heapq
+
+from codegen import Quadruple
+from symbols import WRITES_RESULT, JUMPS, LOOP_KERNEL
+
+#Bloque virtual de salida: saltos a un índice >= len(cuadruplos)
+EXIT = -1
+
+#Sucesores de un cuadruplo dentro de una tabla de tamaño size
+def successors(quad, index, size):
+    if quad.operator == 'goto':
+        targets = [quad.result]
+    elif quad.operator in ('gototrue', 'gotofalse'):
+        targets = [index + 1, quad.result]
+    else:
+        targets = [index + 1]
+    return [target for target in targets if target < size]
+
+#Operandos leídos y escritos por un cuadruplo
+def reads(quad):
+    op = quad.operator
+    if op in JUMPS:
+        return (quad.arg1,)
+    if op == 'declare_array':
+        return (quad.result,)
+    if op == LOOP_KERNEL:
+        return quad.arg1.reads()
+    if op in WRITES_RESULT:
+        return (quad.arg1, quad.arg2)
+    return (quad.arg1, quad.arg2, quad.result)
+
+def writes(quad):
+    if quad.operator in WRITES_RESULT:
+        return (quad.result,)
+    if quad.operator == 'declare_array':
+        return (quad.arg2,)
+    if quad.operator == LOOP_KERNEL:
+        return quad.arg1.writes() + (quad.result,)
+    return ()
+
+#Índices de los bits encendidos de un bitset
+def bits(value):
+    while value:
+        low = value & -value
+        yield low.bit_length() - 1
+        value ^= low
+
+class BasicBlock:
+    def __init__(self, index, start, quads):
+        self.index = index
+        self.start = start          #posición del primer cuadruplo en la tabla original
+        self.quads = quads          #el salto final (si hay) se re-numera al linealizar
+        self.target = None          #bloque destino del salto final
+        self.fallthrough = None     #bloque siguiente si no se salta
+        self.succs = []
+        self.preds = []
+
+    @property
+    def terminator(self):
+        if self.quads and self.quads[-1].operator in JUMPS:
+            return self.quads[-1]
+        return None
+
+    def __repr__(self):
+        return f"B{self.index}[{self.start}:{self.start + len(self.quads)}] -> {self.succs}"
+
+class CFG:
+    def __init__(self, quadruples):
+        size = len(quadruples)
+        leaders = {0} if size else set()
+        for i, quad in enumerate(quadruples):
+            if quad.operator in JUMPS:
+                if quad.result < size:
+                    leaders.add(quad.result)
+                if i + 1 < size:
+                    leaders.add(i + 1)
+        starts = sorted(leaders)
+
+        self.blocks = []
+        block_at = {}
+        for n, start in enumerate(starts):
+            end = starts[n + 1] if n + 1 < len(starts) else size
+            block_at[start] = n
+            self.blocks.append(BasicBlock(n, start, list(quadruples[start:end])))
+
+        for block in self.blocks:
+            end = block.start + len(block.quads)
+            last = block.terminator
+            if last is not None:
+                block.target = block_at.get(last.result, EXIT) if last.result < size else EXIT
+            if last is None or last.operator != 'goto':
+                block.fallthrough = block_at.get(end, EXIT)
+            for succ in (block.fallthrough, block.target):
+                if succ is not None and succ != EXIT and succ not in block.succs:
+                    block.succs.append(succ)
+        for block in self.blocks:
+            for succ in block.succs:
+                self.blocks[succ].preds.append(block.index)
+
+        self._rpo = None
+        self._idom = None
+
+    def __len__(self):
+        return len(self.blocks)
+
+    #Recorrido en postorden inverso desde la entrada (iterativo, sin recursión)
+    def reverse_postorder(self):
+        if self._rpo is None:
+            order = []
+            if self.blocks:
+                visited = {0}
+                stack = [(0, iter(self.blocks[0].succs))]
+                while stack:
+                    index, children = stack[-1]
+                    for succ in children:
+                        if succ not in visited:
+                            visited.add(succ)
+                            stack.append((succ, iter(self.blocks[succ].succs)))
+                            break
+                    else:
+                        stack.pop()
+                        order.append(index)
+            order.reverse()
+            self._rpo = order
+        return self._rpo
+
+    def reachable(self):
+        return set(self.reverse_postorder())
+
+    #Dominadores inmediatos (Cooper, Harvey y Kennedy); None para bloques inalcanzables
+    def immediate_dominators(self):
+        if self._idom is None:
+            rpo = self.reverse_postorder()
+            number = {block: n for n, block in enumerate(rpo)}
+            idom = [None] * len(self.blocks)
+            if rpo:
+                idom[rpo[0]] = rpo[0]
+            changed = True
+            while changed:
+                changed = False
+                for block in rpo[1:]:
+                    new_idom = None
+                    for pred in self.blocks[block].preds:
+                        if idom[pred] is None:
+                            continue
+                        if new_idom is None:
+                            new_idom = pred
+                            continue
+                        a, b = pred, new_idom
+                        while a != b:
+                            while number[a] > number[b]:
+                                a = idom[a]
+                            while number[b] > number[a]:
+                                b = idom[b]
+                        new_idom = a
+                    if idom[block] != new_idom:
+                        idom[block] = new_idom
+                        changed = True
+            self._idom = idom
+        return self._idom
+
+    def dominates(self, a, b):
+        idom = self.immediate_dominators()
+        if idom[b] is None:
+            return False
+        while b != a:
+            if idom[b] == b:
+                return False
+            b = idom[b]
+        return True
+
+    #Resolvedor genérico de flujo de datos
+    #transfer(block, value) -> value; meet(a, b) -> value; los valores deben compararse con ==
+    def solve(self, transfer, direction='forward', meet=lambda a, b: a | b, init=0, boundary=0):
+        count = len(self.blocks)
+        before = [init] * count
+        after = [init] * count
+        forward = direction == 'forward'
+        order = self.reverse_postorder()
+        if not forward:
+            order = order[::-1]
+        listed = set(order)
+        order = order + [b for b in range(count) if b not in listed]
+        rank = [0] * count
+        for n, index in enumerate(order):
+            rank[index] = n
+
+        #Worklist en barridos por el orden (postorden inverso o su reverso): cada barrido es un heap
+        #de posiciones y solo se agregan los vecinos cuya entrada cambió. Un vecino que queda más
+        #adelante entra al barrido actual y uno que queda atrás (arista de regreso) al siguiente, así
+        #todos los ciclos se cierran en el mismo barrido en lugar de repropagar el resto del programa
+        #por cada uno; converge en pocos barridos (la profundidad de anidamiento de los ciclos)
+        pending = [True] * count
+        current = list(range(count))
+        upcoming = []
+        while current:
+            position = heapq.heappop(current)
+            index = order[position]
+            pending[index] = False
+            block = self.blocks[index]
+            #init es la identidad de meet: solo se usa si no hay de dónde combinar
+            if forward:
+                sources = [after[pred] for pred in block.preds]
+                if index == 0:
+                    sources.append(boundary)
+            else:
+                sources = [before[succ] for succ in block.succs]
+                if EXIT in (block.fallthrough, block.target) or not block.succs:
+                    sources.append(boundary)
+            value = functools.reduce(meet, sources) if sources else init
+            result = transfer(block, value)
+
+            if forward:
+                before[index] = value
+                if result != after[index]:
+                    after[index] = result
+                    changed = block.succs
+                else:
+                    changed = ()
+            else:
+                after[index] = value
+                if result != before[index]:
+                    before[index] = result
+                    changed = block.preds
+                else:
+                    changed = ()
+            for other in changed:
+                if not pending[other]:
+                    pending[other] = True
+                    heapq.heappush(current if rank[other] > position else upcoming, rank[other])
+            if not current:
+                current, upcoming = upcoming, []
+
+        #Para análisis hacia atrás before = entrada del bloque (in), after = salida (out)
+        return before, after
+
+    #Nombres que algún bloque lee antes de escribirlos (en orden de aparición). Son los únicos que
+    #pueden llevar un valor de un bloque a otro; los demás (p. ej. los temporales de una expresión)
+    #se escriben y se leen dentro del mismo bloque
+    def exposed_names(self):
+        exposed = {}
+        for block in self.blocks:
+            written = set()
+            for quad in block.quads:
+                for name in reads(quad):
+                    if isinstance(name, str) and name not in written:
+                        exposed[name] = None
+                written.update(writes(quad))
+        return exposed
+
+    #Vivacidad por bloque sobre un universo de nombres (por omisión, todas las variables escritas).
+    #Solo los nombres de exposed_names pueden estar vivos entre bloques: van primero en el universo
+    #y las definiciones de los demás no entran en los bitsets, así el tamaño de los conjuntos depende
+    #de lo que cruza bloques y no del total de nombres
+    def liveness(self, names=None):
+        if names is None:
+            names = []
+            for block in self.blocks:
+                for quad in block.quads:
+                    names.extend(writes(quad))
+        names = dict.fromkeys(names)
+        exposed = self.exposed_names()
+        crossing = [name for name in names if name in exposed]
+        universe = {name: n for n, name in enumerate(crossing + [name for name in names if name not in exposed])}
+        tracked = len(crossing)
+
+        use = [0] * len(self.blocks)
+        define = [0] * len(self.blocks)
+        for block in self.blocks:
+            for quad in reversed(block.quads):
+                for name in writes(quad):
+                    if universe.get(name, tracked) < tracked:
+                        define[block.index] |= 1 << universe[name]
+                        use[block.index] &= ~(1 << universe[name])
+                for name in reads(quad):
+                    if isinstance(name, str) and universe.get(name, tracked) < tracked:
+                        use[block.index] |= 1 << universe[name]
+
+        live_in, live_out = self.solve(lambda block, out: use[block.index] | (out & ~define[block.index]),
+                                       direction='backward')
+        return universe, live_in, live_out
+
+    #Vivacidad a la salida de cada cuadruplo de un bloque, a partir de la salida del bloque
+    def instruction_liveness(self, block, live_out, universe):
+        result = [0] * len(block.quads)
+        live = live_out
+        for n in range(len(block.quads) - 1, -1, -1):
+            result[n] = live
+            quad = block.quads[n]
+            for name in writes(quad):
+                if name in universe:
+                    live &= ~(1 << universe[name])
+            for name in reads(quad):
+                if isinstance(name, str) and name in universe:
+                    live |= 1 << universe[name]
+        return result
+
+    #Definiciones alcanzantes: cada definición es (bloque, posición en el bloque, nombre) y el
+    #conjunto que alcanza un bloque es un diccionario nombre -> frozenset de índices en esa lista.
+    #Solo se siguen las definiciones de exposed_names, las únicas que pueden alcanzar un uso en otro
+    #bloque. gen (última definición de cada nombre del bloque) y kill (los nombres que define) son
+    #por bloque: una transferencia reemplaza solo esos nombres y comparte los demás conjuntos con la
+    #entrada, así el trabajo es proporcional a lo que alcanza cada bloque y no al total de
+    #definiciones del programa, como pasaría con un bitset sobre todas ellas
+    def reaching_definitions(self):
+        exposed = self.exposed_names()
+        definitions = []
+        gen = [None] * len(self.blocks)
+        for block in self.blocks:
+            last = {}
+            for n, quad in enumerate(block.quads):
+                for name in writes(quad):
+                    if name in exposed:
+                        last[name] = frozenset((len(definitions),))
+                        definitions.append((block.index, n, name))
+            gen[block.index] = last
+
+        def transfer(block, value):
+            generated = gen[block.index]
+            if not generated:
+                return value
+            result = dict(value)
+            result.update(generated)
+            return result
+
+        #Unión por nombre; un conjunto que llega igual (el mismo objeto) por los dos lados no se copia
+        def meet(a, b):
+            if a is b or not b:
+                return a
+            if not a:
+                return b
+            merged = dict(a)
+            for name, defs in b.items():
+                mine = merged.get(name)
+                if mine is None:
+                    merged[name] = defs
+                elif mine is not defs:
+                    merged[name] = mine | defs
+            return merged
+
+        reach_in, reach_out = self.solve(transfer, direction='forward', meet=meet, init={}, boundary={})
+        return definitions, reach_in, reach_out
+
+    #Tabla de cuadruplos a partir de los bloques en el orden dado (por omisión, el original).
+    #Los saltos se re-numeran y se agrega un goto donde la caída ya no llega al bloque siguiente
+    def linearize(self, order=None):
+        if order is None:
+            order = [block.index for block in self.blocks]
+
+        next_in_order = {}
+        for n, index in enumerate(order):
+            next_in_order[index] = order[n + 1] if n + 1 < len(order) else EXIT
+
+        start = {}
+        position = 0
+        for index in order:
+            block = self.blocks[index]
+            start[index] = position
+            position += len(block.quads)
+            if block.fallthrough is not None and block.fallthrough != next_in_order[index]:
+                position += 1
+        end = position
+
+        def target_of(block_index):
+            return end if block_index == EXIT else start[block_index]
+
+        result = []
+        for index in order:
+            block = self.blocks[index]
+            for quad in block.quads:
+                if quad is block.terminator:
+                    quad = Quadruple(quad.operator, quad.arg1, quad.arg2, target_of(block.target), quad.lineno)
+                result.append(quad)
+            if block.fallthrough is not None and block.fallthrough != next_in_order[index]:
+                result.append(Quadruple('goto', None, None, target_of(block.fallthrough), block.quads[-1].lineno))
+        return result
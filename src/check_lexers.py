@@ -0,0 +1,91 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Prueba diferencial - FastLexer contra el lexer de PLY
+#Compara tipo, valor, línea y posición de cada token y los mensajes de caracteres ilegales en los
+#programas de prueba, en los archivos dados y en textos aleatorios; también compara el AST del parser.
+#Termina con código 1 si hay alguna diferencia
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import random
+
+from lexer import make_lexer
+from fastlex import FastLexer
+from parse import Parser
+
+#Fragmentos para textos aleatorios: tokens válidos, casos límite de comentarios, cadenas y números
+FRAGMENTS = [
+    'program', 'int', 'truex', 'true', 'false', 'x', "a'b", '_y1', '12', '3.5f', '2.0d', '.5E +1', '7L', '0',
+    '"s"', '"a\\"b"', '"\n"', '"', "'c'", "''", "'", '//', '// c\n', '/*', '*/', '/* c */', '/*/', '*', '/',
+    '+', '++', '+=', '-', '--', '-=', '->', '<', '<=', '>', '>=', '=', '==', '!', '!=', '&&', '||', '&', '|',
+    '(', ')', '{', '}', '[', ']', ',', ';', ':', '.', '%', ' ', '\t', '\x0c', '\n', '\n\n', '@', '#', '\\', 'ñ',
+]
+
+def ply_tokens(text):
+    lex_state = make_lexer()
+    lex_state.input(text)
+    return list(iter(lex_state.token, None))
+
+def fast_tokens(text):
+    lex_state = FastLexer()
+    lex_state.input(text)
+    return list(iter(lex_state.token, None))
+
+#Tokens como tuplas y lo que se imprimió durante el análisis
+def run(function, text):
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        tokens = [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in function(text)]
+    return tokens, printed.getvalue()
+
+def parse(parser, text):
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        try:
+            result = parser.parse(text)
+        except Exception as exc:
+            result = f"{type(exc).__name__}: {exc}"
+    return result, printed.getvalue()
+
+def main():
+    argparser = argparse.ArgumentParser(description="FastLexer contra PLY lex")
+    argparser.add_argument('files', nargs='*', help='archivos fuente adicionales')
+    argparser.add_argument('-n', type=int, default=20000, help='textos aleatorios')
+    argparser.add_argument('--seed', type=int, default=0)
+    args = argparser.parse_args()
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    paths = sorted(glob.glob(os.path.join(here, '..', 'test', '*.txt'))) + args.files
+    programs = {}
+    for path in paths:
+        with open(path) as source:
+            programs[path] = source.read()
+    rng = random.Random(args.seed)
+    texts = list(programs.values())
+    texts += [''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 40))) for _ in range(args.n)]
+
+    mismatches = 0
+    for text in texts:
+        expected = run(ply_tokens, text)
+        actual = run(fast_tokens, text)
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"token mismatch for {text!r}:\n  ply:  {expected}\n  fast: {actual}")
+
+    ply_parser = Parser('ply')
+    fast_parser = Parser('fast')
+    for path, text in programs.items():
+        if parse(fast_parser, text) != parse(ply_parser, text):
+            mismatches += 1
+            print(f"parse mismatch for {path}")
+
+    print(f"{len(texts)} texts, {len(programs)} programs parsed, {mismatches} mismatches")
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
@@ -2,24 +2,230 @@
 # Fecha: 20/05/2024
 # Descripción: Codegen - Generador de cuadruplos/codigo intermedio a partir de AST proveniente del parser
 
+from array import array
+from types import GeneratorType
+
+from astnodes import ArrayAccess, Factor, Statement, from_tuple
+
 #Declaracion de estructura de cuadruplos
+#lineno es la línea del código fuente que generó el cuadruplo (0 si no se conoce, p. ej. IR precompilado)
 class Quadruple:
-    def __init__(self, operator, arg1, arg2, result):
+    __slots__ = ('operator', 'arg1', 'arg2', 'result', 'lineno')
+
+    def __init__(self, operator, arg1, arg2, result, lineno=0):
         self.operator = operator
         self.arg1 = arg1
         self.arg2 = arg2
         self.result = result
+        self.lineno = lineno
+
+    def __repr__(self):
+        return f"({self.operator}, {self.arg1}, {self.arg2}, {self.result})"
+
+#Llave de un operando en el pool: distingue 1, 1.0 y True, y también 0.0 de -0.0.
+#Los nombres (str, la mayoría de los operandos) son su propia llave
+def _operand_key(value):
+    if value.__class__ is str:
+        return value
+    if value.__class__ is float:
+        return (float, value.hex())
+    return (value.__class__, value)
+
+#Tabla compacta de cuadruplos (struct-of-arrays): opcodes e índices de operandos en arreglos
+#paralelos de enteros sin signo, con los operandos distintos guardados una sola vez en un pool.
+#Se usa igual que una lista de Quadruple: indexar o iterar devuelve vistas QuadrupleView
+class QuadrupleArray:
+    def __init__(self, quadruples=()):
+        self.operators = []
+        self.operands = []
+        self._operator_index = {}
+        self._operand_index = {}
+        self._op = array('I')
+        self._arg1 = array('I')
+        self._arg2 = array('I')
+        self._result = array('I')
+        self._lineno = array('I')
+        for quad in quadruples:
+            self.append(quad)
+
+    #Libera los diccionarios de búsqueda (la mayor parte de la memoria cuando casi todos los
+    #operandos son temporales distintos); se reconstruyen si se vuelve a modificar la tabla
+    def trim(self):
+        self._operator_index = None
+        self._operand_index = None
+
+    def _operator(self, operator):
+        if self._operator_index is None:
+            self._operator_index = {value: index for index, value in enumerate(self.operators)}
+        index = self._operator_index.get(operator)
+        if index is None:
+            index = self._operator_index[operator] = len(self.operators)
+            self.operators.append(operator)
+        return index
+
+    def _operand(self, value):
+        if self._operand_index is None:
+            self._operand_index = {_operand_key(value): index for index, value in enumerate(self.operands)}
+        key = _operand_key(value)
+        index = self._operand_index.get(key)
+        if index is None:
+            index = self._operand_index[key] = len(self.operands)
+            self.operands.append(value)
+        return index
+
+    def append(self, quad):
+        self._op.append(self._operator(quad.operator))
+        self._arg1.append(self._operand(quad.arg1))
+        self._arg2.append(self._operand(quad.arg2))
+        self._result.append(self._operand(quad.result))
+        self._lineno.append(quad.lineno)
+
+    def __len__(self):
+        return len(self._op)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._op)))]
+        if index < 0:
+            index += len(self._op)
+        if not 0 <= index < len(self._op):
+            raise IndexError("quadruple index out of range")
+        return QuadrupleView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self._op)):
+            yield QuadrupleView(self, index)
+
+    #Recorrido rápido sin vistas: tuplas (operator, arg1, arg2, result)
+    def rows(self):
+        operators = self.operators
+        operands = self.operands
+        for op, arg1, arg2, result in zip(self._op, self._arg1, self._arg2, self._result):
+            yield operators[op], operands[arg1], operands[arg2], operands[result]
+
+    #Línea fuente de cada cuadruplo
+    def lines(self):
+        return list(self._lineno)
+
+    #Cuadruplos independientes, para los pasos que construyen tablas nuevas
+    def to_list(self):
+        return [Quadruple(*row, lineno) for row, lineno in zip(self.rows(), self._lineno)]
+
+    def __repr__(self):
+        return f"QuadrupleArray({len(self)} quadruples)"
+
+#Vista de un cuadruplo dentro de una QuadrupleArray; se lee y modifica igual que Quadruple
+class QuadrupleView:
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    @property
+    def operator(self):
+        return self._table.operators[self._table._op[self._index]]
+
+    @operator.setter
+    def operator(self, value):
+        self._table._op[self._index] = self._table._operator(value)
+
+    @property
+    def arg1(self):
+        return self._table.operands[self._table._arg1[self._index]]
+
+    @arg1.setter
+    def arg1(self, value):
+        self._table._arg1[self._index] = self._table._operand(value)
+
+    @property
+    def arg2(self):
+        return self._table.operands[self._table._arg2[self._index]]
+
+    @arg2.setter
+    def arg2(self, value):
+        self._table._arg2[self._index] = self._table._operand(value)
+
+    @property
+    def result(self):
+        return self._table.operands[self._table._result[self._index]]
+
+    @result.setter
+    def result(self, value):
+        self._table._result[self._index] = self._table._operand(value)
+
+    @property
+    def lineno(self):
+        return self._table._lineno[self._index]
+
+    @lineno.setter
+    def lineno(self, value):
+        self._table._lineno[self._index] = value
 
     def __repr__(self):
         return f"({self.operator}, {self.arg1}, {self.arg2}, {self.result})"
 
+#Tuplas (operator, arg1, arg2, result) de cualquier tabla de cuadruplos. Las tablas por columnas
+#(QuadrupleArray, irfile.IRProgram) tienen rows() y las dan sin crear objetos Quadruple
+def quadruple_rows(quadruples):
+    rows = getattr(quadruples, 'rows', None)
+    if rows is not None:
+        return rows()
+    return ((quad.operator, quad.arg1, quad.arg2, quad.result) for quad in quadruples)
+
+#Línea fuente de cada cuadruplo de cualquier tabla (0 donde no se conoce)
+def quadruple_lines(quadruples):
+    lines = getattr(quadruples, 'lines', None)
+    if lines is not None:
+        return lines()
+    return [quad.lineno for quad in quadruples]
+
+#Operador de cuadruplo de cada operación binaria del AST
+BINARY_OPERATORS = {
+    'plus': '+', 'minus': '-', 'mult': '*', 'divide': '/', 'mod': '%',
+    'lt': '<', 'gt': '>', 'le': '<=', 'ge': '>=', 'ne': '!=', 'booleq': '==',
+    'and': '&&', 'or': '||',
+}
+
+#Operando de un factor que no necesita cuadruplos (constante o variable); _PENDING si hay que procesarlo
+_PENDING = object()
+
+def _leaf_operand(node):
+    if node.__class__ is Factor and node.value.__class__ is not ArrayAccess:
+        return node.value
+    return _PENDING
+
 #Generación de cuadruplos
+#Con compact=True los cuadruplos se guardan en una QuadrupleArray en vez de una lista
 class CodeGen:
-    def __init__(self, ast):
-        self.ast = ast
-        self.quadruples = []
+    def __init__(self, ast, compact=False):
+        #También acepta el AST en tuplas del formato anterior
+        self.ast = from_tuple(ast) if isinstance(ast, tuple) else ast
+        self.quadruples = QuadrupleArray() if compact else []
         self.symbol_table = {}
         self.temp_counter = 0
+        #Línea del nodo que se está procesando; se copia a cada cuadruplo generado
+        self.lineno = 0
+        #Tabla de despacho por tipo de nodo. Cada método devuelve el operando del nodo, o un generador
+        #si antes necesita los operandos de sus hijos: cada "yield hijo" se los pide al ciclo de
+        #_process_node y los recibe de vuelta
+        self._handlers = {
+            'programstart': self._process_program,
+            'write': self._process_write,
+            'writeln': self._process_write,
+            'assignment': self._process_assign,
+            'array_assignment': self._process_array_assignment,
+            'array_access': self._process_array_access,
+            'if-else': self._process_if_else,
+            'while': self._process_while,
+            'for': self._process_for,
+            'array_declaration': self._process_array_declaration,
+            'increment': self._process_increment,
+            'decrement': self._process_decrement,
+            'declaration': self._process_declaration_node,
+        }
+        for kind in BINARY_OPERATORS:
+            self._handlers[kind] = self._process_binary
 
     def temp_gen(self):
         temp = f"T{self.temp_counter}"
@@ -28,249 +234,197 @@ class CodeGen:
 
     def generate(self):
         self._process_node(self.ast)
+        if isinstance(self.quadruples, QuadrupleArray):
+            self.quadruples.trim()
         return self.quadruples
     
-    #nodos para producir cuadruplos, nodos con indice representan los saltos condicionales y no condicionales
+    #nodos para producir cuadruplos, nodos con indice representan los saltos condicionales y no condicionales.
+    #Recorrido iterativo con una pila explícita de generadores (sin límite de recursión para expresiones
+    #profundas como a + b + c + ...). Los tipos de nodo sin método (if sin else, break, return, arrow)
+    #no generan cuadruplos. lines guarda la línea de cada generador de la pila para restaurarla
+    #cuando se reanuda (p. ej. el goto final de un while lleva la línea del while, no la del cuerpo)
     def _process_node(self, node):
-        if not node:
-            return None
-        nodetype = node[0]
-
-        if nodetype == 'programstart':
-            for stmt in node[2]:
-                self._process_node(stmt)
-
-        elif nodetype == 'statement':
-            self._process_node(node[1])
-
-        #Metodos para imprimir
-        elif nodetype == 'write':
-            value = self._process_node(node[1])
-            self.quadruples.append(Quadruple('write', value, None, None))
-
-        elif nodetype == 'writeln':
-            value = self._process_node(node[1])
-            self.quadruples.append(Quadruple('writeln', value, None, None))
-
-        #Asignacion (=) en cuadruplos
-        elif nodetype == 'assignment':
-            target = node[1]
-            value = self._process_node(node[3])
-            self.quadruples.append(Quadruple('=', value, None, target))
-
-        #Metodos para declaracion, asignación y acceso de arreglos
-        elif nodetype == 'array_declaration':
-            datatype = node[1][1]
-            array_name = node[2]
-            array_size = node[3]
-            self.symbol_table[array_name] = {'type': datatype, 'size': array_size}
-            self.quadruples.append(Quadruple('declare_array', datatype, array_name, array_size))
-
-        elif nodetype == 'array_assignment':
-            array_name = node[1]
-            index = self._process_node(node[2])
-            value = self._process_node(node[3])
-            self.quadruples.append(Quadruple('array_assign', array_name, index, value))
-
-        elif nodetype == 'array_access':
-            array_name = node[1]
-            index = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('array_access', array_name, index, temp))
-            return temp
-
-        #Acomodo de saltos en condicional if-else
-        elif nodetype == 'if-else':
-            condition = self._process_node(node[1])
-            temp_condition = self.temp_gen()
-            self.quadruples.append(Quadruple('=', condition, None, temp_condition))
-            false_jump = len(self.quadruples)
-            self.quadruples.append(Quadruple('gotofalse', temp_condition, None, None))
-
-            for stmt in node[2]:
-                self._process_node(stmt)
-            end_jump = len(self.quadruples)
-            self.quadruples.append(Quadruple('goto', None, None, None))
-
-            self.quadruples[false_jump].result = len(self.quadruples)
-
-            for stmt in node[3]:
-                self._process_node(stmt)
-
-            self.quadruples[end_jump].result = len(self.quadruples)
-
-        #Acomodo de saltos en ciclo while
-        elif nodetype == 'while':
-            start_jump = len(self.quadruples)
-            condition = node[1]
-            body = node[2]
-
-            condition_result = self._process_node(condition)
-            temp_condition = self.temp_gen()
-            self.quadruples.append(Quadruple('=', condition_result, None, temp_condition))
-            false_jump = len(self.quadruples)
-            self.quadruples.append(Quadruple('gotofalse', temp_condition, None, None))
-
-            for stmt in body:
-                self._process_node(stmt)
-
-            self.quadruples.append(Quadruple('goto', None, None, start_jump))
-            self.quadruples[false_jump].result = len(self.quadruples)
-
-        #Acomodo de saltos en ciclo for 
-        elif nodetype == 'for':
-            self._process_node(node[1])  # init 
-            start_jump = len(self.quadruples)
-            condition = self._process_node(node[2])  # condicional
-            temp_condition = self.temp_gen()
-            self.quadruples.append(Quadruple('=', condition, None, temp_condition))
-            false_jump = len(self.quadruples)
-            self.quadruples.append(Quadruple('gotofalse', temp_condition, None, None))
-            self.quadruples.append(Quadruple('gototrue', temp_condition, None, None))
-            true_jump = len(self.quadruples)-1
-            increment_jump = len(self.quadruples)
-            self._process_node(node[3])  # incremento
-            self.quadruples.append(Quadruple('goto', None, None, start_jump))
-            self.quadruples[true_jump].result = len(self.quadruples)
-            for stmt in node[4]:  # body
-                self._process_node(stmt)
-
-
-            self.quadruples.append(Quadruple('goto', None, None, increment_jump))
-            self.quadruples[false_jump].result = len(self.quadruples)
-
-        #Acomodo de operadores
-        elif nodetype == 'plus':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('+', left, right, temp))
-            return temp
-
-        elif nodetype == 'minus':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('-', left, right, temp))
-            return temp
-
-        elif nodetype == 'mult':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('*', left, right, temp))
-            return temp
-
-        elif nodetype == 'divide':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('/', left, right, temp))
-            return temp
-
-        elif nodetype == 'mod':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('%', left, right, temp))
-            return temp
-
-        elif nodetype == 'lt':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('<', left, right, temp))
-            return temp
-
-        elif nodetype == 'gt':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('>', left, right, temp))
-            return temp
-
-        elif nodetype == 'le':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('<=', left, right, temp))
-            return temp
-
-        elif nodetype == 'ge':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('>=', left, right, temp))
-            return temp
-
-        elif nodetype == 'ne':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('!=', left, right, temp))
-            return temp
-
-        elif nodetype == 'booleq':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('==', left, right, temp))
-            return temp
-
-        elif nodetype == 'and':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
-            temp = self.temp_gen()
-            self.quadruples.append(Quadruple('&&', left, right, temp))
-            return temp
+        handlers = self._handlers
+        stack = []
+        lines = []
+        while True:
+            #statement y factor solo envuelven a su hijo: se procesan sin entrar a la pila
+            while node.__class__ is Statement:
+                node = node.node
+            value = None
+            if node.__class__ is Factor:
+                if node.value.__class__ is ArrayAccess:
+                    node = node.value
+                else:
+                    value = node.value
+                    node = None
+
+            if node is not None and node.kind in handlers:
+                if node.lineno:
+                    self.lineno = node.lineno
+                value = handlers[node.kind](node)
+                if value.__class__ is GeneratorType:
+                    stack.append(value)
+                    lines.append(self.lineno)
+                    value = None
+
+            #Continuar el generador de arriba con el valor del hijo hasta que pida otro hijo
+            while stack:
+                self.lineno = lines[-1]
+                try:
+                    node = stack[-1].send(value)
+                    break
+                except StopIteration as done:
+                    stack.pop()
+                    lines.pop()
+                    value = done.value
+            else:
+                return value
+
+    def _process_program(self, node):
+        for stmt in node.body:
+            yield stmt
+
+    #Metodos para imprimir (write y writeln)
+    def _process_write(self, node):
+        value = _leaf_operand(node.value)
+        if value is _PENDING:
+            value = yield node.value
+        self.quadruples.append(Quadruple(node.kind, value, None, None, self.lineno))
+
+    #Asignacion (=) en cuadruplos
+    def _process_assign(self, node):
+        value = _leaf_operand(node.value)
+        if value is _PENDING:
+            value = yield node.value
+        self.quadruples.append(Quadruple('=', value, None, node.target, self.lineno))
+
+    #Metodos para declaracion, asignación y acceso de arreglos
+    def _process_array_declaration(self, node):
+        datatype = node.datatype.name
+        self.symbol_table[node.name] = {'type': datatype, 'size': node.size}
+        self.quadruples.append(Quadruple('declare_array', datatype, node.name, node.size, self.lineno))
+
+    def _process_array_assignment(self, node):
+        index = yield node.index
+        value = yield node.value
+        self.quadruples.append(Quadruple('array_assign', node.name, index, value, self.lineno))
+
+    def _process_array_access(self, node):
+        index = yield node.index
+        temp = self.temp_gen()
+        self.quadruples.append(Quadruple('array_access', node.name, index, temp, self.lineno))
+        return temp
 
-        elif nodetype == 'or':
-            left = self._process_node(node[1])
-            right = self._process_node(node[2])
+    #Acomodo de saltos en condicional if-else
+    def _process_if_else(self, node):
+        condition = yield node.condition
+        temp_condition = self.temp_gen()
+        self.quadruples.append(Quadruple('=', condition, None, temp_condition, self.lineno))
+        false_jump = len(self.quadruples)
+        self.quadruples.append(Quadruple('gotofalse', temp_condition, None, None, self.lineno))
+
+        for stmt in node.body:
+            yield stmt
+        end_jump = len(self.quadruples)
+        self.quadruples.append(Quadruple('goto', None, None, None, self.lineno))
+
+        self.quadruples[false_jump].result = len(self.quadruples)
+
+        for stmt in node.orelse:
+            yield stmt
+
+        self.quadruples[end_jump].result = len(self.quadruples)
+
+    #Acomodo de saltos en ciclo while
+    def _process_while(self, node):
+        start_jump = len(self.quadruples)
+
+        condition_result = yield node.condition
+        temp_condition = self.temp_gen()
+        self.quadruples.append(Quadruple('=', condition_result, None, temp_condition, self.lineno))
+        false_jump = len(self.quadruples)
+        self.quadruples.append(Quadruple('gotofalse', temp_condition, None, None, self.lineno))
+
+        for stmt in node.body:
+            yield stmt
+
+        self.quadruples.append(Quadruple('goto', None, None, start_jump, self.lineno))
+        self.quadruples[false_jump].result = len(self.quadruples)
+
+    #Acomodo de saltos en ciclo for 
+    def _process_for(self, node):
+        yield node.init
+        start_jump = len(self.quadruples)
+        condition = yield node.condition
+        temp_condition = self.temp_gen()
+        self.quadruples.append(Quadruple('=', condition, None, temp_condition, self.lineno))
+        false_jump = len(self.quadruples)
+        self.quadruples.append(Quadruple('gotofalse', temp_condition, None, None, self.lineno))
+        self.quadruples.append(Quadruple('gototrue', temp_condition, None, None, self.lineno))
+        true_jump = len(self.quadruples)-1
+        increment_jump = len(self.quadruples)
+        yield node.step
+        self.quadruples.append(Quadruple('goto', None, None, start_jump, self.lineno))
+        self.quadruples[true_jump].result = len(self.quadruples)
+        for stmt in node.body:
+            yield stmt
+
+        self.quadruples.append(Quadruple('goto', None, None, increment_jump, self.lineno))
+        self.quadruples[false_jump].result = len(self.quadruples)
+
+    #Acomodo de operadores. Si los dos operandos son constantes o variables (el caso más común)
+    #el cuadruplo se genera directo, sin generador
+    def _process_binary(self, node):
+        left = node.left
+        right = node.right
+        if (left.__class__ is Factor and right.__class__ is Factor
+                and left.value.__class__ is not ArrayAccess and right.value.__class__ is not ArrayAccess):
             temp = self.temp_gen()
-            self.quadruples.append(Quadruple('||', left, right, temp))
+            self.quadruples.append(Quadruple(BINARY_OPERATORS[node.kind], left.value, right.value, temp, self.lineno))
             return temp
+        return self._process_binary_children(node)
+
+    def _process_binary_children(self, node):
+        left = _leaf_operand(node.left)
+        if left is _PENDING:
+            left = yield node.left
+        right = _leaf_operand(node.right)
+        if right is _PENDING:
+            right = yield node.right
+        temp = self.temp_gen()
+        self.quadruples.append(Quadruple(BINARY_OPERATORS[node.kind], left, right, temp, self.lineno))
+        return temp
 
-        elif nodetype == 'increment':
-            variable = node[1]
-            self.quadruples.append(Quadruple('=', variable, None, variable))
-            self.quadruples.append(Quadruple('+', variable, 1, variable))
-
-        elif nodetype == 'decrement':
-            target = node[1]
-            self.quadruples.append(Quadruple('-', target, 1, target))
+    def _process_increment(self, node):
+        variable = node.name
+        self.quadruples.append(Quadruple('=', variable, None, variable, self.lineno))
+        self.quadruples.append(Quadruple('+', variable, 1, variable, self.lineno))
 
-        elif nodetype == 'factor':
-            if isinstance(node[1], tuple) and node[1][0] == 'array_access':
-                return self._process_node(node[1])
-            return node[1]
+    def _process_decrement(self, node):
+        target = node.name
+        self.quadruples.append(Quadruple('-', target, 1, target, self.lineno))
 
-        elif nodetype == 'declaration':
-            self._process_declaration(node[2], node[1][1])
+    def _process_declaration_node(self, node):
+        self._process_declaration(node.declareid, node.datatype.name)
 
-#Declaración de variables 
+#Declaración de variables. La lista "int a, b, c, ..." es una cadena izquierda de declareid_multiple:
+#se recorre hasta el primer nombre y se procesa en orden
     def _process_declaration(self, node, datatype):
-        if node[0] == 'declareid_single':
-            self.symbol_table[node[1]] = datatype
-            self.quadruples.append(Quadruple('=', None, None, node[1]))
-        elif node[0] == 'declareid_multiple':
-            self._process_declaration(node[1], datatype)
-            self.symbol_table[node[-1]] = datatype
-            self.quadruples.append(Quadruple('=', None, None, node[-1]))
-        elif node[0] == 'declareid_single_d':
-            var_id = node[1][1]
-            expression = node[1][3]
-            self._process_assignment(var_id, expression)
-        elif node[0] == 'declareid_multiple_d':
-            self._process_declaration(node[1], datatype)
-            var_id = node[-1][1]
-            expression = node[-1][3]
-            self._process_assignment(var_id, expression)
+        chain = [node]
+        while chain[-1].kind in ('declareid_multiple', 'declareid_multiple_d'):
+            chain.append(chain[-1].rest)
+        for node in reversed(chain):
+            if node.kind in ('declareid_single', 'declareid_multiple'):
+                self.symbol_table[node.name] = datatype
+                self.quadruples.append(Quadruple('=', None, None, node.name, self.lineno))
+            elif node.kind in ('declareid_single_d', 'declareid_multiple_d'):
+                self._process_assignment(node.assignment.target, node.assignment.value)
 
 #Genera cuadruplos para asignar valores a variables 
     def _process_assignment(self, var_id, expression):
         if expression[0] == 'expression_typedata':
-            self.quadruples.append(Quadruple('=', expression[1], None, var_id))
+            self.quadruples.append(Quadruple('=', expression[1], None, var_id, self.lineno))
         elif expression[0] == 'expression_operations':
             operator = expression[2]
             left = expression[1][1]
@@ -282,8 +436,8 @@ class CodeGen:
                 right = self.temp_gen()
                 self._process_assignment(right, expression[3])
             temp = self.temp_gen()
-            self.quadruples.append(Quadruple(operator, left, right, temp))
-            self.quadruples.append(Quadruple('=', temp, None, var_id))
+            self.quadruples.append(Quadruple(operator, left, right, temp, self.lineno))
+            self.quadruples.append(Quadruple('=', temp, None, var_id, self.lineno))
         elif expression[0] == 'expression_parenthesis':
             self._process_assignment(var_id, expression[1])
 
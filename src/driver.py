@@ -0,0 +1,299 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Driver - Compila (y opcionalmente ejecuta) lotes de archivos fuente
+#Cada archivo pasa por parse -> CodeGen -> optimización -> ejecución; con varios archivos el
+#trabajo se reparte en un ProcessPoolExecutor con un parser ya cargado por proceso y los
+#resultados regresan en el mismo orden que las entradas. Los archivos .csir (IR precompilado,
+#ver irfile.py) se ejecutan directamente
+
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from parse import Parser
+from codegen import CodeGen
+from interpreter import IR_Interpret
+from vm import BytecodeVM
+from jit import JITExecuter
+from regalloc import TempAllocator
+from optimizer import Optimizer
+from loops import LoopIdioms
+from arrays import DEFAULT_BACKEND
+from output import BufferedOutput, StringOutput
+from cache import CompileCache
+from irfile import IR_EXTENSION, dump, load
+from astnodes import count_nodes
+from instrument import NULL_INSTRUMENTATION, Instrumentation, notify
+from profiler import ExecutionProfile
+from limits import ExecutionLimits
+
+#Extensión de los archivos fuente al recorrer directorios
+SOURCE_EXTENSION = '.txt'
+
+ENGINES = {
+    'vm': BytecodeVM,
+    'jit': JITExecuter,
+}
+
+#Opciones de compilación; deben poder enviarse a otros procesos (pickle).
+#profile activa la instrumentación (instrument.py) y profile_memory además mide con tracemalloc;
+#exec_profile mide ejecuciones y tiempo de cada cuadruplo (profiler.py); limits acota la ejecución
+#de programas no confiables (limits.ExecutionLimits)
+class CompileOptions:
+    def __init__(self, optimize=False, engine='vm', arrays=DEFAULT_BACKEND, execute=True,
+                 show_ast=True, show_ir=True, show_pseudo=True, cache=True, emit_ir=False, lexer='ply',
+                 profile=False, profile_memory=False, exec_profile=False, limits=None):
+        self.optimize = optimize
+        self.engine = engine
+        self.arrays = arrays
+        self.execute = execute
+        self.show_ast = show_ast
+        self.show_ir = show_ir
+        self.show_pseudo = show_pseudo
+        self.cache = cache
+        self.emit_ir = emit_ir
+        self.lexer = lexer
+        self.profile = profile or profile_memory
+        self.profile_memory = profile_memory
+        self.exec_profile = exec_profile
+        self.limits = limits if limits is not None else ExecutionLimits()
+
+#Resultado de un archivo: salida (volcados y ejecución), diagnósticos del parser y error, si hubo.
+#profile es el reporte de la instrumentación (diccionario) o None y exec_profile el ExecutionProfile
+#de la ejecución o None
+class CompileResult:
+    def __init__(self, path, output='', diagnostics='', error=None, seconds=0.0, profile=None,
+                 exec_profile=None):
+        self.path = path
+        self.output = output
+        self.diagnostics = diagnostics
+        self.error = error
+        self.seconds = seconds
+        self.profile = profile
+        self.exec_profile = exec_profile
+
+    @property
+    def ok(self):
+        return self.error is None
+
+#Archivos de entrada en orden: los directorios se expanden a sus archivos fuente ordenados
+def collect_sources(inputs):
+    sources = []
+    for path in inputs:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                sources.extend(os.path.join(root, name) for name in sorted(files)
+                               if name.endswith(SOURCE_EXTENSION))
+        else:
+            sources.append(path)
+    return sources
+
+#Cache del front end compartido por las compilaciones de este proceso
+_compile_cache = None
+
+def _get_cache():
+    global _compile_cache
+    if _compile_cache is None:
+        _compile_cache = CompileCache()
+    return _compile_cache
+
+#Front end: parse y CodeGen, o el resultado guardado en el cache para el mismo texto
+#(del cache el AST solo se decodifica si se va a imprimir).
+#Los programas con errores de sintaxis no se guardan para que sus diagnósticos se repitan
+def front_end(data, options, parser, instrumentation=NULL_INSTRUMENTATION):
+    compile_cache = _get_cache() if options.cache else None
+    if compile_cache is not None:
+        with instrumentation.phase('cache'):
+            cached = compile_cache.get(data)
+            ast = cached.ast if cached is not None and options.show_ast else None
+        if cached is not None:
+            instrumentation.count('cache_hits')
+            instrumentation.count('quadruples', len(cached.quadruples))
+            return ast, cached.quadruples, cached.temp_count, ''
+
+    #Los errores léxicos y de sintaxis (lexer.report) se guardan como diagnósticos
+    diagnostics = io.StringIO()
+    with instrumentation.phase('parse'):
+        if instrumentation.enabled:
+            result, tokens = parser.parse_counting(data, diagnostics)
+        else:
+            result = parser.parse(data, diagnostics)
+    if instrumentation.enabled:
+        instrumentation.count('tokens', tokens)
+        instrumentation.count('ast_nodes', count_nodes(result))
+
+    with instrumentation.phase('codegen'):
+        quad_gen = CodeGen(result)
+        quadruples = quad_gen.generate()
+    instrumentation.count('quadruples', len(quadruples))
+    if compile_cache is not None and not diagnostics.getvalue():
+        with instrumentation.phase('cache_store'):
+            compile_cache.put(data, result, quadruples, quad_gen.temp_counter)
+    return result, quadruples, quad_gen.temp_counter, diagnostics.getvalue()
+
+#Tabla final de un texto: front end y, con -O, ciclos en bloque, Optimizer y TempAllocator.
+#loop_idioms, optimizer y allocator quedan en None sin -O (sus contadores van al volcado del IR)
+class Compilation:
+    def __init__(self, ast, quadruples, diagnostics, loop_idioms=None, optimizer=None, allocator=None):
+        self.ast = ast
+        self.quadruples = quadruples
+        self.diagnostics = diagnostics
+        self.loop_idioms = loop_idioms
+        self.optimizer = optimizer
+        self.allocator = allocator
+
+#Compilación de un texto a los cuadruplos que se ejecutan; la usan compile_source y runner.py
+def compile_quadruples(data, options, parser, instrumentation=NULL_INSTRUMENTATION):
+    ast, quadruples, temp_count, diagnostics = front_end(data, options, parser, instrumentation)
+    compilation = Compilation(ast, quadruples, diagnostics)
+
+    #Optimización (-O): ciclos en bloque, plegado y propagación de constantes, y reutilización de
+    #temporales muertos (cuesta más que CodeGen, así que sin -O la tabla queda como la genera)
+    if options.optimize:
+        with instrumentation.phase('loops'):
+            compilation.loop_idioms = LoopIdioms(quadruples, temp_count)
+            quadruples = compilation.loop_idioms.lower()
+            temp_count = compilation.loop_idioms.temp_count
+        with instrumentation.phase('optimize'):
+            compilation.optimizer = Optimizer(quadruples, temp_count)
+            quadruples = compilation.optimizer.optimize()
+        instrumentation.count('quadruples_optimized', len(quadruples))
+        with instrumentation.phase('regalloc'):
+            compilation.allocator = TempAllocator(quadruples, temp_count)
+            quadruples = compilation.allocator.allocate()
+    instrumentation.count('quadruples_final', len(quadruples))
+    compilation.quadruples = quadruples
+    return compilation
+
+#Pipeline completo sobre un texto; todo lo que se imprime va a output (ver output.py).
+#Con ir_path los cuadruplos finales se guardan en formato binario (ver irfile.py).
+#Devuelve los diagnósticos del parser y el perfil de la ejecución (o None)
+def compile_source(data, options, parser, output, ir_path=None, instrumentation=NULL_INSTRUMENTATION):
+    compilation = compile_quadruples(data, options, parser, instrumentation)
+    quadruples = compilation.quadruples
+
+    if options.show_ast:
+        with instrumentation.phase('show_ast'):
+            output.write("Parsed expression as AST(Abstract Syntax Tree): \n")
+            output.write(f"{compilation.ast} \n\n")
+
+    if options.show_ir:
+        output.write("From the AST we generate the following IR/Quadruples: \n")
+        for counter, quad in enumerate(quadruples):
+            output.write(f"L{counter} {quad}\n")
+        if options.optimize:
+            allocator = compilation.allocator
+            output.write(f"Optimizer: removed {compilation.optimizer.removed} quadruples, "
+                         f"{len(compilation.loop_idioms.kernels)} loops lowered to bulk operations\n")
+            output.write(f"Temporaries: {allocator.temps_before} -> {allocator.temps_after} "
+                         f"(peak live: {allocator.peak_live})\n")
+        output.write("\n\n")
+
+    if ir_path is not None:
+        with instrumentation.phase('emit_ir'):
+            dump(quadruples, ir_path)
+    exec_profile = run_quadruples(quadruples, options, output, instrumentation, data)
+    return compilation.diagnostics, exec_profile
+
+#Pseudocódigo y ejecución de una tabla de cuadruplos ya compilada.
+#Con options.exec_profile devuelve el ExecutionProfile de la ejecución; source es el texto del programa
+def run_quadruples(quadruples, options, output, instrumentation=NULL_INSTRUMENTATION, source=None):
+    if options.show_pseudo:
+        with instrumentation.phase('pseudo'):
+            output.write("Which are represented on pseucode as: \n")
+            output.write(IR_Interpret(quadruples).interpret() + "\n")
+            output.write("\n\n")
+
+    exec_profile = None
+    if options.execute:
+        if options.show_ast or options.show_ir or options.show_pseudo:
+            output.write('-----------------------------------------------------------------------------\n')
+            output.write('Program Execution and Evaluation:\n')
+        #Con instrumentación el motor cuenta las ejecuciones de cada cuadruplo y con exec_profile
+        #además mide su tiempo; sin ninguno de los dos ejecuta el bytecode/código normal
+        engine = ENGINES[options.engine](output=output, array_backend=options.arrays,
+                                         count=instrumentation.enabled, profile=options.exec_profile,
+                                         limits=options.limits)
+        try:
+            with instrumentation.phase('execute'):
+                engine.interpret(quadruples)
+        finally:
+            if engine.counts is not None:
+                instrumentation.count('executed_instructions', sum(engine.counts))
+        if engine.times is not None:
+            exec_profile = ExecutionProfile(quadruples, engine.counts, engine.times, source=source)
+    output.flush()
+    return exec_profile
+
+#Compila un archivo capturando su salida; los errores se devuelven en el resultado
+def compile_file(path, options, parser, output=None):
+    capture = output if output is not None else StringOutput()
+    instrumentation = Instrumentation(options.profile_memory) if options.profile else NULL_INSTRUMENTATION
+    start = time.perf_counter()
+    diagnostics = ''
+    error = None
+    exec_profile = None
+    try:
+        if path.endswith(IR_EXTENSION):
+            #IR precompilado: sin front end ni optimización, los cuadruplos se decodifican al usarse
+            with load(path) as program:
+                instrumentation.count('quadruples', len(program))
+                if options.show_ir:
+                    capture.write("Precompiled IR/Quadruples: \n")
+                    for counter, quad in enumerate(program):
+                        capture.write(f"L{counter} {quad}\n")
+                    capture.write("\n\n")
+                exec_profile = run_quadruples(program, options, capture, instrumentation)
+        else:
+            with open(path, "r") as data_file:
+                data = data_file.read()
+            ir_path = os.path.splitext(path)[0] + IR_EXTENSION if options.emit_ir else None
+            diagnostics, exec_profile = compile_source(data, options, parser, capture, ir_path, instrumentation)
+    except Exception as exc:
+        capture.flush()
+        error = f"{type(exc).__name__}: {exc}"
+    text = capture.getvalue() if output is None else ''
+    if exec_profile is not None:
+        exec_profile.name = path
+    return CompileResult(path, text, diagnostics, error, time.perf_counter() - start,
+                         instrumentation.report(path), exec_profile)
+
+#Estado de cada proceso del pool: un parser con las tablas ya cargadas
+_worker_parser = None
+_worker_options = None
+
+def _init_worker(options):
+    global _worker_parser, _worker_options
+    _worker_parser = Parser(options.lexer)
+    _worker_options = options
+
+def _compile_in_worker(path):
+    return compile_file(path, _worker_options, _worker_parser)
+
+#Compila los archivos y devuelve (generador) los resultados en el orden de entrada.
+#Con jobs=1 o un solo archivo todo corre en este proceso; stream recibe la salida directamente.
+#Los reportes de instrumentación se pasan a los hooks de instrument.py en este proceso
+def run_batch(paths, options, jobs=None, stream=None):
+    for result in _run_batch(paths, options, jobs, stream):
+        if result.profile is not None:
+            notify(result.profile)
+        yield result
+
+def _run_batch(paths, options, jobs, stream):
+    paths = list(paths)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) <= 1:
+        parser = Parser(options.lexer)
+        for path in paths:
+            if stream is None:
+                yield compile_file(path, options, parser)
+            else:
+                yield compile_file(path, options, parser, BufferedOutput(stream))
+        return
+
+    jobs = min(jobs, len(paths))
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(options,)) as pool:
+        yield from pool.map(_compile_in_worker, paths, chunksize=chunksize)
@@ -0,0 +1,22 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Errores compartidos: de ejecución (se re-exportan desde semantic) y de archivos de IR
+
+class SemanticError(Exception):
+    pass
+
+#Límite de ejecución excedido (ver limits.py): quad_index es el cuadruplo donde se detectó y
+#limit el límite ('instructions', 'time' o 'array_cells')
+class ResourceLimitError(SemanticError):
+    def __init__(self, message, quad_index, limit):
+        super().__init__(message)
+        self.quad_index = quad_index
+        self.limit = limit
+
+    #Para que sobreviva a pickle (p. ej. de regreso de un proceso del pool)
+    def __reduce__(self):
+        return (self.__class__, (str(self), self.quad_index, self.limit))
+
+#Archivo de IR binario inválido, truncado o de otra versión (ver irfile.py)
+class IRFormatError(Exception):
+    pass
@@ -0,0 +1,138 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: FastLexer - Lexer alternativo a PLY lex basado en una sola expresión compilada
+#La expresión y la tabla de acciones se construyen una vez a partir de las reglas del lexer de
+#lexer.py (mismo orden de prioridad que PLY), así que acepta exactamente los mismos tokens y
+#palabras reservadas. Por cada coincidencia se consulta la tabla (m.lastgroup -> acción) en vez de
+#llamar a una función t_ por token, y los saltos de línea se cuentan sin generar tokens.
+#Produce objetos LexToken con type, value, lineno y lexpos, así que el parser lo usa sin cambios
+
+import functools
+import re
+
+from ply.lex import LexToken
+
+import lexer as ply_lexer
+
+#Acciones de la tabla
+_TOKEN = 0      #token sin conversión del valor
+_CONVERT = 1    #token con valor convertido (constantes)
+_ID = 2         #identificador o palabra reservada
+_NEWLINE = 3
+_IGNORE = 4     #espacios y comentarios
+_ERROR = 5      #carácter ilegal
+_RULE = 6       #regla de lexer.py sin acción en la tabla: se llama la función original
+
+#Conversión del valor de las reglas con función de lexer.py
+_CONVERTERS = {
+    't_FLOATCONST': lambda value: float(value[:-1]),
+    't_BOOLCONST': lambda value: value == 'true',
+    't_CHARCONST': lambda value: value[1],
+    't_DOUBLECONST': lambda value: float(value[:-1]),
+    't_LONGCONST': lambda value: int(value[:-1]),
+    't_INTCONST': int,
+    't_STRCONST': lambda value: value[1:-1],
+}
+
+#Expresión maestra construida con las reglas de PLY en su orden de prioridad:
+#    [ignorados]+ | (?:regla1)(?P<t_X>) | (?:regla2)(?P<t_Y>) | ... | [\s\S](?P<_error>)   seguida de [ignorados]*
+#El grupo vacío al final de cada alternativa marca la regla (m.lastindex) sin envolverla, así cada
+#alternativa empieza con su literal o clase de caracteres y el motor descarta rápido las que no aplican;
+#los espacios que siguen a un token se consumen en la misma coincidencia
+def _build(master):
+    ignore = f"[{re.escape(master.lexignore)}]"
+    patterns = [f"{ignore}+(?P<_skip>)"]
+    rules = []
+    for regex, index_functions in master.lexre:
+        for name, index in sorted(regex.groupindex.items(), key=lambda item: item[1]):
+            rule = getattr(ply_lexer, name)
+            patterns.append(f"(?:{rule.__doc__ if callable(rule) else rule})(?P<{name}>)")
+            rules.append((name, index_functions[index]))
+    patterns.append(r"[\s\S](?P<_error>)")
+    scanner = re.compile(f"(?:{'|'.join(patterns)}){ignore}*", master.lexreflags)
+
+    #Acción por número de grupo (m.lastindex)
+    actions = [None] * (scanner.groups + 1)
+    actions[scanner.groupindex['_skip']] = (_IGNORE, None, None)
+    actions[scanner.groupindex['_error']] = (_ERROR, None, None)
+    for name, (function, token_type) in rules:
+        if function is None:
+            action = (_TOKEN, token_type, None) if token_type else (_IGNORE, None, None)
+        elif name == 't_ID':
+            action = (_ID, token_type, None)
+        elif name == 't_NEWLINE':
+            action = (_NEWLINE, None, None)
+        elif name in _CONVERTERS:
+            action = (_CONVERT, token_type, _CONVERTERS[name])
+        else:
+            action = (_RULE, token_type, function)
+        actions[scanner.groupindex[name]] = action
+    return scanner, actions
+
+_SCANNER, _ACTIONS = _build(ply_lexer.lexer)
+
+def _end():
+    return None
+
+#Lexer compatible con la interfaz que usa yacc: input(), token() y lineno
+class FastLexer:
+    def __init__(self):
+        self.lineno = 1
+        self.lexdata = ''
+        self.token = _end
+
+    #token() queda ligado a next() del generador: sin llamadas de Python entre tokens
+    def input(self, data):
+        self.lexdata = data
+        self.token = functools.partial(next, self._tokens(data), None)
+
+    def clone(self):
+        return FastLexer()
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    #Los caracteres ilegales se reportan al llegar a ellos, igual que con t_error
+    def _tokens(self, data):
+        lineno = self.lineno
+        actions = _ACTIONS
+        reserved = ply_lexer.reserved
+        for match in _SCANNER.finditer(data):
+            index = match.lastindex
+            action, token_type, convert = actions[index]
+            if action == _IGNORE:
+                continue
+            start = match.start()
+            if action == _NEWLINE:
+                lineno += match.start(index) - start
+                self.lineno = lineno
+                continue
+            tok = LexToken()
+            tok.value = value = data[start:match.start(index)]
+            tok.lineno = lineno
+            tok.lexpos = start
+            if action == _TOKEN:
+                tok.type = token_type
+            elif action == _ID:
+                tok.type = reserved.get(value, 'ID')
+            elif action == _CONVERT:
+                tok.type = token_type
+                tok.value = convert(value)
+            elif action == _ERROR:
+                ply_lexer.report("Illegal character '%s'" % value)
+                continue
+            else:
+                tok.type = token_type
+                tok.lexer = self
+                self.lineno = lineno
+                tok = convert(tok)
+                lineno = self.lineno
+                if not tok:
+                    continue
+            yield tok
+
+#Lexers disponibles para el parser
+LEXERS = {
+    'ply': ply_lexer.make_lexer,
+    'fast': FastLexer,
+}
@@ -0,0 +1,90 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Instrumentación del pipeline - tiempo y memoria por fase y contadores por compilación
+#Instrumentation mide cada fase (parse, codegen, optimización, ejecución, ...) con perf_counter y,
+#con memory=True, lo que asigna con tracemalloc; los contadores guardan tokens, nodos del AST,
+#cuadruplos e instrucciones ejecutadas. report() devuelve un diccionario listo para JSON.
+#Sin instrumentación se usa NULL_INSTRUMENTATION, cuyas fases son un contexto vacío reutilizable.
+#Las funciones registradas con add_hook reciben el reporte de cada archivo compilado (ver driver.run_batch)
+
+import contextlib
+import json
+import time
+import tracemalloc
+
+class Instrumentation:
+    enabled = True
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.phases = []
+        self.counters = {}
+        self._tracing = False
+        self._start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        record = {'name': name, 'seconds': 0.0}
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record['allocated_bytes'] = current - before
+                record['peak_bytes'] = peak - before
+            self.phases.append(record)
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    #Termina la medición (detiene tracemalloc si lo inició) y devuelve el reporte
+    def report(self, path=None):
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        return {
+            'path': path,
+            'total_seconds': time.perf_counter() - self._start,
+            'phases': self.phases,
+            'counters': self.counters,
+        }
+
+#Instrumentación apagada: mismas llamadas, sin medir nada
+class NullInstrumentation:
+    enabled = False
+    _context = contextlib.nullcontext({})
+
+    def phase(self, name):
+        return self._context
+
+    def count(self, name, value=1):
+        pass
+
+    def report(self, path=None):
+        return None
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+#Funciones que reciben cada reporte
+_hooks = []
+
+def add_hook(callback):
+    _hooks.append(callback)
+
+def remove_hook(callback):
+    _hooks.remove(callback)
+
+def notify(report):
+    for callback in list(_hooks):
+        callback(report)
+
+def to_json(reports):
+    return json.dumps({'files': reports}, indent=2)
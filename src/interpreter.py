@@ -2,7 +2,7 @@
 # Fecha: 20/05/2024
 # Descripción: Intérprete - Traduce cuádruplos a pseudo-código
 
-from codegen import CodeGen
+from codegen import CodeGen, quadruple_rows
 
 class IR_Interpret:
     def __init__(self, quadruples):
@@ -11,17 +11,12 @@ class IR_Interpret:
 
     #Recorre la lista de cuadruplos y procesa a pseudocodigo
     def interpret(self):
-        for quad in self.quadruples:
-            self._process_quadruple(quad)
+        for op, arg1, arg2, result in quadruple_rows(self.quadruples):
+            self._process_quadruple(op, arg1, arg2, result)
         return '\n'.join(self.output)
 
     #Genera pseudocodigo con base en la posición del cuadruplo y lo interpreta añadiendo los espacios o simbolos legibles
-    def _process_quadruple(self, quad):
-        op = quad.operator
-        arg1 = quad.arg1
-        arg2 = quad.arg2
-        result = quad.result
-
+    def _process_quadruple(self, op, arg1, arg2, result):
         if op == '=':
             self.output.append(f"{result} = {arg1}")
         elif op == 'write':
@@ -48,6 +43,8 @@ class IR_Interpret:
             self.output.append(f"{arg1}[{arg2}] = {result}")
         elif op == 'array_access':
             self.output.append(f"{result} = {arg1}[{arg2}]")
+        elif op == 'loop_kernel':
+            self.output.append(f"{result} = bulk {arg1}")
         else:
             raise ValueError(f"Unknown operation: {op}")
 
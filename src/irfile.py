@@ -0,0 +1,278 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Formato binario de IR - guarda y carga tablas de cuadruplos ya compiladas
+#Archivo (little endian, versionado):
+#    encabezado   magic 'CSIR', versión, banderas, tamaños y offsets de cada sección
+#    operadores   tabla de opcodes: u16 longitud + texto utf-8 por operador
+#    cadenas      tabla de cadenas (nombres de variables, literales): n+1 offsets u64 + datos utf-8
+#    constantes   pool de operandos: n+1 offsets u64 + entradas (tipo u8 + datos)
+#    cuadruplos   registros de ancho fijo (opcode u32, arg1 u32, arg2 u32, result u32);
+#                 los operandos son índices al pool de constantes
+#Al cargar se mapea el archivo en memoria (mmap) y cada cuadruplo, cadena y constante se
+#decodifica solo cuando se pide: indexar o imprimir una parte del programa no lee el resto.
+#Ejecutarlo sí lee todos los registros: symbols.resolve los recorre (dos veces) con rows(), que
+#desempaca cada registro del buffer a una tupla sin crear objetos Quadruple ni una lista de filas,
+#y cada constante del pool se decodifica una sola vez. Lo que queda en memoria es la tabla de
+#slots del motor, no el programa decodificado
+
+import mmap
+import struct
+from collections.abc import Sequence
+
+from codegen import Quadruple, quadruple_rows
+from loops import LoopKernel
+from errors import IRFormatError
+
+MAGIC = b'CSIR'
+FORMAT_VERSION = 1
+
+#Extensión de los archivos de IR precompilado
+IR_EXTENSION = '.csir'
+
+_HEADER = struct.Struct('<4sHHIIIIQQQQ')
+_QUAD = struct.Struct('<IIII')
+_OFFSET = struct.Struct('<Q')
+_OPCODE_LENGTH = struct.Struct('<H')
+_INDEX = struct.Struct('<I')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+
+#Tipos de entrada del pool de constantes
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT_KIND = 3      #entero de 64 bits
+_BIGINT = 4        #entero fuera de 64 bits, como texto decimal en la tabla de cadenas
+_FLOAT_KIND = 5
+_STR = 6           #índice u32 a la tabla de cadenas
+_TUPLE = 7         #u32 número de elementos + índices u32 al pool
+_KERNEL = 8        #índice u32 a una tupla con los argumentos de LoopKernel
+
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+#Llave de deduplicación: distingue 1, 1.0 y True, y también 0.0 de -0.0
+def _key(value):
+    if isinstance(value, float):
+        return (float, _FLOAT.pack(value))
+    if isinstance(value, tuple):
+        return (tuple, tuple(_key(item) for item in value))
+    if isinstance(value, LoopKernel):
+        return (LoopKernel, id(value))
+    return (type(value), value)
+
+#Construcción de las tablas para dumps
+class _Writer:
+    def __init__(self):
+        self.opcodes = {}
+        self.strings = {}
+        self.entries = []
+        self._slots = {}
+
+    def opcode(self, operator):
+        if operator not in self.opcodes:
+            self.opcodes[operator] = len(self.opcodes)
+        return self.opcodes[operator]
+
+    def string(self, text):
+        if text not in self.strings:
+            self.strings[text] = len(self.strings)
+        return self.strings[text]
+
+    def constant(self, value):
+        key = _key(value)
+        if key in self._slots:
+            return self._slots[key]
+        if value is None:
+            entry = bytes((_NONE,))
+        elif value is False or value is True:
+            entry = bytes((_TRUE if value else _FALSE,))
+        elif type(value) is int:
+            if _INT_MIN <= value <= _INT_MAX:
+                entry = bytes((_INT_KIND,)) + _INT.pack(value)
+            else:
+                entry = bytes((_BIGINT,)) + _INDEX.pack(self.string(str(value)))
+        elif type(value) is float:
+            entry = bytes((_FLOAT_KIND,)) + _FLOAT.pack(value)
+        elif type(value) is str:
+            entry = bytes((_STR,)) + _INDEX.pack(self.string(value))
+        elif type(value) is tuple:
+            items = [self.constant(item) for item in value]
+            entry = bytes((_TUPLE,)) + _INDEX.pack(len(items)) + b''.join(_INDEX.pack(item) for item in items)
+        elif isinstance(value, LoopKernel):
+            arguments = (value.kind, value.index, value.bound, value.inclusive, value.target,
+                         value.expr, value.reduce_op, value.accumulator_left)
+            entry = bytes((_KERNEL,)) + _INDEX.pack(self.constant(arguments))
+        else:
+            raise IRFormatError(f"Cannot serialize operand {value!r} of type {type(value).__name__}")
+        #Los elementos de una tupla se agregan antes que la tupla misma
+        self._slots[key] = len(self.entries)
+        self.entries.append(entry)
+        return self._slots[key]
+
+def _table(items):
+    offsets = [0]
+    for item in items:
+        offsets.append(offsets[-1] + len(item))
+    return b''.join(_OFFSET.pack(offset) for offset in offsets) + b''.join(items)
+
+#Tabla de cuadruplos a bytes
+def dumps(quadruples):
+    writer = _Writer()
+    records = []
+    for operator, arg1, arg2, result in quadruple_rows(quadruples):
+        records.append(_QUAD.pack(writer.opcode(operator), writer.constant(arg1),
+                                  writer.constant(arg2), writer.constant(result)))
+
+    opcodes = b''.join(_OPCODE_LENGTH.pack(len(data)) + data
+                       for data in (operator.encode() for operator in writer.opcodes))
+    strings = _table([text.encode('utf-8', 'surrogatepass') for text in writer.strings])
+    pool = _table(writer.entries)
+
+    ops_offset = _HEADER.size
+    strings_offset = ops_offset + len(opcodes)
+    pool_offset = strings_offset + len(strings)
+    quads_offset = pool_offset + len(pool)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(writer.opcodes), len(writer.strings),
+                          len(writer.entries), len(records),
+                          ops_offset, strings_offset, pool_offset, quads_offset)
+    return b''.join([header, opcodes, strings, pool] + records)
+
+def dump(quadruples, path):
+    data = dumps(quadruples)
+    with open(path, 'wb') as ir_file:
+        ir_file.write(data)
+
+#Programa cargado: secuencia de solo lectura que decodifica cada cuadruplo al accederlo.
+#Cada acceso devuelve un Quadruple nuevo; los pasos que modifican cuadruplos usan list(program)
+class IRProgram(Sequence):
+    def __init__(self, buffer, mapping=None):
+        self._buffer = buffer
+        self._mapping = mapping
+        if len(buffer) < _HEADER.size:
+            raise IRFormatError("Truncated IR file: missing header")
+        (magic, version, _, opcode_count, string_count, constant_count, quad_count,
+         ops_offset, strings_offset, pool_offset, quads_offset) = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise IRFormatError("Not an IR file: bad magic number")
+        if version != FORMAT_VERSION:
+            raise IRFormatError(f"Unsupported IR format version {version} (expected {FORMAT_VERSION})")
+        if quads_offset + quad_count * _QUAD.size > len(buffer):
+            raise IRFormatError("Truncated IR file: quadruple section out of range")
+
+        self.opcodes = []
+        position = ops_offset
+        for _ in range(opcode_count):
+            (length,) = _OPCODE_LENGTH.unpack_from(buffer, position)
+            self.opcodes.append(bytes(buffer[position + 2:position + 2 + length]).decode())
+            position += 2 + length
+
+        self._string_count = string_count
+        self._strings_offset = strings_offset
+        self._strings_data = strings_offset + (string_count + 1) * _OFFSET.size
+        self._strings = [None] * string_count
+        self._constant_count = constant_count
+        self._pool_offset = pool_offset
+        self._pool_data = pool_offset + (constant_count + 1) * _OFFSET.size
+        self._constants = [None] * constant_count
+        self._decoded = bytearray(constant_count)
+        self._quads_offset = quads_offset
+        self._quad_count = quad_count
+
+    def __len__(self):
+        return self._quad_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._quad_count))]
+        if index < 0:
+            index += self._quad_count
+        if not 0 <= index < self._quad_count:
+            raise IndexError("quadruple index out of range")
+        opcode, arg1, arg2, result = _QUAD.unpack_from(self._buffer, self._quads_offset + index * _QUAD.size)
+        return Quadruple(self.opcodes[opcode], self.constant(arg1), self.constant(arg2), self.constant(result))
+
+    def __iter__(self):
+        for row in self.rows():
+            yield Quadruple(*row)
+
+    #Tuplas (operator, arg1, arg2, result) leídas directo del buffer (ver codegen.quadruple_rows)
+    def rows(self):
+        opcodes = self.opcodes
+        constant = self.constant
+        unpack = _QUAD.unpack_from
+        for position in range(self._quads_offset, self._quads_offset + self._quad_count * _QUAD.size, _QUAD.size):
+            opcode, arg1, arg2, result = unpack(self._buffer, position)
+            yield opcodes[opcode], constant(arg1), constant(arg2), constant(result)
+
+    #El formato no guarda líneas fuente
+    def lines(self):
+        return [0] * self._quad_count
+
+    def string(self, index):
+        text = self._strings[index]
+        if text is None:
+            start = _OFFSET.unpack_from(self._buffer, self._strings_offset + index * _OFFSET.size)[0]
+            stop = _OFFSET.unpack_from(self._buffer, self._strings_offset + (index + 1) * _OFFSET.size)[0]
+            text = bytes(self._buffer[self._strings_data + start:self._strings_data + stop]).decode('utf-8', 'surrogatepass')
+            self._strings[index] = text
+        return text
+
+    def constant(self, index):
+        if index >= self._constant_count:
+            raise IRFormatError(f"Constant index {index} out of range")
+        if self._decoded[index]:
+            return self._constants[index]
+        start = _OFFSET.unpack_from(self._buffer, self._pool_offset + index * _OFFSET.size)[0]
+        position = self._pool_data + start
+        kind = self._buffer[position]
+        position += 1
+        if kind == _NONE:
+            value = None
+        elif kind == _FALSE:
+            value = False
+        elif kind == _TRUE:
+            value = True
+        elif kind == _INT_KIND:
+            (value,) = _INT.unpack_from(self._buffer, position)
+        elif kind == _BIGINT:
+            value = int(self.string(_INDEX.unpack_from(self._buffer, position)[0]))
+        elif kind == _FLOAT_KIND:
+            (value,) = _FLOAT.unpack_from(self._buffer, position)
+        elif kind == _STR:
+            value = self.string(_INDEX.unpack_from(self._buffer, position)[0])
+        elif kind == _TUPLE:
+            (count,) = _INDEX.unpack_from(self._buffer, position)
+            items = struct.unpack_from(f'<{count}I', self._buffer, position + _INDEX.size)
+            value = tuple(self.constant(item) for item in items)
+        elif kind == _KERNEL:
+            value = LoopKernel(*self.constant(_INDEX.unpack_from(self._buffer, position)[0]))
+        else:
+            raise IRFormatError(f"Unknown constant kind {kind} at index {index}")
+        self._constants[index] = value
+        self._decoded[index] = 1
+        return value
+
+    def close(self):
+        if self._mapping is not None:
+            self._buffer = b''
+            self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+def loads(data):
+    return IRProgram(memoryview(data))
+
+#Carga un archivo mapeándolo en memoria; el programa debe cerrarse (close o with) al terminar
+def load(path):
+    with open(path, 'rb') as ir_file:
+        try:
+            mapping = mmap.mmap(ir_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise IRFormatError("Truncated IR file: missing header")
+    return IRProgram(mapping, mapping)
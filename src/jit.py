@@ -0,0 +1,290 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: JITExecuter - Backend que traduce los cuadruplos a código fuente de Python
+#Cada variable/temporal es una variable local, cada bloque básico un estado de una máquina de
+#estados dentro de un while; el código se compila una vez con compile() y se guarda por hash
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from codegen import quadruple_rows
+from cfg import CFG, EXIT
+from symbols import resolve
+from vm import checked_arithmetic, OPCODES, OP_NOP
+from output import BufferedOutput
+from arrays import DEFAULT_BACKEND, FAST_ARRAYS, new_array, load, store
+from limits import make_guard
+from symbols import JUMPS, LOOP_KERNEL
+
+_NUMERIC = frozenset((int, float, bool))
+
+_BINARY = {
+    '+': '+', '-': '-', '*': '*', '/': '/', '%': '%',
+    '==': '==', '!=': '!=', '<': '<', '<=': '<=', '>': '>', '>=': '>=',
+}
+
+_ARITHMETIC = ('+', '-', '*', '/', '%')
+
+#Profundidad máxima de anidamiento al generar bloques en línea (Python limita la indentación)
+MAX_INLINE_DEPTH = 40
+
+#Programas compilados que se conservan (los menos usados recientemente salen primero)
+MAX_CACHED_PROGRAMS = 128
+
+#Programas ya compilados: hash del programa -> función generada, en orden de uso. Lo comparten
+#los hilos de runner.py, así que se modifica con _cache_lock
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+#Arreglo que no es lista: si la variable nunca se asignó, mismo KeyError que memory_var_data[array_name]
+def array_operand(value, initial):
+    if value is initial and isinstance(value, str):
+        raise KeyError(value)
+    return value
+
+def program_hash(quadruple_table):
+    digest = hashlib.sha256()
+    for row in quadruple_rows(quadruple_table):
+        digest.update(repr(row).encode())
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+#Generador de código fuente de Python para una tabla de cuadruplos.
+#Con count=True antes de cada cuadruplo se suma su ejecución en _counts (instrumentación).
+#Con profile=True además se suma en _times[_q] el tiempo desde la sonda del cuadruplo anterior _q.
+#Con limits=True los saltos hacia atrás y declare_array pasan por _guard (limits.LimitGuard)
+class PythonSource:
+    def __init__(self, quadruple_table, count=False, profile=False, limits=False):
+        self.quadruples = quadruple_table
+        self.count = count
+        self.profile = profile
+        self.limits = limits
+        self.symbols, self.resolved = resolve(quadruple_table)
+        self.lines = []
+        #Kernels de loops.py; el código generado los llama sobre una copia del frame (_kf)
+        self.kernels = [arg1 for op, arg1, _, _ in self.resolved if op == 'loop_kernel']
+
+    #Nombre local de un slot: variables v<n>, constantes k<n>
+    def _local(self, slot):
+        if self.symbols.is_constant(slot):
+            return f"k{slot}"
+        return f"v{slot}"
+
+    def _is_numeric_constant(self, slot):
+        return self.symbols.is_constant(slot) and self._frame[slot].__class__ in _NUMERIC
+
+    def generate(self):
+        symbols = self.symbols
+        self._frame = symbols.frame()
+
+        lines = self.lines
+        lines.append("def program(_frame, _emit, _backend, _checked, _numeric,"
+                     " _array, _new_array, _load, _store, _fast_arrays, _kernels, _counts, _times, _clock, _guard):")
+        for slot in range(len(self._frame)):
+            lines.append(f"    {self._local(slot)} = _frame[{slot}]")
+        if self.profile:
+            lines.append(f"    _q = {len(self.resolved)}")
+            lines.append("    _since = _clock()")
+        if self.kernels:
+            lines.append("    _kf = list(_frame)")
+
+        if self.quadruples:
+            self._graph = CFG(self.quadruples)
+            #Cuerpo de cada estado; un estado se genera solo si algún salto lo necesita
+            bodies = {}
+            pending = [0]
+            while pending:
+                state = pending.pop()
+                if state in bodies:
+                    continue
+                self._body = []
+                self._referenced = []
+                self._emit_chain(state, 0, set())
+                bodies[state] = self._body
+                pending.extend(self._referenced)
+
+            lines.append("    _b = 0")
+            lines.append("    while True:")
+            self._dispatch(sorted(bodies), bodies, 2)
+
+        if self.profile:
+            lines.append("    _times[_q] += _clock() - _since")
+        names = ", ".join(f"v{slot}" for slot in range(len(symbols.names)))
+        lines.append(f"    return [{names}]")
+        return "\n".join(lines) + "\n"
+
+    #Árbol de búsqueda binaria sobre el número de estado
+    def _dispatch(self, states, bodies, depth):
+        pad = "    " * depth
+        if len(states) == 1:
+            self.lines.extend(pad + line for line in bodies[states[0]])
+            return
+        middle = len(states) // 2
+        self.lines.append(f"{pad}if _b < {states[middle]}:")
+        self._dispatch(states[:middle], bodies, depth + 1)
+        self.lines.append(f"{pad}else:")
+        self._dispatch(states[middle:], bodies, depth + 1)
+
+    #Transferencia a otro bloque: en línea si solo tiene este predecesor, si no cambio de estado
+    def _transfer(self, target, depth, visited):
+        pad = "    " * depth
+        if target == EXIT:
+            self._body.append(f"{pad}break")
+        elif (target != 0 and len(self._graph.blocks[target].preds) == 1 and target not in visited
+                and depth < MAX_INLINE_DEPTH):
+            self._emit_chain(target, depth, visited)
+        else:
+            self._referenced.append(target)
+            self._body.append(f"{pad}_b = {target}")
+            self._body.append(f"{pad}continue")
+
+    def _emit_chain(self, index, depth, visited):
+        visited = visited | {index}
+        block = self._graph.blocks[index]
+        pad = "    " * depth
+        for n, quad in enumerate(block.quads):
+            op, arg1, arg2, result = self.resolved[block.start + n]
+            if self.profile:
+                self._body.append(f"{pad}_t = _clock()")
+                self._body.append(f"{pad}_times[_q] += _t - _since")
+                self._body.append(f"{pad}_counts[{block.start + n}] += 1")
+                self._body.append(f"{pad}_q = {block.start + n}")
+                self._body.append(f"{pad}_since = _t")
+            elif self.count:
+                self._body.append(f"{pad}_counts[{block.start + n}] += 1")
+            backward = self.limits and op in JUMPS and result <= block.start + n
+            if op == 'goto':
+                if backward:
+                    self._body.append(f"{pad}_guard.jump({block.start + n})")
+                continue
+            if op in ('gotofalse', 'gototrue'):
+                test = f"not {self._local(arg1)}" if op == 'gotofalse' else self._local(arg1)
+                self._body.append(f"{pad}if {test}:")
+                if backward:
+                    self._body.append(f"{pad}    _guard.jump({block.start + n})")
+                self._transfer(block.target, depth + 1, visited)
+                continue
+            if op == 'declare_array' and self.limits:
+                self._body.append(f"{pad}_guard.allocate({block.start + n}, {self._local(result)})")
+            self._emit(op, arg1, arg2, result, pad, block.start + n)
+
+        next_block = block.target if block.fallthrough is None else block.fallthrough
+        self._transfer(next_block, depth, visited)
+
+    def _emit(self, op, arg1, arg2, result, pad, index):
+        lines = self._body
+        local = self._local
+        if op == '=':
+            lines.append(f"{pad}{local(result)} = {local(arg1)}")
+        elif op in _ARITHMETIC:
+            left, right = local(arg1), local(arg2)
+            checks = [f"{name}.__class__ in _numeric" for slot, name in ((arg1, left), (arg2, right))
+                      if not self._is_numeric_constant(slot)]
+            if checks:
+                lines.append(f"{pad}if {' and '.join(checks)}:")
+                lines.append(f"{pad}    {local(result)} = {left} {_BINARY[op]} {right}")
+                lines.append(f"{pad}else:")
+                lines.append(f"{pad}    {local(result)} = _checked({left}, {right}, {op!r})")
+            else:
+                lines.append(f"{pad}{local(result)} = _checked({left}, {right}, {op!r})")
+        elif op in _BINARY:
+            lines.append(f"{pad}{local(result)} = {local(arg1)} {_BINARY[op]} {local(arg2)}")
+        elif op == 'write':
+            lines.append(f"{pad}_emit(str({local(arg1)}))")
+        elif op == 'writeln':
+            lines.append(f"{pad}_emit(str({local(arg1)}) + '\\n')")
+        elif op == 'declare_array':
+            lines.append(f"{pad}{local(arg2)} = _new_array({arg1!r}, {local(result)}, _backend)")
+        elif op == 'array_assign':
+            name = self.symbols.names[arg1] if arg1 < len(self.symbols.names) else None
+            lines.append(f"{pad}_a = {local(arg1)}")
+            lines.append(f"{pad}_i = {local(arg2)}")
+            lines.append(f"{pad}if _a.__class__ in _fast_arrays and _i.__class__ is int and 0 <= _i < len(_a):")
+            lines.append(f"{pad}    try:")
+            lines.append(f"{pad}        _a[_i] = {local(result)}")
+            lines.append(f"{pad}    except (TypeError, OverflowError):")
+            lines.append(f"{pad}        _store(_a, _i, {local(result)}, {name!r})")
+            lines.append(f"{pad}else:")
+            lines.append(f"{pad}    _store(_array(_a, _frame[{arg1}]), _i, {local(result)}, {name!r})")
+        elif op == 'array_access':
+            name = self.symbols.names[arg1] if arg1 < len(self.symbols.names) else None
+            lines.append(f"{pad}_a = {local(arg1)}")
+            lines.append(f"{pad}_i = {local(arg2)}")
+            lines.append(f"{pad}if _a.__class__ in _fast_arrays and _i.__class__ is int and 0 <= _i < len(_a):")
+            lines.append(f"{pad}    {local(result)} = _a[_i]")
+            lines.append(f"{pad}else:")
+            lines.append(f"{pad}    {local(result)} = _load(_array(_a, _frame[{arg1}]), _i, {name!r})")
+        elif op == 'loop_kernel':
+            for slot in arg1.read_slots:
+                if not self.symbols.is_constant(slot):
+                    lines.append(f"{pad}_kf[{slot}] = {local(slot)}")
+            call = f"_kernels[{self.kernels.index(arg1)}].run(_kf"
+            call += f", _guard, {index})" if self.limits else ")"
+            lines.append(f"{pad}{local(result)} = {call}")
+            for slot in arg1.write_slots:
+                lines.append(f"{pad}{local(slot)} = _kf[{slot}]")
+        elif OPCODES.get(op, OP_NOP) == OP_NOP:
+            lines.append(f"{pad}pass")
+
+#Compila (o toma del cache) la función generada para una tabla de cuadruplos
+def compile_program(quadruple_table, count=False, profile=False, limits=False):
+    key = program_hash(quadruple_table) + ('-profile' if profile else '-count' if count else '')
+    if limits:
+        key += '-limits'
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+            return compiled
+    generator = PythonSource(quadruple_table, count, profile, limits)
+    source = generator.generate()
+    namespace = {}
+    exec(compile(source, f"<jit {key[:12]}>", 'exec'), namespace)
+    compiled = (namespace['program'], generator.symbols, generator.kernels, source)
+    with _cache_lock:
+        _cache[key] = compiled
+        while len(_cache) > MAX_CACHED_PROGRAMS:
+            _cache.popitem(last=False)
+    return compiled
+
+class JITExecuter:
+    #Con count=True se cuentan las ejecuciones de cada cuadruplo (counts) para la instrumentación;
+    #con profile=True además se mide el tiempo de cada uno en nanosegundos (times, ver profiler.py).
+    #limits (limits.ExecutionLimits) acota instrucciones, tiempo y celdas de arreglos
+    def __init__(self, output=None, array_backend=DEFAULT_BACKEND, count=False, profile=False, limits=None):
+        self.output = output if output is not None else BufferedOutput()
+        self.array_backend = array_backend
+        self.memory_var_data = {}
+        self.count = count
+        self.profile = profile
+        self.limits = limits
+        self.counts = None
+        self.times = None
+
+    def interpret(self, quadruple_table):
+        jumps = []
+        kernel_quads = []
+        if self.limits is not None:
+            for index, row in enumerate(quadruple_rows(quadruple_table)):
+                if row[0] in JUMPS:
+                    jumps.append((index, row[3]))
+                elif row[0] == LOOP_KERNEL:
+                    kernel_quads.append(index)
+        guard = make_guard(self.limits, jumps, kernel_quads)
+        program, symbols, kernels, _ = compile_program(quadruple_table, self.count, self.profile, guard is not None)
+        frame = symbols.frame()
+        counts = [0] * len(quadruple_table) if self.count or self.profile else None
+        #El último lugar es el tiempo antes del primer cuadruplo
+        times = [0] * (len(quadruple_table) + 1) if self.profile else None
+        try:
+            values = program(frame, self.output.write, self.array_backend, checked_arithmetic, _NUMERIC,
+                             array_operand, new_array, load, store, FAST_ARRAYS, kernels, counts,
+                             times, time.perf_counter_ns, guard)
+        finally:
+            self.output.flush()
+            self.counts = counts
+            if times is not None:
+                self.times = times[:-1]
+        self.memory_var_data = symbols.variables(values)
@@ -2,6 +2,8 @@
 # Fecha: 20/05/2024
 # Descripción: Lexer - responsable de leer el código fuente y producir los tokens.
 
+import threading
+
 import ply.lex as lex
 
 #Lista de palabras reservadas
@@ -66,8 +68,11 @@ tokens = [
 ] + list(reserved.values())
 
 #Expresiones regulares en tokens
+#Las expresiones no tienen alternativas ambiguas dentro de repeticiones, así que el tiempo de
+#cada intento es lineal aun con comentarios enormes o sin cerrar (ver bench_lexer.py --pathological)
 t_ignore_SINGLELINE_COMMENT = r'//.*'
-t_ignore_MULTILINE_COMMENT = r'/\*(.|\n)*?\*/'
+#Comentario /* */ sin retroceso: texto sin '*', luego estrellas, y así hasta el primer */
+t_ignore_MULTILINE_COMMENT = r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/'
 #Ignorar espacios, tabulaciones y caracteres form feed
 t_ignore = ' \t\x0c'
 
@@ -107,7 +112,7 @@ t_STMT_TERMINATOR  = r';'
 t_COLON            = r':'
 
 def t_FLOATCONST(t):
-    r'(\d+\.\d+)[fF]'
+    r'\d+\.\d+[fF]'
     #r'(\d*\.\d+)[fF]|[-]?(\d+\.\d*)[fF]'
     #r'\d*\.\d+[fF]|\d*\.\d+E [+-]?\d'
     t.value = float(t.value[:-1])  # Remove 'f' or 'F' suffix
@@ -119,7 +124,7 @@ def t_BOOLCONST(t):
     return t
 
 def t_CHARCONST(t):
-    r"\'.*?\'"
+    r"'[^'\n]*'"
     t.value = t.value[1]  # Extract the character inside the single quotes
     return t
 
@@ -147,7 +152,7 @@ def t_ID(t):
     return t
 
 def t_STRCONST(t):
-    r'\"([^"\\]|\\.)*\"'
+    r'"[^"\\]*(?:\\.[^"\\]*)*"'
     t.value = t.value[1:-1]  # Remove quotes
     return t
 #------------------------------------------------------------------
@@ -158,9 +163,20 @@ def t_NEWLINE(t):
 	r'\n+'
 	t.lexer.lineno += len(t.value)
 
+#Destino de los errores léxicos y de sintaxis en el hilo actual (ver parse._reporting); sin
+#destino van a stdout
+_diagnostics = threading.local()
+
+def report(message):
+	stream = getattr(_diagnostics, 'stream', None)
+	if stream is None:
+		print(message)
+	else:
+		stream.write(message + "\n")
+
 #Regla de manejo de errores
 def t_error(t):
-	print("Illegal character '%s'" % t.value[0])
+	report("Illegal character '%s'" % t.value[0])
 	t.lexer.skip(1)
 	
 #--------------------------------------------------------------------
@@ -169,9 +185,114 @@ def t_error(t):
 #data_file = open("./test/test_case1.txt", "r")
 #data = data_file.read()
 
+#Lexer maestro: las expresiones regulares se compilan una sola vez por proceso
 lexer = lex.lex()
 #lexer.input(data)
 
+#Lexer independiente (posición, línea y datos propios) que comparte las expresiones del maestro;
+#cada hilo o parser debe usar el suyo
+def make_lexer():
+    return lexer.clone()
+
+#Tamaño de los fragmentos leídos de un archivo y de los lotes de tokens
+CHUNK_SIZE = 64 * 1024
+BATCH_SIZE = 1024
+
+#Fragmentos de texto de una cadena, un archivo abierto o un iterador de cadenas
+def read_chunks(source, chunk_size=CHUNK_SIZE):
+    if isinstance(source, str):
+        return (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+    if hasattr(source, 'read'):
+        return iter(lambda: source.read(chunk_size), '')
+    return iter(source)
+
+#Tokens de una fuente leída por fragmentos, sin cargar el texto completo.
+#El texto se analiza hasta el último salto de línea disponible; si ahí queda abierto un comentario
+#/* o una cadena, esa parte se conserva y se vuelve a analizar cuando llega más texto (al menos el
+#doble, para que el trabajo total sea lineal). Los tokens, lexpos y lineno son los mismos que con
+#lexer.input sobre el texto completo; los caracteres ilegales se reportan al analizar cada fragmento
+class TokenStream:
+    def __init__(self, source, chunk_size=CHUNK_SIZE):
+        self._chunks = read_chunks(source, chunk_size)
+        self._lexer = make_lexer()
+        self._lexer.lexerrorf = self._error
+        self._final = False
+        self._open = None
+        self.lineno = 1
+        self._tokens = self._generate()
+
+    #Compatible con lexer.token(): siguiente token o None al terminar
+    def token(self):
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+    #Listas de hasta size tokens
+    def batches(self, size=BATCH_SIZE):
+        batch = []
+        for tok in self._tokens:
+            batch.append(tok)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    #Una comilla sin cerrar a mitad de la fuente puede ser una cadena que termina en el siguiente fragmento
+    def _error(self, t):
+        if not self._final and t.value[0] == '"':
+            self._open = (t.lexpos, t.lineno)
+            t.lexer.lexpos = t.lexer.lexlen
+        else:
+            t_error(t)
+
+    #Tokens de text hasta el final o hasta una construcción abierta; devuelve (tokens, consumido)
+    def _scan(self, text, offset):
+        lex_state = self._lexer
+        lex_state.input(text)
+        lex_state.lineno = self.lineno
+        self._open = None
+        tokens = []
+        for tok in iter(lex_state.token, None):
+            #'/' seguido de '*': el comentario no cerró dentro de text
+            if (not self._final and tok.type == 'MULT' and tokens and tokens[-1].type == 'DIVIDE'
+                    and tokens[-1].lexpos + 1 == tok.lexpos):
+                opening = tokens.pop()
+                self._open = (opening.lexpos, opening.lineno)
+                break
+            tokens.append(tok)
+        for tok in tokens:
+            tok.lexpos += offset
+        if self._open is None:
+            self.lineno = lex_state.lineno
+            return tokens, len(text)
+        position, self.lineno = self._open
+        return tokens, position
+
+    def _generate(self):
+        buffer = ''
+        offset = 0
+        need = 0
+        for chunk in self._chunks:
+            buffer += chunk
+            if len(buffer) < need:
+                continue
+            cut = buffer.rfind('\n') + 1
+            if cut:
+                tokens, consumed = self._scan(buffer[:cut], offset)
+                yield from tokens
+                buffer = buffer[consumed:]
+                offset += consumed
+            need = 2 * len(buffer) if len(buffer) > len(chunk) else 0
+        self._final = True
+        tokens, _ = self._scan(buffer, offset)
+        yield from tokens
+
+#Tokens de una fuente (cadena, archivo o iterador de fragmentos) en lotes
+def tokenize(source, batch_size=BATCH_SIZE, chunk_size=CHUNK_SIZE):
+    return TokenStream(source, chunk_size).batches(batch_size)
+
 # Tokenize para encontrar errores
 """
 while True:
@@ -0,0 +1,123 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Límites de ejecución - instrucciones, tiempo y celdas de arreglos para programas no confiables
+#ExecutionLimits son los límites configurados (None = sin límite) y LimitGuard el estado de una
+#ejecución. Los motores solo llaman al guard en los saltos hacia atrás que se toman (todo ciclo
+#pasa por uno; el código sin saltos hacia atrás está acotado por el largo del programa) y en
+#declare_array, y los ciclos en bloque de loops.py antes de cada tramo. Cada vuelta de un ciclo
+#cuenta como el largo del ciclo en cuadruplos y el reloj se consulta cada CLOCK_INTERVAL vueltas.
+#Sin límites los motores ejecutan su código normal
+
+import bisect
+import time
+
+from errors import ResourceLimitError
+
+#Saltos hacia atrás entre consultas al reloj
+CLOCK_INTERVAL = 256
+
+#Vueltas de un ciclo en bloque (loops.py) entre cobros al guard cuando hay límites
+KERNEL_CHUNK = 65536
+
+class ExecutionLimits:
+    def __init__(self, max_instructions=None, timeout=None, max_array_cells=None):
+        self.max_instructions = max_instructions
+        self.timeout = timeout
+        self.max_array_cells = max_array_cells
+
+    @property
+    def enabled(self):
+        return (self.max_instructions is not None or self.timeout is not None
+                or self.max_array_cells is not None)
+
+    def __repr__(self):
+        return (f"ExecutionLimits(max_instructions={self.max_instructions}, timeout={self.timeout}, "
+                f"max_array_cells={self.max_array_cells})")
+
+#Saltos hacia atrás de una tabla: índice del salto -> largo del ciclo (cuadruplos de una vuelta).
+#jumps son pares (índice del salto, índice destino)
+def loop_spans(jumps):
+    return {index: index - target + 1 for index, target in jumps if target <= index}
+
+#Costo por vuelta de cada loop_kernel: la suma de los saltos hacia atrás del ciclo escalar que le
+#sigue, que se toman todos en cada vuelta. Son los que llegan a su encabezado, desde la condición
+#(kernel+2) hasta el primer salto hacia atrás del ciclo (el cuerpo no tiene ciclos); los saltos
+#hacia antes del kernel son la salida a un ciclo exterior
+def kernel_spans(spans, jumps, kernels):
+    targets = dict(jumps)
+    backward = sorted(spans)
+    by_target = {}
+    for index in backward:
+        by_target[targets[index]] = by_target.get(targets[index], 0) + spans[index]
+    costs = {}
+    for kernel in kernels:
+        position = bisect.bisect_right(backward, kernel + 1)
+        while position < len(backward) and targets[backward[position]] < kernel + 2:
+            position += 1
+        first = backward[position] if position < len(backward) else kernel + 1
+        costs[kernel] = sum(by_target.get(target, 0) for target in range(kernel + 2, first + 1))
+    return costs
+
+class LimitGuard:
+    def __init__(self, limits, spans, kernels=None):
+        self.limits = limits
+        self.spans = spans
+        self.kernels = kernels if kernels is not None else {}
+        self.instructions = 0
+        self.array_cells = 0
+        self.deadline = time.perf_counter() + limits.timeout if limits.timeout is not None else None
+        self._countdown = CLOCK_INTERVAL
+
+    #Salto hacia atrás tomado en el cuadruplo index
+    def jump(self, index):
+        limits = self.limits
+        self.instructions += self.spans[index]
+        if limits.max_instructions is not None and self.instructions > limits.max_instructions:
+            raise ResourceLimitError(f"Instruction limit of {limits.max_instructions} exceeded at quadruple {index}",
+                                     index, 'instructions')
+        if self.deadline is not None:
+            self._countdown -= 1
+            if self._countdown <= 0:
+                self._countdown = CLOCK_INTERVAL
+                if time.perf_counter() > self.deadline:
+                    raise ResourceLimitError(f"Time limit of {limits.timeout} s exceeded at quadruple {index}",
+                                             index, 'time')
+
+    #Tramo de iterations vueltas de un ciclo en bloque en el cuadruplo index. Se consulta el reloj y
+    #se cobran como las vueltas del ciclo escalar; False (sin cobrar) si no alcanza el límite de
+    #instrucciones, así el ciclo escalar se detiene en la misma vuelta que sin el kernel
+    def kernel(self, index, iterations):
+        limits = self.limits
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise ResourceLimitError(f"Time limit of {limits.timeout} s exceeded at quadruple {index}",
+                                     index, 'time')
+        cost = iterations * self.kernels.get(index, 0)
+        if limits.max_instructions is not None and self.instructions + cost > limits.max_instructions:
+            return False
+        self.instructions += cost
+        return True
+
+    #Arreglo de size celdas declarado en el cuadruplo index; se verifica antes de reservarlo.
+    #Un tamaño inválido lo reporta new_array
+    def allocate(self, index, size):
+        limits = self.limits
+        if limits.max_array_cells is None or size.__class__ is not int or size <= 0:
+            return
+        self.array_cells += size
+        if self.array_cells > limits.max_array_cells:
+            raise ResourceLimitError(f"Array cell limit of {limits.max_array_cells} exceeded at quadruple {index}"
+                                     f" (declaring {size} cells, {self.array_cells} in total)", index, 'array_cells')
+
+#Guard de una ejecución o None si no hay límites; kernels son los índices de los cuadruplos loop_kernel
+def make_guard(limits, jumps, kernels=()):
+    if limits is None or not limits.enabled:
+        return None
+    jumps = list(jumps)
+    spans = loop_spans(jumps)
+    costs = kernel_spans(spans, jumps, kernels)
+    #Si la salida de un kernel queda atrás (ciclo anidado), su gototrue cuesta lo mismo que la salida
+    #del ciclo escalar (gotofalse en kernel+3)
+    for kernel in kernels:
+        if kernel + 1 in spans and kernel + 3 in spans:
+            spans[kernel + 1] = spans[kernel + 3]
+    return LimitGuard(limits, spans, costs)
@@ -0,0 +1,480 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: LoopIdioms - Reconoce ciclos for contados sobre arreglos y los baja a una operación en bloque
+#Un ciclo for de CodeGen cuyo cuerpo es un map/fill/copy (a[i] = expr) o una reducción (s = s + expr)
+#con todos los accesos en el índice i se antecede con un cuadruplo loop_kernel:
+#    (loop_kernel, kernel, None, T)   ejecuta el ciclo completo con slices/NumPy; T = True si lo hizo
+#    (gototrue, T, None, salida)
+#El ciclo escalar original se conserva justo después y se ejecuta cuando el kernel no puede
+#garantizar el mismo resultado (tipos, rangos, divisiones entre cero...), así los errores son idénticos
+
+import functools
+import operator
+from array import array
+
+from codegen import Quadruple
+from symbols import JUMPS, LOOP_KERNEL
+from arrays import FAST_ARRAYS, is_storage, numpy
+from limits import KERNEL_CHUNK
+
+_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+}
+
+#Operadores de reducción con el acumulador a la izquierda (s = s op expr) o a la derecha (s = expr op s)
+_REDUCE_LEFT = ('+', '-', '*')
+_REDUCE_RIGHT = ('+', '*')
+
+#Operaciones que NumPy calcula igual que Python sobre float64 (IEEE 754)
+_NUMPY_OPERATORS = frozenset(('+', '-', '*', '/'))
+
+_NUMERIC = frozenset((int, float, bool))
+
+#Hojas de las expresiones del cuerpo: ('elem', arreglo) = arreglo[i], ('index',) = i y
+#('value', operando) = variable invariante o constante; los nodos internos son (op, izquierda, derecha)
+_LEAVES = ('elem', 'index', 'value')
+
+def _leaves(expr):
+    if expr[0] in _LEAVES:
+        yield expr
+    else:
+        yield from _leaves(expr[1])
+        yield from _leaves(expr[2])
+
+def _operators(expr):
+    if expr[0] in _LEAVES:
+        return set()
+    return {expr[0]} | _operators(expr[1]) | _operators(expr[2])
+
+#Operandos sin repetir; (tipo, valor) para no confundir 1, 1.0 y True
+def _unique(operands):
+    seen = {}
+    for operand in operands:
+        seen.setdefault((type(operand), operand), operand)
+    return list(seen.values())
+
+def _position(operands, operand):
+    for n, other in enumerate(operands):
+        if type(other) is type(operand) and other == operand:
+            return n
+    raise ValueError(operand)
+
+#Ciclo reconocido: kind es 'map', 'fill', 'copy' o 'reduce'
+class LoopKernel:
+    def __init__(self, kind, index, bound, inclusive, target, expr, reduce_op=None, accumulator_left=True):
+        self.kind = kind
+        self.index = index
+        self.bound = bound
+        self.inclusive = inclusive
+        self.target = target
+        self.expr = expr
+        self.reduce_op = reduce_op
+        self.accumulator_left = accumulator_left
+        leaves = list(_leaves(expr))
+        self.arrays = _unique(leaf[1] for leaf in leaves if leaf[0] == 'elem')
+        self.values = _unique(leaf[1] for leaf in leaves if leaf[0] == 'value')
+        self.uses_index = any(leaf[0] == 'index' for leaf in leaves)
+        self._function = None
+
+    #Operandos leídos y variables escritas (para vivacidad y resolución de slots)
+    def reads(self):
+        return tuple(_unique([self.index, self.bound, self.target] + self.arrays + self.values))
+
+    def writes(self):
+        if self.kind == 'reduce':
+            return (self.index, self.target)
+        return (self.index,)
+
+    def _source(self, expr):
+        if expr[0] == 'elem':
+            return f"x{_position(self.arrays, expr[1])}"
+        if expr[0] == 'index':
+            return "i"
+        if expr[0] == 'value':
+            return f"k{_position(self.values, expr[1])}"
+        return f"({self._source(expr[1])} {expr[0]} {self._source(expr[2])})"
+
+    def _text(self, expr):
+        if expr[0] == 'elem':
+            return f"{expr[1]}[{self.index}]"
+        if expr[0] == 'index':
+            return self.index
+        if expr[0] == 'value':
+            return expr[1] if isinstance(expr[1], str) else repr(expr[1])
+        return f"({self._text(expr[1])} {expr[0]} {self._text(expr[2])})"
+
+    def __repr__(self):
+        condition = f"{self.index} {'<=' if self.inclusive else '<'} {self.bound}"
+        expr = self._text(self.expr)
+        if self.kind != 'reduce':
+            body = f"{self.target}[{self.index}] = {expr}"
+        elif self.accumulator_left:
+            body = f"{self.target} = {self.target} {self.reduce_op} {expr}"
+        else:
+            body = f"{self.target} = {expr} {self.reduce_op} {self.target}"
+        return f"{self.kind}[{body} while {condition}]"
+
+    #Función compilada una vez: lista con el valor de la expresión para cada i en [start, stop)
+    def function(self):
+        if self._function is None:
+            segments = [f"s{n}" for n in range(len(self.arrays))]
+            elements = [f"x{n}" for n in range(len(self.arrays))]
+            values = [f"k{n}" for n in range(len(self.values))]
+            params = ", ".join(["start", "stop"] + segments + values)
+            body = self._source(self.expr)
+            if segments:
+                loop = f"for {', '.join(['i'] + elements)} in zip(range(start, stop), {', '.join(segments)})"
+                result = f"[{body} {loop}]"
+            elif self.uses_index:
+                result = f"[{body} for i in range(start, stop)]"
+            else:
+                #Expresión invariante: se evalúa una vez (el ciclo escalar daría el mismo valor cada vez)
+                result = f"[{body}] * (stop - start)"
+            namespace = {}
+            exec(compile(f"def values({params}):\n    return {result}\n", f"<{self!r}>", 'exec'), namespace)
+            self._function = namespace['values']
+        return self._function
+
+    #Versión con los operandos resueltos a slots de un frame (ver symbols.resolve)
+    def bind(self, operand):
+        return BoundKernel(self, operand)
+
+class BoundKernel:
+    def __init__(self, kernel, operand):
+        self.kernel = kernel
+        self.index = operand(kernel.index)
+        self.bound = operand(kernel.bound)
+        self.target = operand(kernel.target)
+        self.arrays = [operand(name) for name in kernel.arrays]
+        self.values = [operand(value) for value in kernel.values]
+        self.read_slots = [operand(name) for name in kernel.reads()]
+        self.write_slots = [operand(name) for name in kernel.writes()]
+
+    def __repr__(self):
+        return repr(self.kernel)
+
+    #Ejecuta el ciclo completo sobre el frame; False si debe correr el ciclo escalar (desde el índice
+    #que quede en el frame). Con guard (limits.LimitGuard) corre en tramos de KERNEL_CHUNK vueltas y
+    #cada tramo se cobra antes de ejecutarlo; quad es el índice del cuadruplo loop_kernel
+    def run(self, frame, guard=None, quad=None):
+        kernel = self.kernel
+        start = frame[self.index]
+        bound = frame[self.bound]
+        if start.__class__ is not int or bound.__class__ is not int:
+            return False
+        stop = bound + 1 if kernel.inclusive else bound
+        if stop <= start:
+            return True
+
+        arrays = [frame[slot] for slot in self.arrays]
+        for storage in arrays:
+            if not is_storage(storage) or start < 0 or stop > len(storage):
+                return False
+        values = [frame[slot] for slot in self.values]
+        if not _NUMERIC.issuperset(map(type, values)):
+            return False
+
+        if guard is None:
+            return self._run_range(frame, arrays, values, start, stop)
+        #Un tramo que no corre deja el índice al inicio del tramo y lo anterior ya aplicado: el ciclo
+        #escalar sigue desde ahí con el mismo resultado
+        while start < stop:
+            end = min(stop, start + KERNEL_CHUNK)
+            if not guard.kernel(quad, end - start) or not self._run_range(frame, arrays, values, start, end):
+                return False
+            start = end
+        return True
+
+    #Vueltas start..stop-1; False (sin modificar nada) si deben correr en el ciclo escalar
+    def _run_range(self, frame, arrays, values, start, stop):
+        kernel = self.kernel
+        if kernel.kind == 'reduce':
+            accumulator = frame[self.target]
+            if accumulator.__class__ not in _NUMERIC:
+                return False
+            result = self._reduce_numpy(arrays, values, start, stop, accumulator)
+            if result is None:
+                terms = self._values(arrays, values, start, stop)
+                if terms is None:
+                    return False
+                #Con el acumulador a la derecha solo hay + y *, conmutativos en int y float
+                try:
+                    result = functools.reduce(_OPERATORS[kernel.reduce_op], terms, accumulator)
+                except ArithmeticError:
+                    return False
+            frame[self.target] = result
+        else:
+            target = frame[self.target]
+            if not is_storage(target) or start < 0 or stop > len(target):
+                return False
+            if not self._map_numpy(target, arrays, values, start, stop):
+                terms = self._values(arrays, values, start, stop)
+                if terms is None or not _assign(target, start, stop, terms):
+                    return False
+
+        frame[self.index] = stop
+        return True
+
+    #Valores de la expresión en Python (mismas operaciones que el ejecutor escalar)
+    def _values(self, arrays, values, start, stop):
+        segments = []
+        for storage in arrays:
+            segment = storage[start:stop]
+            if storage.__class__ is list:
+                if not _NUMERIC.issuperset(map(type, segment)):
+                    return None
+            elif storage.__class__ not in FAST_ARRAYS:
+                segment = segment.tolist()
+            segments.append(segment)
+        try:
+            return self.kernel.function()(start, stop, *segments, *values)
+        except ArithmeticError:
+            return None
+
+    #Camino NumPy: solo arreglos float64, valores float y + - * /, donde el resultado es idéntico
+    def _numpy_terms(self, arrays, values, start, stop):
+        kernel = self.kernel
+        if (numpy is None or not arrays or kernel.uses_index
+                or not _operators(kernel.expr) <= _NUMPY_OPERATORS
+                or any(value.__class__ is not float for value in values)
+                or any(storage.__class__ is not numpy.ndarray or storage.dtype != numpy.float64
+                       for storage in arrays)):
+            return None
+        segments = [storage[start:stop] for storage in arrays]
+
+        def evaluate(expr):
+            if expr[0] == 'elem':
+                return segments[_position(kernel.arrays, expr[1])]
+            if expr[0] == 'value':
+                return values[_position(kernel.values, expr[1])]
+            left = evaluate(expr[1])
+            right = evaluate(expr[2])
+            if expr[0] == '/' and numpy.any(right == 0):
+                raise ZeroDivisionError
+            return _OPERATORS[expr[0]](left, right)
+
+        try:
+            with numpy.errstate(all='ignore'):
+                return evaluate(kernel.expr)
+        except ZeroDivisionError:
+            return None
+
+    def _map_numpy(self, target, arrays, values, start, stop):
+        if numpy is None or target.__class__ is not numpy.ndarray or target.dtype != numpy.float64:
+            return False
+        terms = self._numpy_terms(arrays, values, start, stop)
+        if terms is None:
+            return False
+        target[start:stop] = terms
+        return True
+
+    #Reducción con NumPy: accumulate suma en orden como el ciclo (numpy.sum suma por pares)
+    def _reduce_numpy(self, arrays, values, start, stop, accumulator):
+        if accumulator.__class__ is not float:
+            return None
+        terms = self._numpy_terms(arrays, values, start, stop)
+        if terms is None:
+            return None
+        ufunc = {'+': numpy.add, '-': numpy.subtract, '*': numpy.multiply}[self.kernel.reduce_op]
+        with numpy.errstate(all='ignore'):
+            sequence = numpy.concatenate(([accumulator], numpy.broadcast_to(terms, (stop - start,))))
+            return ufunc.accumulate(sequence)[-1].item()
+
+#Escritura en bloque con las mismas reglas de tipo que arrays.store; False si algún valor no cabe
+def _assign(target, start, stop, terms):
+    if target.__class__ is list:
+        target[start:stop] = terms
+        return True
+    typecode = target.typecode if target.__class__ is array else ('q' if target.dtype.kind == 'i' else 'd')
+    #array() rechaza float en 'q', enteros fuera de 64 bits y valores no numéricos
+    try:
+        checked = array(typecode, terms)
+    except (TypeError, OverflowError):
+        return False
+    if target.__class__ is not array:
+        checked = numpy.frombuffer(checked, dtype=target.dtype)
+    target[start:stop] = checked
+    return True
+
+#Pase de reconocimiento sobre los cuadruplos de CodeGen (antes de Optimizer)
+class LoopIdioms:
+    def __init__(self, quadruples, temp_count):
+        self.quadruples = quadruples
+        self.temps = {f"T{i}" for i in range(temp_count)}
+        self.temp_count = temp_count
+        self.kernels = []
+
+    def temp_gen(self):
+        temp = f"T{self.temp_count}"
+        self.temps.add(temp)
+        self.temp_count += 1
+        return temp
+
+    def lower(self):
+        quads = self.quadruples
+        sources = {}
+        for i, quad in enumerate(quads):
+            if quad.operator in JUMPS:
+                sources.setdefault(quad.result, []).append(i)
+
+        #Posición de la condición del ciclo -> (kernel, salida del ciclo)
+        found = {}
+        for i in range(len(quads)):
+            match = self._match(quads, i, sources)
+            if match is not None:
+                found[i] = match
+        if not found:
+            return quads
+
+        #Cada kernel agrega 2 cuadruplos antes de la condición; un salto a la condición
+        #(la vuelta del ciclo) sigue llegando a la condición, ahora más adelante
+        positions = sorted(found)
+        def shifted(target):
+            return target + 2 * sum(1 for position in positions if position <= target)
+
+        result = []
+        for i, quad in enumerate(quads):
+            if i in found:
+                kernel, exit_index = found[i]
+                flag = self.temp_gen()
+                result.append(Quadruple(LOOP_KERNEL, kernel, None, flag, quad.lineno))
+                result.append(Quadruple('gototrue', flag, None, shifted(exit_index), quad.lineno))
+                self.kernels.append(kernel)
+            if quad.operator in JUMPS:
+                quad = Quadruple(quad.operator, quad.arg1, quad.arg2, shifted(quad.result), quad.lineno)
+            result.append(quad)
+        return result
+
+    def _is_variable(self, arg):
+        return isinstance(arg, str) and arg not in self.temps
+
+    #Forma exacta del ciclo for de CodeGen con la condición en la posición i:
+    #  i   (<, idx, bound, Tc)          i+4 (=, idx, None, idx)
+    #  i+1 (=, Tc, None, Tk)            i+5 (+, idx, 1, idx)
+    #  i+2 (gotofalse, Tk, None, exit)  i+6 (goto, None, None, i)
+    #  i+3 (gototrue, Tk, None, i+7)    i+7 ... cuerpo ...; exit-1 (goto, None, None, i+4)
+    def _match(self, quads, i, sources):
+        if i + 8 > len(quads):
+            return None
+        cond, copy, false_jump, true_jump, touch, increment, back = quads[i:i + 7]
+        index, bound = cond.arg1, cond.arg2
+        if not (cond.operator in ('<', '<=') and self._is_variable(index) and cond.result in self.temps):
+            return None
+        if not (self._is_variable(bound) or type(bound) is int) or bound == index:
+            return None
+        body_start = i + 7
+        exit_index = false_jump.result
+        if not (copy.operator == '=' and copy.arg1 == cond.result and copy.result in self.temps
+                and false_jump.operator == 'gotofalse' and false_jump.arg1 == copy.result
+                and true_jump.operator == 'gototrue' and true_jump.arg1 == copy.result
+                and true_jump.result == body_start
+                and touch.operator == '=' and touch.arg1 == index and touch.result == index
+                and increment.operator == '+' and increment.arg1 == index and type(increment.arg2) is int
+                and increment.arg2 == 1 and increment.result == index
+                and back.operator == 'goto' and back.result == i
+                and body_start + 1 < exit_index <= len(quads)):
+            return None
+        closing = quads[exit_index - 1]
+        if not (closing.operator == 'goto' and closing.result == i + 4):
+            return None
+
+        #Solo los saltos propios del ciclo llegan a su interior
+        own = {i + 2, i + 3, i + 6, exit_index - 1}
+        for target in range(i + 1, exit_index):
+            if any(source not in own for source in sources.get(target, ())):
+                return None
+
+        kernel = self._match_body(quads[body_start:exit_index - 1], index, bound, cond.operator == '<=')
+        if kernel is None:
+            return None
+        return kernel, exit_index
+
+    #Cuerpo: cuadruplos de expresión sobre temporales seguidos de a[i] = T o de (op, s, T, R) (=, R, None, s)
+    def _match_body(self, body, index, bound, inclusive):
+        temps = self.temps
+        expressions = {}
+        used = set()
+
+        #Cada temporal del cuerpo se define y se usa una sola vez
+        def leaf(arg):
+            if isinstance(arg, str) and arg in temps:
+                if arg not in expressions or arg in used:
+                    return None
+                used.add(arg)
+                return expressions[arg]
+            if arg is None:
+                return None
+            if isinstance(arg, str) and arg == index:
+                return ('index',)
+            return ('value', arg)
+
+        last = body[-1]
+        expression_quads = body[:-1]
+        reduction = last.operator == '=' and self._is_variable(last.result) and len(body) >= 2
+        if reduction:
+            combine = expression_quads.pop()
+        elif last.operator != 'array_assign':
+            return None
+
+        for quad in expression_quads:
+            op = quad.operator
+            if quad.result not in temps or quad.result in expressions:
+                return None
+            if op == 'array_access':
+                if not (self._is_variable(quad.arg1) and quad.arg1 not in (index, bound)
+                        and isinstance(quad.arg2, str) and quad.arg2 == index):
+                    return None
+                expressions[quad.result] = ('elem', quad.arg1)
+            elif op in _OPERATORS:
+                left = leaf(quad.arg1)
+                right = leaf(quad.arg2)
+                if left is None or right is None:
+                    return None
+                expressions[quad.result] = (op, left, right)
+            elif op == '=':
+                value = leaf(quad.arg1)
+                if value is None:
+                    return None
+                expressions[quad.result] = value
+            else:
+                return None
+
+        if reduction:
+            accumulator = last.result
+            if not (combine.operator in _OPERATORS and combine.result in temps
+                    and combine.result not in expressions and last.arg1 == combine.result
+                    and accumulator not in (index, bound)):
+                return None
+            if combine.arg1 == accumulator and type(combine.arg1) is str and combine.operator in _REDUCE_LEFT:
+                accumulator_left, expr = True, leaf(combine.arg2)
+            elif combine.arg2 == accumulator and type(combine.arg2) is str and combine.operator in _REDUCE_RIGHT:
+                accumulator_left, expr = False, leaf(combine.arg1)
+            else:
+                return None
+            if expr is None or used != set(expressions):
+                return None
+            if any(leaf_expr[0] != 'index' and leaf_expr[1] == accumulator for leaf_expr in _leaves(expr)):
+                return None
+            return LoopKernel('reduce', index, bound, inclusive, accumulator, expr,
+                              combine.operator, accumulator_left)
+
+        target = last.arg1
+        if not (self._is_variable(target) and target not in (index, bound)
+                and isinstance(last.arg2, str) and last.arg2 == index):
+            return None
+        expr = leaf(last.result)
+        if expr is None or used != set(expressions):
+            return None
+        if any(leaf_expr[0] == 'value' and leaf_expr[1] == target for leaf_expr in _leaves(expr)):
+            return None
+        if expr[0] == 'value':
+            kind = 'fill'
+        elif expr[0] == 'elem':
+            kind = 'copy'
+        else:
+            kind = 'map'
+        return LoopKernel(kind, index, bound, inclusive, target, expr)
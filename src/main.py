@@ -1,41 +1,111 @@
 # Autor: Andrea Catalina Fernández Mena A01197705
 # Fecha: 20/05/2024
 # Descripción: Main - Manda a llamar todos los pasos anteriores del compilador y ejecuta
+#Acepta varios archivos o directorios; con más de uno se compilan en paralelo (ver driver.py)
 
-from parse import run_parse
-from codegen import CodeGen
-from interpreter import IR_Interpret
-from semantic import SemanticExecuter,SemanticError
+import argparse
+import sys
 
-data_file = open("./test/test_case5.txt", "r")
-data = data_file.read()
+from arrays import BACKENDS, DEFAULT_BACKEND
+from driver import ENGINES, CompileOptions, collect_sources, run_batch
+from fastlex import LEXERS
+from instrument import to_json
+from limits import ExecutionLimits
 
-result = run_parse(data)
+def build_argparser():
+    argparser = argparse.ArgumentParser(description="Compilador de C# con PLY")
+    argparser.add_argument('sources', nargs='*', default=["./test/test_case5.txt"],
+                           help="archivos fuente, archivos de IR precompilado (.csir) o directorios")
+    argparser.add_argument('-O', dest='optimize', action='store_true', help="optimizar los cuadruplos")
+    argparser.add_argument('--engine', choices=sorted(ENGINES), default='vm',
+                           help="motor de ejecución: máquina virtual de bytecode o código Python generado")
+    argparser.add_argument('--arrays', choices=BACKENDS, default=DEFAULT_BACKEND,
+                           help="almacenamiento de arreglos: módulo array, NumPy o listas")
+    argparser.add_argument('--lexer', choices=sorted(LEXERS), default='ply',
+                           help="lexer: PLY (lexer.py) o el de tabla con una sola expresión (fastlex.py)")
+    argparser.add_argument('-j', '--jobs', type=int, default=None,
+                           help="procesos para compilar varios archivos (por omisión, uno por núcleo)")
+    argparser.add_argument('--no-ast', action='store_true', help="no imprimir el AST")
+    argparser.add_argument('--no-ir', action='store_true', help="no imprimir los cuadruplos")
+    argparser.add_argument('--no-pseudo', action='store_true', help="no imprimir el pseudocódigo")
+    argparser.add_argument('-q', '--quiet', action='store_true', help="no imprimir ningún volcado")
+    argparser.add_argument('--no-exec', action='store_true', help="solo compilar, sin ejecutar")
+    argparser.add_argument('--emit-ir', action='store_true',
+                           help="guardar los cuadruplos finales de cada fuente en <fuente>.csir")
+    argparser.add_argument('--no-cache', action='store_true',
+                           help="no usar el cache en disco del AST y los cuadruplos")
+    argparser.add_argument('--profile', action='store_true',
+                           help="reporte JSON de tiempos por fase y contadores (tokens, nodos, cuadruplos, instrucciones)")
+    argparser.add_argument('--profile-memory', action='store_true',
+                           help="incluir en el reporte la memoria asignada por fase (tracemalloc, más lento)")
+    argparser.add_argument('--profile-output', metavar='FILE', default=None,
+                           help="archivo del reporte JSON (por omisión, stderr)")
+    argparser.add_argument('--exec-profile', action='store_true',
+                           help="perfil de la ejecución: ejecuciones y tiempo por cuadruplo, operador y línea fuente")
+    argparser.add_argument('--exec-profile-top', metavar='N', type=int, default=10,
+                           help="entradas de cada tabla del reporte de puntos calientes")
+    argparser.add_argument('--exec-profile-stacks', metavar='FILE', default=None,
+                           help="guardar las pilas colapsadas del perfil (formato de flamegraph.pl)")
+    argparser.add_argument('--max-instructions', metavar='N', type=int, default=None,
+                           help="límite de cuadruplos ejecutados por programa (contados por vuelta de ciclo)")
+    argparser.add_argument('--timeout', metavar='SECONDS', type=float, default=None,
+                           help="límite de tiempo de ejecución por programa")
+    argparser.add_argument('--max-array-cells', metavar='N', type=int, default=None,
+                           help="límite del total de celdas de los arreglos declarados por programa")
+    return argparser
 
-#Imprimir AST
-print("Parsed expression as AST(Abstract Syntax Tree): ")
-print(result , '\n')
+def main(argv=None):
+    args = build_argparser().parse_args(argv)
+    options = CompileOptions(
+        optimize=args.optimize,
+        engine=args.engine,
+        arrays=args.arrays,
+        execute=not args.no_exec,
+        show_ast=not (args.quiet or args.no_ast),
+        show_ir=not (args.quiet or args.no_ir),
+        show_pseudo=not (args.quiet or args.no_pseudo),
+        cache=not args.no_cache,
+        emit_ir=args.emit_ir,
+        lexer=args.lexer,
+        profile=args.profile or args.profile_output is not None,
+        profile_memory=args.profile_memory,
+        exec_profile=args.exec_profile or args.exec_profile_stacks is not None,
+        limits=ExecutionLimits(args.max_instructions, args.timeout, args.max_array_cells),
+    )
+    sources = collect_sources(args.sources)
 
-#CodeGen - Cuadruplos
-print("From the AST we generate the following IR/Quadruples: ")
-quad_gen = CodeGen(result)
-quadruples = quad_gen.generate()
+    #Un solo archivo se compila en este proceso y su salida va directo a stdout
+    single = len(sources) == 1
+    failed = 0
+    reports = []
+    stacks = []
+    for result in run_batch(sources, options, args.jobs, stream=sys.stdout if single else None):
+        if result.profile is not None:
+            reports.append(result.profile)
+        if not single:
+            sys.stdout.write(f"==> {result.path} <==\n")
+            sys.stdout.write(result.output)
+            sys.stdout.flush()
+        if result.exec_profile is not None:
+            sys.stderr.write(result.exec_profile.report(args.exec_profile_top))
+            stacks.append(result.exec_profile.collapsed())
+        if result.diagnostics:
+            sys.stderr.write(result.diagnostics)
+        if not result.ok:
+            failed += 1
+            sys.stderr.write(f"{result.path}: {result.error}\n")
+        sys.stderr.flush()
 
-counter = 0
-for quad in quadruples:
-    print(f"L{counter}", quad)
-    counter += 1
+    if options.profile:
+        if args.profile_output is None:
+            sys.stderr.write(to_json(reports) + "\n")
+        else:
+            with open(args.profile_output, 'w') as report_file:
+                report_file.write(to_json(reports) + "\n")
+    if args.exec_profile_stacks is not None:
+        with open(args.exec_profile_stacks, 'w') as stacks_file:
+            stacks_file.write(''.join(stacks))
+    return 1 if failed else 0
 
-print('\n')
-
-print("Which are represented on pseucode as: ")
-interpreter = IR_Interpret(quadruples)
-pseudo_code = interpreter.interpret()
-print(pseudo_code)
-
-print('\n')
-
-print('-----------------------------------------------------------------------------')
-print('Program Execution and Evaluation:')
-semantic_analyzer = SemanticExecuter()
-semantic_analyzer.interpret(quadruples)
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,270 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Optimizer - Optimizaciones sobre los cuadruplos entre CodeGen y la ejecución
+#Plegado de constantes, propagación de constantes y saltos condicionales con condición constante,
+#limpieza del flujo de control (saltos encadenados, código inalcanzable y copias redundantes)
+
+import operator
+
+from codegen import Quadruple
+from symbols import WRITES_RESULT, JUMPS, LOOP_KERNEL
+from cfg import CFG, reads, writes
+
+_FOLDABLE = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+_ARITHMETIC = ('+', '-', '*', '/', '%')
+
+_NUMERIC = (int, float, bool)
+
+#Elimina los cuadruplos marcados y reajusta los destinos de los saltos:
+#un salto a un cuadruplo eliminado pasa al siguiente que se conserva
+def compact(quadruples, removed):
+    kept_before = [0] * (len(quadruples) + 1)
+    count = 0
+    for i in range(len(quadruples)):
+        kept_before[i] = count
+        if i not in removed:
+            count += 1
+    kept_before[len(quadruples)] = count
+
+    result = []
+    for i, quad in enumerate(quadruples):
+        if i in removed:
+            continue
+        if quad.operator in JUMPS:
+            target = kept_before[min(quad.result, len(quadruples))]
+            quad = Quadruple(quad.operator, quad.arg1, quad.arg2, target, quad.lineno)
+        result.append(quad)
+    return result
+
+class Optimizer:
+    def __init__(self, quadruples, temp_count):
+        self.quadruples = quadruples
+        self.temps = {f"T{i}" for i in range(temp_count)}
+        self.removed = 0
+
+    def optimize(self):
+        before = len(self.quadruples)
+        quads = self.fold_constants(self.quadruples)
+        quads = self.remove_dead_temps(quads)
+        quads = self.cleanup(quads)
+        self.removed += before - len(quads)
+        return quads
+
+    #Nombres que algún cuadruplo escribe; cualquier otra cadena es una constante
+    def _variables(self, quads):
+        names = set()
+        for quad in quads:
+            names.update(writes(quad))
+        return names
+
+    #Plegado y propagación hacia adelante; el conocimiento se descarta en cada destino de salto
+    def fold_constants(self, quads):
+        variables = self._variables(quads)
+        targets = {quad.result for quad in quads if quad.operator in JUMPS}
+
+        def is_constant(arg):
+            return not (isinstance(arg, str) and arg in variables)
+
+        known = {}
+        def value(arg):
+            if isinstance(arg, str) and arg in known:
+                return known[arg]
+            return arg
+
+        result = []
+        removed = set()
+        for i, quad in enumerate(quads):
+            if i in targets:
+                known.clear()
+            op = quad.operator
+
+            if op in JUMPS:
+                condition = value(quad.arg1)
+                quad = Quadruple(op, condition, quad.arg2, quad.result, quad.lineno)
+                if op != 'goto' and is_constant(condition):
+                    if bool(condition) == (op == 'gototrue'):
+                        quad = Quadruple('goto', None, None, quad.result, quad.lineno)
+                    else:
+                        removed.add(i)
+                if quad.operator == 'goto':
+                    known.clear()
+
+            elif op == '=':
+                source = value(quad.arg1)
+                quad = Quadruple(op, source, None, quad.result, quad.lineno)
+                if is_constant(source):
+                    known[quad.result] = source
+                else:
+                    known.pop(quad.result, None)
+
+            elif op in _FOLDABLE:
+                left = value(quad.arg1)
+                right = value(quad.arg2)
+                quad = Quadruple(op, left, right, quad.result, quad.lineno)
+                folded = self._fold(op, left, right) if is_constant(left) and is_constant(right) else None
+                if folded is not None:
+                    quad = Quadruple('=', folded[0], None, quad.result, quad.lineno)
+                    known[quad.result] = folded[0]
+                else:
+                    known.pop(quad.result, None)
+
+            elif op == 'declare_array':
+                known.pop(quad.arg2, None)
+
+            elif op == 'array_access':
+                quad = Quadruple(op, quad.arg1, value(quad.arg2), quad.result, quad.lineno)
+                known.pop(quad.result, None)
+
+            elif op == 'array_assign':
+                quad = Quadruple(op, quad.arg1, value(quad.arg2), value(quad.result), quad.lineno)
+
+            elif op in ('write', 'writeln'):
+                quad = Quadruple(op, value(quad.arg1), quad.arg2, quad.result, quad.lineno)
+
+            elif op == LOOP_KERNEL:
+                for name in writes(quad):
+                    known.pop(name, None)
+
+            result.append(quad)
+
+        return compact(result, removed)
+
+    #Evalúa como lo haría el ejecutor; no pliega si en ejecución habría un error
+    def _fold(self, op, left, right):
+        if op in _ARITHMETIC:
+            if not (isinstance(left, _NUMERIC) and isinstance(right, _NUMERIC)):
+                return None
+        try:
+            return (_FOLDABLE[op](left, right),)
+        except (ArithmeticError, TypeError):
+            return None
+
+    #Elimina copias (=) a temporales que ya nadie lee
+    def remove_dead_temps(self, quads):
+        read = set()
+        for quad in quads:
+            read.update(arg for arg in reads(quad) if isinstance(arg, str))
+
+        removed = {i for i, quad in enumerate(quads)
+                   if quad.operator == '=' and quad.result in self.temps and quad.result not in read}
+        return compact(quads, removed)
+
+    #Limpieza del flujo de control hasta que ya no haya cambios
+    def cleanup(self, quads):
+        while True:
+            size = len(quads)
+            quads = self.thread_jumps(quads)
+            quads = self.remove_unreachable(quads)
+            quads = self.remove_redundant_copies(quads)
+            if len(quads) == size:
+                return quads
+
+    #Destino final de una cadena de goto
+    def _final_target(self, quads, target):
+        seen = set()
+        while target < len(quads) and quads[target].operator == 'goto' and target not in seen:
+            seen.add(target)
+            target = quads[target].result
+        return target
+
+    #Saltos encadenados, saltos al siguiente cuadruplo y pares gotofalse/gototrue sobre la misma condición
+    def thread_jumps(self, quads):
+        targets = {quad.result for quad in quads if quad.operator in JUMPS}
+        result = []
+        removed = set()
+        for i, quad in enumerate(quads):
+            if quad.operator in JUMPS:
+                previous = quads[i - 1] if i > 0 else None
+                #Solo se llega por el camino en que el salto anterior no se tomó: la condición ya se conoce
+                if (quad.operator in ('gotofalse', 'gototrue') and i not in targets and previous is not None
+                        and previous.operator in ('gotofalse', 'gototrue') and previous.operator != quad.operator
+                        and previous.arg1 == quad.arg1 and type(previous.arg1) is type(quad.arg1)):
+                    quad = Quadruple('goto', None, None, quad.result, quad.lineno)
+                target = self._final_target(quads, quad.result)
+                if target == i + 1:
+                    removed.add(i)
+                quad = Quadruple(quad.operator, quad.arg1, quad.arg2, target, quad.lineno)
+            result.append(quad)
+        return compact(result, removed)
+
+    #Cuadruplos de bloques a los que no se llega desde el inicio del programa
+    def remove_unreachable(self, quads):
+        if not quads:
+            return quads
+        graph = CFG(quads)
+        reachable = graph.reachable()
+        removed = set()
+        for block in graph.blocks:
+            if block.index not in reachable:
+                removed.update(range(block.start, block.start + len(block.quads)))
+        return compact(quads, removed)
+
+    #Copias redundantes:
+    #  x = x desaparece
+    #  T = a op b; v = T  ->  v = a op b, si T solo se usa en la copia
+    #  T_c = cond; T_k = T_c; gotofalse T_k (copia de condición de CodeGen): si T_c solo se usa
+    #  en la copia y T_k solo justo después (sin destinos de salto de por medio), se usa T_c
+    def remove_redundant_copies(self, quads):
+        targets = {quad.result for quad in quads if quad.operator in JUMPS}
+        definitions = {}
+        uses = {}
+        for i, quad in enumerate(quads):
+            for arg in writes(quad):
+                definitions.setdefault(arg, []).append(i)
+            for arg in reads(quad):
+                if isinstance(arg, str):
+                    uses.setdefault(arg, []).append(i)
+
+        rename = {}
+        retarget = {}
+        removed = set()
+        for i, quad in enumerate(quads):
+            if quad.operator != '=' or not isinstance(quad.arg1, str):
+                continue
+            if quad.arg1 == quad.result:
+                removed.add(i)
+                continue
+            source, copy = quad.arg1, quad.result
+            #T = a op b; v = T  ->  v = a op b
+            if (source in self.temps and i not in targets and definitions.get(source) == [i - 1]
+                    and uses.get(source) == [i] and i - 1 not in removed and i - 1 not in retarget
+                    and quads[i - 1].operator in WRITES_RESULT):
+                retarget[i - 1] = copy
+                removed.add(i)
+                continue
+            if (source in self.temps and copy in self.temps and source not in rename
+                    and definitions.get(source, [None])[0] is not None and len(definitions[source]) == 1
+                    and definitions[source][0] < i and uses.get(source) == [i]
+                    and definitions[copy] == [i] and uses.get(copy)):
+                last = uses[copy][-1]
+                if uses[copy][0] > i and not any(j in targets for j in range(i + 1, last + 1)):
+                    rename[copy] = source
+                    removed.add(i)
+
+        if not rename and not retarget:
+            return compact(quads, removed)
+
+        result = []
+        for i, quad in enumerate(quads):
+            if i in retarget:
+                quad = Quadruple(quad.operator, quad.arg1, quad.arg2, retarget[i], quad.lineno)
+            if quad.operator in JUMPS:
+                quad = Quadruple(quad.operator, rename.get(quad.arg1, quad.arg1), quad.arg2, quad.result, quad.lineno)
+            else:
+                quad = Quadruple(quad.operator, *(rename.get(arg, arg) if isinstance(arg, str) else arg
+                                                  for arg in (quad.arg1, quad.arg2, quad.result)), quad.lineno)
+            result.append(quad)
+        return compact(result, removed)
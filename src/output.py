@@ -0,0 +1,76 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Salida de los ejecutores - destinos intercambiables para write/writeln
+#Los ejecutores escriben el texto ya formateado (str(valor), más '\n' en writeln) en un
+#destino que junta las escrituras y las vuelca de una vez al final o al pasar un umbral
+
+import io
+import sys
+
+#Tamaño del texto acumulado a partir del cual se vuelca al destino
+DEFAULT_THRESHOLD = 64 * 1024
+
+#Acumula las escrituras en una lista y las vuelca juntas a un stream.
+#Sin stream se usa el sys.stdout del momento del volcado (respeta redirect_stdout)
+class BufferedOutput:
+    def __init__(self, stream=None, threshold=DEFAULT_THRESHOLD):
+        self.stream = stream
+        self.threshold = threshold
+        self._parts = []
+        self._size = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.threshold:
+            self.flush()
+
+    def flush(self):
+        stream = self.stream if self.stream is not None else sys.stdout
+        if self._parts:
+            stream.write(''.join(self._parts))
+            self._parts = []
+            self._size = 0
+        stream.flush()
+
+    def close(self):
+        self.flush()
+
+#Salida en memoria; getvalue() devuelve todo lo escrito
+class StringOutput(BufferedOutput):
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        super().__init__(io.StringIO(), threshold)
+
+    def getvalue(self):
+        self.flush()
+        return self.stream.getvalue()
+
+#Salida a un archivo abierto con un buffer grande
+class FileOutput(BufferedOutput):
+    def __init__(self, path, buffer_size=1024 * 1024, threshold=DEFAULT_THRESHOLD):
+        super().__init__(open(path, 'w', buffering=buffer_size), threshold)
+
+    def close(self):
+        self.flush()
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+#Guarda cada escritura por separado (pruebas): writes es la lista de textos en orden
+class CaptureOutput:
+    def __init__(self):
+        self.writes = []
+        self.write = self.writes.append
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def getvalue(self):
+        return ''.join(self.writes)
@@ -2,8 +2,19 @@
 # Fecha: 20/05/2024
 # Descripción: Parser - Consume tokens del lexer y construye AST(Abstract Syntax Tree)
 
+import contextlib
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
 import ply.yacc as yacc
 from lexer import *
+from lexer import _diagnostics
+from fastlex import LEXERS
+from astnodes import *
 
 # Precedencia y asociatividad de los operadores
 precedence = (
@@ -15,20 +26,25 @@ precedence = (
     ('left', 'AND', 'OR')
 )
 
+# Línea de un símbolo: la del token, o la del nodo si es un no terminal
+def _lineno(p, n):
+    return p.lineno(n) or getattr(p[n], 'lineno', 0)
+
 # Declarar estructura del código
 def p_programstart(p):
     'programstart : PROGRAM ID LBRACE code RBRACE'
-    p[0] = ('programstart', p[2], p[4])
+    p[0] = Program(p[2], p[4], lineno=p.lineno(1))
 
 # Una sola línea de código
 def p_code_singleline(p):
     'code : statement'
-    p[0] = (p[1],)
+    p[0] = [p[1]]
 
-# Múltiples líneas de código
+# Múltiples líneas de código - se agrega a la misma lista (O(1) amortizado por sentencia)
 def p_code_multiple(p):
     'code : code statement'
-    p[0] = p[1] + (p[2],)
+    p[1].append(p[2])
+    p[0] = p[1]
 
 #--------------------------------------------------------------
 # Declaración y asignación de variables
@@ -45,39 +61,39 @@ def p_statement_variables(p):
                  | writeln_statement
                  | break_statement
                  | return_statement'''
-    p[0] = ('statement', p[1])
+    p[0] = Statement(p[1], lineno=_lineno(p, 1))
 
 # Declarar variables
 def p_declaration(p):
     'declaration : datatype declareid'
-    p[0] = ('declaration', p[1], p[2])
+    p[0] = Declaration(p[1], p[2], lineno=p[1].lineno)
 
 # Declarar múltiples variables
 def p_declareid_single(p):
     'declareid : ID'
-    p[0] = ('declareid_single', p[1])
+    p[0] = DeclareSingle(p[1], lineno=p.lineno(1))
     
 # Variable nombre con data
 def p_declareid_singlev(p):
     'declareid : assignment'
-    p[0] = ('declareid_single_d', p[1])
+    p[0] = DeclareSingleValue(p[1], lineno=p[1].lineno)
 
 # Múltiples variables en la misma línea - solo nombre
 def p_declareid_multiple(p):
     'declareid : declareid COMMA ID'
-    p[0] = ('declareid_multiple', p[1], p[3])
+    p[0] = DeclareMultiple(p[1], p[3], lineno=p[1].lineno)
     
 # Múltiples variables en la misma línea - nombre y data
 def p_declareid_multiplev(p):
     'declareid : declareid COMMA assignment'
-    p[0] = ('declareid_multiple_d', p[1], p[3])
+    p[0] = DeclareMultipleValue(p[1], p[3], lineno=p[1].lineno)
     
 # Asignación números, operaciones, booleanos, strings, chars
 def p_assignment(p):
     '''assignment : ID EQUAL expression
                   | ID PLUSEQUAL expression
                   | ID MINUSEQUAL expression'''
-    p[0] = ('assignment', p[1], p[2], p[3])
+    p[0] = Assignment(p[1], p[2], p[3], lineno=p.lineno(1))
 
 # Datatypes
 def p_datatype(p):
@@ -88,15 +104,15 @@ def p_datatype(p):
                 | DOUBLE
                 | LONG
                 | STRING'''
-    p[0] = ('datatype', p[1])
+    p[0] = DataType(p[1], lineno=p.lineno(1))
 
 def p_expression_plus(p):
     'expression : expression PLUS term'
-    p[0] = ('plus', p[1], p[3])
+    p[0] = BinaryOp('plus', p[1], p[3], lineno=p.lineno(2))
 
 def p_expression_minus(p):
     'expression : expression MINUS term'
-    p[0] = ('minus', p[1], p[3])
+    p[0] = BinaryOp('minus', p[1], p[3], lineno=p.lineno(2))
 
 def p_expression_term(p):
     'expression : term'
@@ -104,15 +120,15 @@ def p_expression_term(p):
 
 def p_term_multiplication(p):
     'term : term MULT factor'
-    p[0] = ('mult', p[1], p[3])
+    p[0] = BinaryOp('mult', p[1], p[3], lineno=p.lineno(2))
 
 def p_term_div(p):
     'term : term DIVIDE factor'
-    p[0] = ('divide', p[1], p[3])
+    p[0] = BinaryOp('divide', p[1], p[3], lineno=p.lineno(2))
 
 def p_term_mod(p):
     'term : term MOD factor'
-    p[0] = ('mod', p[1], p[3])
+    p[0] = BinaryOp('mod', p[1], p[3], lineno=p.lineno(2))
 
 def p_term_factor(p):
     'term : factor'
@@ -128,7 +144,7 @@ def p_factor_num(p):
               | STRCONST
               | CHARCONST
               | array_access'''
-    p[0] = ('factor', p[1])
+    p[0] = Factor(p[1], lineno=_lineno(p, 1))
 
 def p_factor_expr(p):
     'factor : LPAREN expression RPAREN'
@@ -143,66 +159,66 @@ def p_expression_relop(p):
                   | expression NE expression
                   | expression BOOLEQUAL expression'''
     if p[2] == '<':
-        p[0] = ('lt', p[1], p[3])
+        p[0] = BinaryOp('lt', p[1], p[3], lineno=p.lineno(2))
     elif p[2] == '>':
-        p[0] = ('gt', p[1], p[3])
+        p[0] = BinaryOp('gt', p[1], p[3], lineno=p.lineno(2))
     elif p[2] == '<=':
-        p[0] = ('le', p[1], p[3])
+        p[0] = BinaryOp('le', p[1], p[3], lineno=p.lineno(2))
     elif p[2] == '>=':
-        p[0] = ('ge', p[1], p[3])
+        p[0] = BinaryOp('ge', p[1], p[3], lineno=p.lineno(2))
     elif p[2] == '!=':
-        p[0] = ('ne', p[1], p[3])
+        p[0] = BinaryOp('ne', p[1], p[3], lineno=p.lineno(2))
     elif p[2] == '==':
-        p[0] = ('booleq', p[1], p[3])
+        p[0] = BinaryOp('booleq', p[1], p[3], lineno=p.lineno(2))
 
 # Operadores lógicos
 def p_expression_logical(p):
     '''expression : expression AND expression
                   | expression OR expression'''
     if p[2] == '&&':
-        p[0] = ('and', p[1], p[3])
+        p[0] = BinaryOp('and', p[1], p[3], lineno=p.lineno(2))
     elif p[2] == '||':
-        p[0] = ('or', p[1], p[3])
+        p[0] = BinaryOp('or', p[1], p[3], lineno=p.lineno(2))
 
 # Operadores de incremento y decremento
 def p_expression_increment(p):
     'expression : ID INCREMENT'
-    p[0] = ('increment', p[1])
+    p[0] = Increment(p[1], lineno=p.lineno(1))
 
 def p_expression_decrement(p):
     'expression : ID DECREMENT'
-    p[0] = ('decrement', p[1])
+    p[0] = Decrement(p[1], lineno=p.lineno(1))
 
 # Operadores de incremento y decremento
 def p_assignment_increment(p):
     'assignment : ID INCREMENT STMT_TERMINATOR'
-    p[0] = ('increment', p[1])
+    p[0] = Increment(p[1], lineno=p.lineno(1))
 
 def p_assignment_decrement(p):
     'assignment : ID DECREMENT STMT_TERMINATOR'
-    p[0] = ('decrement', p[1])
+    p[0] = Decrement(p[1], lineno=p.lineno(1))
 
 # Operador de flecha
 def p_expression_arrow(p):
     'expression : expression ARROW ID'
-    p[0] = ('arrow', p[1], p[3])
+    p[0] = Arrow(p[1], p[3], lineno=p.lineno(2))
 
 # Estructuras de control
 def p_if_statement(p):
     '''if_statement : IF LPAREN expression RPAREN LBRACE code RBRACE
                     | IF LPAREN expression RPAREN LBRACE code RBRACE ELSE LBRACE code RBRACE'''
     if len(p) == 8:
-        p[0] = ('if', p[3], p[6])
+        p[0] = If(p[3], p[6], lineno=p.lineno(1))
     else:
-        p[0] = ('if-else', p[3], p[6], p[10])
+        p[0] = IfElse(p[3], p[6], p[10], lineno=p.lineno(1))
 
 def p_while_statement(p):
     'while_statement : WHILE LPAREN expression RPAREN LBRACE code RBRACE'
-    p[0] = ('while', p[3], p[6])
+    p[0] = While(p[3], p[6], lineno=p.lineno(1))
 
 def p_for_statement(p):
     'for_statement : FOR LPAREN assignment STMT_TERMINATOR expression STMT_TERMINATOR expression RPAREN LBRACE code RBRACE'
-    p[0] = ('for', p[3], p[5], p[7], p[10])
+    p[0] = For(p[3], p[5], p[7], p[10], lineno=p.lineno(1))
 
 def p_arguments(p):
     '''arguments : expression
@@ -218,52 +234,167 @@ def p_arguments(p):
 # Declaraciones de arreglos
 def p_array_declaration(p):
     'array_declaration : datatype ID LBRACKET INTCONST RBRACKET'
-    p[0] = ('array_declaration', p[1], p[2], p[4])
+    p[0] = ArrayDeclaration(p[1], p[2], p[4], lineno=p[1].lineno)
 
 # Asignación a arreglos
 def p_array_assignment(p):
     'array_assignment : ID LBRACKET expression RBRACKET EQUAL expression'
-    p[0] = ('array_assignment', p[1], p[3], p[6])
+    p[0] = ArrayAssignment(p[1], p[3], p[6], lineno=p.lineno(1))
 
 # Acceso a elementos de arreglos
 def p_array_access(p):
     'array_access : ID LBRACKET expression RBRACKET'
-    p[0] = ('array_access', p[1], p[3])
+    p[0] = ArrayAccess(p[1], p[3], lineno=p.lineno(1))
 
 # Declaraciones para write, writeln, break y return
 def p_write_statement(p):
     'write_statement : WRITE LPAREN expression RPAREN STMT_TERMINATOR'
-    p[0] = ('write', p[3])
+    p[0] = Write(p[3], lineno=p.lineno(1))
 
 def p_writeln_statement(p):
     'writeln_statement : WRITELN LPAREN expression RPAREN STMT_TERMINATOR'
-    p[0] = ('writeln', p[3])
+    p[0] = WriteLine(p[3], lineno=p.lineno(1))
 
 def p_break_statement(p):
     'break_statement : BREAK STMT_TERMINATOR'
-    p[0] = ('break',)
+    p[0] = Break(lineno=p.lineno(1))
 
 def p_return_statement(p):
     '''return_statement : RETURN expression STMT_TERMINATOR
                         | RETURN STMT_TERMINATOR'''
     if len(p) == 4:
-        p[0] = ('return', p[2])
+        p[0] = Return(p[2], lineno=p.lineno(1))
     else:
-        p[0] = ('return',)
+        p[0] = Return(lineno=p.lineno(1))
 
 def p_empty(p):
     'empty :'
     pass
 
 def p_error(p):
-    print(f"Syntax error in input! at '{p.value}', line {p.lineno}")
+    report(f"Syntax error in input! at '{p.value}', line {p.lineno}")
 
+#Errores léxicos y de sintaxis del hilo actual a diagnostics (ver lexer.report) mientras dure el bloque
+@contextlib.contextmanager
+def _reporting(diagnostics):
+    previous = getattr(_diagnostics, 'stream', None)
+    _diagnostics.stream = diagnostics
+    try:
+        yield
+    finally:
+        _diagnostics.stream = previous
+
+
+#--------------------------------------------------------------
+# Cache de tablas LALR
+# Las tablas se construyen una sola vez por proceso y se guardan en un cache
+# versionado fuera del árbol de código (nunca se escribe parser.out/parsetab.py)
+
+CACHE_ENV_VAR = 'CSC_CACHE_DIR'
+
+#Directorio base de caches del compilador
+def cache_dir(*parts):
+    base = os.environ.get(CACHE_ENV_VAR)
+    if not base:
+        xdg = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        base = os.path.join(xdg, 'csharp-compiler')
+    return os.path.join(base, *parts)
+
+#Firma de la gramática: precedencia, tokens y reglas de todas las funciones p_
+def grammar_signature():
+    digest = hashlib.sha256()
+    digest.update(repr(precedence).encode())
+    digest.update(' '.join(tokens).encode())
+    for name, func in sorted(globals().items()):
+        if name.startswith('p_') and callable(func):
+            digest.update(f"{name}:{func.__doc__}".encode())
+    return digest.hexdigest()[:16]
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+#Construye (o carga del disco) el parser de referencia para la firma actual.
+#Con el lock, hilos que crean parsers al mismo tiempo construyen las tablas una sola vez
+def _load_tables():
+    signature = grammar_signature()
+    with _tables_lock:
+        if signature not in _tables:
+            _tables[signature] = _build_tables(signature)
+        return _tables[signature]
+
+def _build_tables(signature):
+    directory = cache_dir('parser', f"ply-{yacc.__tabversion__}")
+    picklefile = os.path.join(directory, f"parsetab-{signature}.pickle")
+    template = None
+    if os.path.exists(picklefile):
+        try:
+            template = yacc.yacc(debug=False, picklefile=picklefile)
+        except (EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            #Archivo corrupto o incompleto: se descarta y se reconstruye
+            template = None
+
+    if template is None:
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmpfile = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            os.close(fd)
+            os.remove(tmpfile)
+        except OSError:
+            #Sin cache en disco: tablas solo en memoria
+            template = yacc.yacc(debug=False, write_tables=False)
+        else:
+            try:
+                template = yacc.yacc(debug=False, picklefile=tmpfile)
+                os.replace(tmpfile, picklefile)
+            finally:
+                if os.path.exists(tmpfile):
+                    os.remove(tmpfile)
+    return template
+
+#Parser reutilizable: comparte las tablas LALR y tiene su propio lexer y pilas.
+#lexer_backend elige el lexer: 'ply' (lexer.py) o 'fast' (fastlex.py).
+#Un Parser no se comparte entre hilos: cada hilo usa el suyo. Con diagnostics (un objeto con
+#write) los errores léxicos y de sintaxis se escriben ahí en vez de stdout
+class Parser:
+    def __init__(self, lexer_backend='ply'):
+        self._parser = copy.copy(_load_tables())
+        self._lexer = LEXERS[lexer_backend]()
+
+    def parse(self, text, diagnostics=None):
+        self._lexer.lineno = 1
+        with _reporting(diagnostics):
+            return self._parser.parse(text, lexer=self._lexer)
+
+    #Parse contando los tokens que lee el parser (instrumentación); devuelve (AST, tokens)
+    def parse_counting(self, text, diagnostics=None):
+        lexer = self._lexer
+        count = 0
+
+        def token():
+            nonlocal count
+            tok = lexer.token()
+            if tok is not None:
+                count += 1
+            return tok
+
+        lexer.lineno = 1
+        with _reporting(diagnostics):
+            result = self._parser.parse(text, lexer=lexer, tokenfunc=token)
+        return result, count
+
+    #Parse de un archivo abierto o un iterador de fragmentos sin leerlo completo (ver lexer.TokenStream)
+    def parse_stream(self, source, chunk_size=CHUNK_SIZE):
+        stream = TokenStream(source, chunk_size)
+        return self._parser.parse(lexer=self._lexer, tokenfunc=stream.token)
+
+_default_parser = None
 
 #Lectura de parser para todo un analisis de corrido
 def run_parse(data):
-    parser = yacc.yacc()
-    result = parser.parse(data)
-    return result
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = Parser()
+    return _default_parser.parse(data)
 
 ##Lectura de parser para pruebas
 """
@@ -1,106 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'nonassocLTLEGTGEleftPLUSMINUSleftMULTDIVIDEMODrightNOTrightINCREMENTDECREMENTleftANDORAND ARROW BOOL BOOLCONST BOOLEQUAL BREAK CHAR CHARCONST COLON COMMA COMMENT CONST DECREMENT DIVIDE DO DOT DOUBLE DOUBLECONST ELSE EQUAL FALSE FLOAT FLOATCONST FOR FOREACH GE GT ID IF INCREMENT INT INTCONST LBRACE LBRACKET LE LONG LONGCONST LPAREN LT MINUS MINUSEQUAL MOD MULT MULTILINECOMMENT NE NEW NOT OR PLUS PLUSEQUAL PRIVATE PROGRAM PUBLIC RBRACE RBRACKET RETURN RPAREN STMT_TERMINATOR STRCONST STRING THEN TRUE VOID WHILE WRITE WRITELNprogramstart : PROGRAM ID LBRACE code RBRACEcode : statementcode : code statementstatement : assignment STMT_TERMINATOR\n                 | declaration STMT_TERMINATOR\n                 | expression STMT_TERMINATOR\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | array_declaration STMT_TERMINATOR\n                 | array_assignment STMT_TERMINATOR\n                 | write_statement\n                 | writeln_statement\n                 | break_statement\n                 | return_statementdeclaration : datatype declareiddeclareid : IDdeclareid : assignmentdeclareid : declareid COMMA IDdeclareid : declareid COMMA assignmentassignment : ID EQUAL expression\n                  | ID PLUSEQUAL expression\n                  | ID MINUSEQUAL expressiondatatype : INT\n                | FLOAT\n                | BOOL\n                | CHAR\n                | DOUBLE\n                | LONG\n                | STRINGexpression : expression PLUS termexpression : expression MINUS termexpression : termterm : term MULT factorterm : term DIVIDE factorterm : term MOD factorterm : factorfactor : ID\n              | INTCONST\n              | FLOATCONST\n              | DOUBLECONST\n              | LONGCONST\n              | BOOLCONST\n              | STRCONST\n              | CHARCONST\n              | array_accessfactor : LPAREN expression RPARENexpression : expression LT expression\n                  | expression GT expression\n                  | expression LE expression\n                  | expression GE expression\n                  | expression NE expression\n                  | expression BOOLEQUAL expressionexpression : expression AND expression\n                  | expression OR expressionexpression : ID INCREMENTexpression : ID DECREMENTassignment : ID INCREMENT STMT_TERMINATORassignment : ID DECREMENT STMT_TERMINATORexpression : expression ARROW IDif_statement : IF LPAREN expression RPAREN LBRACE code RBRACE\n                    | IF LPAREN expression RPAREN LBRACE code RBRACE ELSE LBRACE code RBRACEwhile_statement : WHILE LPAREN expression RPAREN LBRACE code RBRACEfor_statement : FOR LPAREN assignment STMT_TERMINATOR expression STMT_TERMINATOR expression RPAREN LBRACE code RBRACEarguments : expression\n                 | arguments COMMA expression\n                 | emptyarray_declaration : datatype ID LBRACKET INTCONST RBRACKETarray_assignment : ID LBRACKET expression RBRACKET EQUAL expressionarray_access : ID LBRACKET expression RBRACKETwrite_statement : WRITE LPAREN expression RPAREN STMT_TERMINATORwriteln_statement : WRITELN LPAREN expression RPAREN STMT_TERMINATORbreak_statement : BREAK STMT_TERMINATORreturn_statement : RETURN expression STMT_TERMINATOR\n                        | RETURN STMT_TERMINATORempty :'
-    
-_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,52,],[0,-1,]),'ID':([2,4,6,7,11,12,13,16,17,18,19,20,23,30,31,32,33,34,35,36,37,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,74,75,76,79,80,81,82,83,85,104,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[3,5,5,-2,-7,-8,-9,-12,-13,-14,-15,71,78,78,-24,-25,-26,-27,-28,-29,-30,78,78,78,78,-3,-4,-5,-6,93,93,78,78,78,78,78,78,78,78,103,-10,-11,93,93,93,78,78,118,78,78,-73,-75,123,78,-74,78,78,5,5,-71,-72,5,5,78,-61,-63,5,5,5,5,-62,-64,]),'LBRACE':([3,126,128,147,148,],[4,134,136,149,150,]),'IF':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[22,22,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,22,22,-71,-72,22,22,-61,-63,22,22,22,22,-62,-64,]),'WHILE':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[24,24,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,24,24,-71,-72,24,24,-61,-63,24,24,24,24,-62,-64,]),'FOR':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[25,25,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,25,25,-71,-72,25,25,-61,-63,25,25,25,25,-62,-64,]),'WRITE':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[27,27,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,27,27,-71,-72,27,27,-61,-63,27,27,27,27,-62,-64,]),'WRITELN':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[28,28,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,28,28,-71,-72,28,28,-61,-63,28,28,28,28,-62,-64,]),'BREAK':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[29,29,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,29,29,-71,-72,29,29,-61,-63,29,29,29,29,-62,-64,]),'RETURN':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[30,30,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,30,30,-71,-72,30,30,-61,-63,30,30,30,30,-62,-64,]),'INT':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[31,31,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,31,31,-71,-72,31,31,-61,-63,31,31,31,31,-62,-64,]),'FLOAT':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[32,32,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,32,32,-71,-72,32,32,-61,-63,32,32,32,32,-62,-64,]),'BOOL':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[33,33,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,33,33,-71,-72,33,33,-61,-63,33,33,33,33,-62,-64,]),'CHAR':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[34,34,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,34,34,-71,-72,34,34,-61,-63,34,34,34,34,-62,-64,]),'DOUBLE':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[35,35,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,35,35,-71,-72,35,35,-61,-63,35,35,35,35,-62,-64,]),'LONG':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[36,36,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,36,36,-71,-72,36,36,-61,-63,36,36,36,36,-62,-64,]),'STRING':([4,6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,134,136,138,139,141,142,144,145,149,150,151,152,153,154,],[37,37,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,37,37,-71,-72,37,37,-61,-63,37,37,37,37,-62,-64,]),'INTCONST':([4,6,7,11,12,13,16,17,18,19,23,30,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,73,74,75,76,79,81,82,83,85,105,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[26,26,-2,-7,-8,-9,-12,-13,-14,-15,26,26,26,26,26,26,-3,-4,-5,-6,26,26,26,26,26,26,26,26,26,26,-10,-11,26,26,26,26,26,26,26,-73,-75,125,26,-74,26,26,26,26,-71,-72,26,26,26,-61,-63,26,26,26,26,-62,-64,]),'FLOATCONST':([4,6,7,11,12,13,16,17,18,19,23,30,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,73,74,75,76,79,81,82,83,85,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[39,39,-2,-7,-8,-9,-12,-13,-14,-15,39,39,39,39,39,39,-3,-4,-5,-6,39,39,39,39,39,39,39,39,39,39,-10,-11,39,39,39,39,39,39,39,-73,-75,39,-74,39,39,39,39,-71,-72,39,39,39,-61,-63,39,39,39,39,-62,-64,]),'DOUBLECONST':([4,6,7,11,12,13,16,17,18,19,23,30,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,73,74,75,76,79,81,82,83,85,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[40,40,-2,-7,-8,-9,-12,-13,-14,-15,40,40,40,40,40,40,-3,-4,-5,-6,40,40,40,40,40,40,40,40,40,40,-10,-11,40,40,40,40,40,40,40,-73,-75,40,-74,40,40,40,40,-71,-72,40,40,40,-61,-63,40,40,40,40,-62,-64,]),'LONGCONST':([4,6,7,11,12,13,16,17,18,19,23,30,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,73,74,75,76,79,81,82,83,85,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[41,41,-2,-7,-8,-9,-12,-13,-14,-15,41,41,41,41,41,41,-3,-4,-5,-6,41,41,41,41,41,41,41,41,41,41,-10,-11,41,41,41,41,41,41,41,-73,-75,41,-74,41,41,41,41,-71,-72,41,41,41,-61,-63,41,41,41,41,-62,-64,]),'BOOLCONST':([4,6,7,11,12,13,16,17,18,19,23,30,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,73,74,75,76,79,81,82,83,85,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[42,42,-2,-7,-8,-9,-12,-13,-14,-15,42,42,42,42,42,42,-3,-4,-5,-6,42,42,42,42,42,42,42,42,42,42,-10,-11,42,42,42,42,42,42,42,-73,-75,42,-74,42,42,42,42,-71,-72,42,42,42,-61,-63,42,42,42,42,-62,-64,]),'STRCONST':([4,6,7,11,12,13,16,17,18,19,23,30,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,73,74,75,76,79,81,82,83,85,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[43,43,-2,-7,-8,-9,-12,-13,-14,-15,43,43,43,43,43,43,-3,-4,-5,-6,43,43,43,43,43,43,43,43,43,43,-10,-11,43,43,43,43,43,43,43,-73,-75,43,-74,43,43,43,43,-71,-72,43,43,43,-61,-63,43,43,43,43,-62,-64,]),'CHARCONST':([4,6,7,11,12,13,16,17,18,19,23,30,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,73,74,75,76,79,81,82,83,85,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[44,44,-2,-7,-8,-9,-12,-13,-14,-15,44,44,44,44,44,44,-3,-4,-5,-6,44,44,44,44,44,44,44,44,44,44,-10,-11,44,44,44,44,44,44,44,-73,-75,44,-74,44,44,44,44,-71,-72,44,44,44,-61,-63,44,44,44,44,-62,-64,]),'LPAREN':([4,6,7,11,12,13,16,17,18,19,22,23,24,25,27,28,30,46,47,48,51,53,54,55,56,57,58,59,60,61,62,63,64,65,66,68,69,73,74,75,76,79,81,82,83,85,115,121,129,132,134,136,138,139,141,142,143,144,145,149,150,151,152,153,154,],[23,23,-2,-7,-8,-9,-12,-13,-14,-15,76,23,79,80,81,82,23,23,23,23,23,-3,-4,-5,-6,23,23,23,23,23,23,23,23,23,23,-10,-11,23,23,23,23,23,23,23,-73,-75,23,-74,23,23,23,23,-71,-72,23,23,23,-61,-63,23,23,23,23,-62,-64,]),'EQUAL':([5,71,118,122,123,],[46,46,46,132,46,]),'PLUSEQUAL':([5,71,118,123,],[47,47,47,47,]),'MINUSEQUAL':([5,71,118,123,],[48,48,48,48,]),'INCREMENT':([5,71,78,118,123,],[49,106,113,106,106,]),'DECREMENT':([5,71,78,118,123,],[50,107,114,107,107,]),'LBRACKET':([5,71,78,93,],[51,105,115,115,]),'MULT':([5,21,26,38,39,40,41,42,43,44,45,78,92,93,94,108,109,110,112,122,135,],[-38,73,-39,-37,-40,-41,-42,-43,-44,-45,-46,-38,73,-38,73,-34,-35,-36,-47,-70,-70,]),'DIVIDE':([5,21,26,38,39,40,41,42,43,44,45,78,92,93,94,108,109,110,112,122,135,],[-38,74,-39,-37,-40,-41,-42,-43,-44,-45,-46,-38,74,-38,74,-34,-35,-36,-47,-70,-70,]),'MOD':([5,21,26,38,39,40,41,42,43,44,45,78,92,93,94,108,109,110,112,122,135,],[-38,75,-39,-37,-40,-41,-42,-43,-44,-45,-46,-38,75,-38,75,-34,-35,-36,-47,-70,-70,]),'STMT_TERMINATOR':([5,8,9,10,14,15,21,26,29,30,38,39,40,41,42,43,44,45,49,50,70,71,72,78,84,86,87,88,89,90,92,93,94,95,96,97,98,99,100,101,102,103,106,107,108,109,110,112,113,114,117,122,123,124,130,131,133,135,137,140,],[-38,54,55,56,68,69,-33,-39,83,85,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,-16,-17,-18,-38,121,-21,-22,-23,-58,-59,-31,-38,-32,-48,-49,-50,-51,-52,-53,-54,-55,-60,89,90,-34,-35,-36,-47,-56,-57,129,-70,-19,-20,138,139,-68,-70,143,-69,]),'PLUS':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,57,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,57,-38,57,57,57,57,57,-31,-38,-32,57,57,57,57,57,57,-54,-55,-60,-34,-35,-36,57,-47,-56,-57,57,57,57,-70,57,-70,57,57,57,]),'MINUS':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,58,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,58,-38,58,58,58,58,58,-31,-38,-32,58,58,58,58,58,58,-54,-55,-60,-34,-35,-36,58,-47,-56,-57,58,58,58,-70,58,-70,58,58,58,]),'LT':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,59,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,59,-38,59,59,59,59,59,-31,-38,-32,None,None,None,None,59,59,-54,-55,-60,-34,-35,-36,59,-47,-56,-57,59,59,59,-70,59,-70,59,59,59,]),'GT':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,60,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,60,-38,60,60,60,60,60,-31,-38,-32,None,None,None,None,60,60,-54,-55,-60,-34,-35,-36,60,-47,-56,-57,60,60,60,-70,60,-70,60,60,60,]),'LE':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,61,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,61,-38,61,61,61,61,61,-31,-38,-32,None,None,None,None,61,61,-54,-55,-60,-34,-35,-36,61,-47,-56,-57,61,61,61,-70,61,-70,61,61,61,]),'GE':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,62,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,62,-38,62,62,62,62,62,-31,-38,-32,None,None,None,None,62,62,-54,-55,-60,-34,-35,-36,62,-47,-56,-57,62,62,62,-70,62,-70,62,62,62,]),'NE':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,63,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,63,-38,63,63,63,63,63,-31,-38,-32,-48,-49,-50,-51,63,63,-54,-55,-60,-34,-35,-36,63,-47,-56,-57,63,63,63,-70,63,-70,63,63,63,]),'BOOLEQUAL':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,64,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,64,-38,64,64,64,64,64,-31,-38,-32,-48,-49,-50,-51,64,64,-54,-55,-60,-34,-35,-36,64,-47,-56,-57,64,64,64,-70,64,-70,64,64,64,]),'AND':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,65,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,65,-38,65,65,65,65,65,-31,-38,-32,65,65,65,65,65,65,-54,-55,-60,-34,-35,-36,65,-47,-56,-57,65,65,65,-70,65,-70,65,65,65,]),'OR':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,66,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,66,-38,66,66,66,66,66,-31,-38,-32,66,66,66,66,66,66,-54,-55,-60,-34,-35,-36,66,-47,-56,-57,66,66,66,-70,66,-70,66,66,66,]),'ARROW':([5,10,21,26,38,39,40,41,42,43,44,45,49,50,77,78,84,86,87,88,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,122,127,135,137,140,146,],[-38,67,-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-56,-57,67,-38,67,67,67,67,67,-31,-38,-32,-48,-49,-50,-51,67,67,-54,-55,-60,-34,-35,-36,67,-47,-56,-57,67,67,67,-70,67,-70,67,67,67,]),'RBRACE':([6,7,11,12,13,16,17,18,19,53,54,55,56,68,69,83,85,121,138,139,141,142,144,145,151,152,153,154,],[52,-2,-7,-8,-9,-12,-13,-14,-15,-3,-4,-5,-6,-10,-11,-73,-75,-74,-71,-72,144,145,-61,-63,153,154,-62,-64,]),'RPAREN':([21,26,38,39,40,41,42,43,44,45,77,78,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,111,112,113,114,116,119,120,135,146,],[-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,112,-38,-31,-38,-32,-48,-49,-50,-51,-52,-53,-54,-55,-60,-34,-35,-36,126,-47,-56,-57,128,130,131,-70,148,]),'COMMA':([21,26,38,39,40,41,42,43,44,45,70,71,72,78,86,87,88,89,90,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,112,113,114,123,124,135,],[-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,104,-17,-18,-38,-21,-22,-23,-58,-59,-31,-38,-32,-48,-49,-50,-51,-52,-53,-54,-55,-60,-34,-35,-36,-47,-56,-57,-19,-20,-70,]),'RBRACKET':([21,26,38,39,40,41,42,43,44,45,78,91,92,93,94,95,96,97,98,99,100,101,102,103,108,109,110,112,113,114,125,127,135,],[-33,-39,-37,-40,-41,-42,-43,-44,-45,-46,-38,122,-31,-38,-32,-48,-49,-50,-51,-52,-53,-54,-55,-60,-34,-35,-36,-47,-56,-57,133,135,-70,]),'ELSE':([144,],[147,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'programstart':([0,],[1,]),'code':([4,134,136,149,150,],[6,141,142,151,152,]),'statement':([4,6,134,136,141,142,149,150,151,152,],[7,53,7,7,53,53,7,7,53,53,]),'assignment':([4,6,20,80,104,134,136,141,142,149,150,151,152,],[8,8,72,117,124,8,8,8,8,8,8,8,8,]),'declaration':([4,6,134,136,141,142,149,150,151,152,],[9,9,9,9,9,9,9,9,9,9,]),'expression':([4,6,23,30,46,47,48,51,59,60,61,62,63,64,65,66,76,79,81,82,115,129,132,134,136,141,142,143,149,150,151,152,],[10,10,77,84,86,87,88,91,95,96,97,98,99,100,101,102,111,116,119,120,127,137,140,10,10,10,10,146,10,10,10,10,]),'if_statement':([4,6,134,136,141,142,149,150,151,152,],[11,11,11,11,11,11,11,11,11,11,]),'while_statement':([4,6,134,136,141,142,149,150,151,152,],[12,12,12,12,12,12,12,12,12,12,]),'for_statement':([4,6,134,136,141,142,149,150,151,152,],[13,13,13,13,13,13,13,13,13,13,]),'array_declaration':([4,6,134,136,141,142,149,150,151,152,],[14,14,14,14,14,14,14,14,14,14,]),'array_assignment':([4,6,134,136,141,142,149,150,151,152,],[15,15,15,15,15,15,15,15,15,15,]),'write_statement':([4,6,134,136,141,142,149,150,151,152,],[16,16,16,16,16,16,16,16,16,16,]),'writeln_statement':([4,6,134,136,141,142,149,150,151,152,],[17,17,17,17,17,17,17,17,17,17,]),'break_statement':([4,6,134,136,141,142,149,150,151,152,],[18,18,18,18,18,18,18,18,18,18,]),'return_statement':([4,6,134,136,141,142,149,150,151,152,],[19,19,19,19,19,19,19,19,19,19,]),'datatype':([4,6,134,136,141,142,149,150,151,152,],[20,20,20,20,20,20,20,20,20,20,]),'term':([4,6,23,30,46,47,48,51,57,58,59,60,61,62,63,64,65,66,76,79,81,82,115,129,132,134,136,141,142,143,149,150,151,152,],[21,21,21,21,21,21,21,21,92,94,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'factor':([4,6,23,30,46,47,48,51,57,58,59,60,61,62,63,64,65,66,73,74,75,76,79,81,82,115,129,132,134,136,141,142,143,149,150,151,152,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,108,109,110,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'array_access':([4,6,23,30,46,47,48,51,57,58,59,60,61,62,63,64,65,66,73,74,75,76,79,81,82,115,129,132,134,136,141,142,143,149,150,151,152,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'declareid':([20,],[70,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> programstart","S'",1,None,None,None),
-  ('programstart -> PROGRAM ID LBRACE code RBRACE','programstart',5,'p_programstart','parse.py',20),
-  ('code -> statement','code',1,'p_code_singleline','parse.py',25),
-  ('code -> code statement','code',2,'p_code_multiple','parse.py',30),
-  ('statement -> assignment STMT_TERMINATOR','statement',2,'p_statement_variables','parse.py',36),
-  ('statement -> declaration STMT_TERMINATOR','statement',2,'p_statement_variables','parse.py',37),
-  ('statement -> expression STMT_TERMINATOR','statement',2,'p_statement_variables','parse.py',38),
-  ('statement -> if_statement','statement',1,'p_statement_variables','parse.py',39),
-  ('statement -> while_statement','statement',1,'p_statement_variables','parse.py',40),
-  ('statement -> for_statement','statement',1,'p_statement_variables','parse.py',41),
-  ('statement -> array_declaration STMT_TERMINATOR','statement',2,'p_statement_variables','parse.py',42),
-  ('statement -> array_assignment STMT_TERMINATOR','statement',2,'p_statement_variables','parse.py',43),
-  ('statement -> write_statement','statement',1,'p_statement_variables','parse.py',44),
-  ('statement -> writeln_statement','statement',1,'p_statement_variables','parse.py',45),
-  ('statement -> break_statement','statement',1,'p_statement_variables','parse.py',46),
-  ('statement -> return_statement','statement',1,'p_statement_variables','parse.py',47),
-  ('declaration -> datatype declareid','declaration',2,'p_declaration','parse.py',52),
-  ('declareid -> ID','declareid',1,'p_declareid_single','parse.py',57),
-  ('declareid -> assignment','declareid',1,'p_declareid_singlev','parse.py',62),
-  ('declareid -> declareid COMMA ID','declareid',3,'p_declareid_multiple','parse.py',67),
-  ('declareid -> declareid COMMA assignment','declareid',3,'p_declareid_multiplev','parse.py',72),
-  ('assignment -> ID EQUAL expression','assignment',3,'p_assignment','parse.py',77),
-  ('assignment -> ID PLUSEQUAL expression','assignment',3,'p_assignment','parse.py',78),
-  ('assignment -> ID MINUSEQUAL expression','assignment',3,'p_assignment','parse.py',79),
-  ('datatype -> INT','datatype',1,'p_datatype','parse.py',84),
-  ('datatype -> FLOAT','datatype',1,'p_datatype','parse.py',85),
-  ('datatype -> BOOL','datatype',1,'p_datatype','parse.py',86),
-  ('datatype -> CHAR','datatype',1,'p_datatype','parse.py',87),
-  ('datatype -> DOUBLE','datatype',1,'p_datatype','parse.py',88),
-  ('datatype -> LONG','datatype',1,'p_datatype','parse.py',89),
-  ('datatype -> STRING','datatype',1,'p_datatype','parse.py',90),
-  ('expression -> expression PLUS term','expression',3,'p_expression_plus','parse.py',94),
-  ('expression -> expression MINUS term','expression',3,'p_expression_minus','parse.py',98),
-  ('expression -> term','expression',1,'p_expression_term','parse.py',102),
-  ('term -> term MULT factor','term',3,'p_term_multiplication','parse.py',106),
-  ('term -> term DIVIDE factor','term',3,'p_term_div','parse.py',110),
-  ('term -> term MOD factor','term',3,'p_term_mod','parse.py',114),
-  ('term -> factor','term',1,'p_term_factor','parse.py',118),
-  ('factor -> ID','factor',1,'p_factor_num','parse.py',122),
-  ('factor -> INTCONST','factor',1,'p_factor_num','parse.py',123),
-  ('factor -> FLOATCONST','factor',1,'p_factor_num','parse.py',124),
-  ('factor -> DOUBLECONST','factor',1,'p_factor_num','parse.py',125),
-  ('factor -> LONGCONST','factor',1,'p_factor_num','parse.py',126),
-  ('factor -> BOOLCONST','factor',1,'p_factor_num','parse.py',127),
-  ('factor -> STRCONST','factor',1,'p_factor_num','parse.py',128),
-  ('factor -> CHARCONST','factor',1,'p_factor_num','parse.py',129),
-  ('factor -> array_access','factor',1,'p_factor_num','parse.py',130),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor_expr','parse.py',134),
-  ('expression -> expression LT expression','expression',3,'p_expression_relop','parse.py',139),
-  ('expression -> expression GT expression','expression',3,'p_expression_relop','parse.py',140),
-  ('expression -> expression LE expression','expression',3,'p_expression_relop','parse.py',141),
-  ('expression -> expression GE expression','expression',3,'p_expression_relop','parse.py',142),
-  ('expression -> expression NE expression','expression',3,'p_expression_relop','parse.py',143),
-  ('expression -> expression BOOLEQUAL expression','expression',3,'p_expression_relop','parse.py',144),
-  ('expression -> expression AND expression','expression',3,'p_expression_logical','parse.py',160),
-  ('expression -> expression OR expression','expression',3,'p_expression_logical','parse.py',161),
-  ('expression -> ID INCREMENT','expression',2,'p_expression_increment','parse.py',169),
-  ('expression -> ID DECREMENT','expression',2,'p_expression_decrement','parse.py',173),
-  ('assignment -> ID INCREMENT STMT_TERMINATOR','assignment',3,'p_assignment_increment','parse.py',178),
-  ('assignment -> ID DECREMENT STMT_TERMINATOR','assignment',3,'p_assignment_decrement','parse.py',182),
-  ('expression -> expression ARROW ID','expression',3,'p_expression_arrow','parse.py',187),
-  ('if_statement -> IF LPAREN expression RPAREN LBRACE code RBRACE','if_statement',7,'p_if_statement','parse.py',192),
-  ('if_statement -> IF LPAREN expression RPAREN LBRACE code RBRACE ELSE LBRACE code RBRACE','if_statement',11,'p_if_statement','parse.py',193),
-  ('while_statement -> WHILE LPAREN expression RPAREN LBRACE code RBRACE','while_statement',7,'p_while_statement','parse.py',200),
-  ('for_statement -> FOR LPAREN assignment STMT_TERMINATOR expression STMT_TERMINATOR expression RPAREN LBRACE code RBRACE','for_statement',11,'p_for_statement','parse.py',204),
-  ('arguments -> expression','arguments',1,'p_arguments','parse.py',208),
-  ('arguments -> arguments COMMA expression','arguments',3,'p_arguments','parse.py',209),
-  ('arguments -> empty','arguments',1,'p_arguments','parse.py',210),
-  ('array_declaration -> datatype ID LBRACKET INTCONST RBRACKET','array_declaration',5,'p_array_declaration','parse.py',220),
-  ('array_assignment -> ID LBRACKET expression RBRACKET EQUAL expression','array_assignment',6,'p_array_assignment','parse.py',225),
-  ('array_access -> ID LBRACKET expression RBRACKET','array_access',4,'p_array_access','parse.py',230),
-  ('write_statement -> WRITE LPAREN expression RPAREN STMT_TERMINATOR','write_statement',5,'p_write_statement','parse.py',235),
-  ('writeln_statement -> WRITELN LPAREN expression RPAREN STMT_TERMINATOR','writeln_statement',5,'p_writeln_statement','parse.py',239),
-  ('break_statement -> BREAK STMT_TERMINATOR','break_statement',2,'p_break_statement','parse.py',243),
-  ('return_statement -> RETURN expression STMT_TERMINATOR','return_statement',3,'p_return_statement','parse.py',247),
-  ('return_statement -> RETURN STMT_TERMINATOR','return_statement',2,'p_return_statement','parse.py',248),
-  ('empty -> <empty>','empty',0,'p_empty','parse.py',255),
-]
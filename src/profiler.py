@@ -0,0 +1,115 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Profiler - Puntos calientes de la ejecución por cuadruplo, operador y línea fuente
+#ExecutionProfile junta lo que miden los motores con profile=True (ejecuciones y nanosegundos por
+#cuadruplo, ver vm.profiling y jit.PythonSource) con la tabla de cuadruplos ejecutada. Cada cuadruplo
+#lleva la línea del código fuente que lo generó (Quadruple.lineno), así que los totales se agrupan
+#por línea y por ciclo. report() es el reporte de texto ordenado por tiempo y collapsed() las pilas
+#colapsadas ("marco;marco;... valor") que leen flamegraph.pl, inferno y speedscope
+
+from codegen import quadruple_lines, quadruple_rows
+from symbols import JUMPS
+
+#Ciclos de una tabla de cuadruplos: cada salto hacia atrás cierra un ciclo que empieza en su destino.
+#Los saltos al mismo encabezado (la línea del while/for; el índice si no hay líneas) forman un solo
+#ciclo, p. ej. el for de CodeGen regresa a la condición y al incremento. Devuelve (inicio, fin, línea)
+def find_loops(rows, lines):
+    loops = {}
+    for index, (operator, _, _, result) in enumerate(rows):
+        if operator in JUMPS and result.__class__ is int and result <= index:
+            header = lines[result] or -result
+            start, end = loops.get(header, (result, index))
+            loops[header] = (min(start, result), max(end, index))
+    #De afuera hacia adentro: por inicio y, con el mismo inicio, el más largo primero
+    return sorted(((start, end, header if header > 0 else 0) for header, (start, end) in loops.items()),
+                  key=lambda loop: (loop[0], -loop[1]))
+
+class ExecutionProfile:
+    #counts y times (nanosegundos) por índice de cuadruplo; source es el texto del programa, si se tiene
+    def __init__(self, quadruples, counts, times, name='program', source=None):
+        rows = list(quadruple_rows(quadruples))
+        self.operators = [row[0] for row in rows]
+        self.lines = quadruple_lines(quadruples)
+        self.loops = find_loops(rows, self.lines)
+        self.counts = list(counts)
+        self.times = list(times)
+        self.name = name
+        self.source = source.splitlines() if source is not None else None
+
+    @property
+    def total_ns(self):
+        return sum(self.times)
+
+    @property
+    def executed(self):
+        return sum(self.counts)
+
+    #(índice, operador, línea, ejecuciones, ns) de cada cuadruplo ejecutado, del más lento al más rápido
+    def by_quadruple(self):
+        rows = [(index, self.operators[index], self.lines[index], count, self.times[index])
+                for index, count in enumerate(self.counts) if count]
+        rows.sort(key=lambda row: (-row[4], row[0]))
+        return rows
+
+    #(operador, ejecuciones, ns), del más lento al más rápido
+    def by_operator(self):
+        return self._grouped(self.operators)
+
+    #(línea, ejecuciones, ns), de la más lenta a la más rápida; la línea 0 es desconocida
+    def by_line(self):
+        return self._grouped(self.lines)
+
+    def _grouped(self, keys):
+        totals = {}
+        for index, count in enumerate(self.counts):
+            if count:
+                entry = totals.setdefault(keys[index], [0, 0])
+                entry[0] += count
+                entry[1] += self.times[index]
+        rows = [(key, count, ns) for key, (count, ns) in totals.items()]
+        rows.sort(key=lambda row: (-row[2], str(row[0])))
+        return rows
+
+    def _text(self, lineno):
+        if self.source is None or not 0 < lineno <= len(self.source):
+            return ''
+        return self.source[lineno - 1].strip()
+
+    #Reporte de texto con las limit entradas más lentas de cada tabla
+    def report(self, limit=10):
+        total = self.total_ns or 1
+        def percent(ns):
+            return f"{100 * ns / total:5.1f}%"
+
+        out = [f"Execution profile of {self.name}: {self.executed} quadruples executed "
+               f"in {self.total_ns / 1e6:.3f} ms\n"]
+        out.append("  Hot source lines:\n")
+        out.append(f"    {'line':>6} {'count':>12} {'ms':>10} {'time':>6}  source\n")
+        for lineno, count, ns in self.by_line()[:limit]:
+            line = lineno if lineno else '?'
+            out.append(f"    {line:>6} {count:12} {ns / 1e6:10.3f} {percent(ns)}  {self._text(lineno)}\n")
+        out.append("  Hot operators:\n")
+        out.append(f"    {'operator':>12} {'count':>12} {'ms':>10} {'time':>6}\n")
+        for operator, count, ns in self.by_operator()[:limit]:
+            out.append(f"    {operator:>12} {count:12} {ns / 1e6:10.3f} {percent(ns)}\n")
+        out.append("  Hot quadruples:\n")
+        out.append(f"    {'quad':>6} {'line':>6} {'operator':>12} {'count':>12} {'ms':>10} {'time':>6}\n")
+        for index, operator, lineno, count, ns in self.by_quadruple()[:limit]:
+            line = lineno if lineno else '?'
+            out.append(f"    {'L' + str(index):>6} {line:>6} {operator:>12} {count:12} {ns / 1e6:10.3f} {percent(ns)}\n")
+        return ''.join(out)
+
+    #Pilas colapsadas en nanosegundos: programa;ciclos que lo contienen (de afuera hacia adentro);línea;operador
+    def collapsed(self):
+        stacks = {}
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            frames = [self.name]
+            frames.extend(f"loop line {header}" if header else f"loop L{start}"
+                          for start, end, header in self.loops if start <= index <= end)
+            frames.append(f"line {self.lines[index]}" if self.lines[index] else f"L{index}")
+            frames.append(str(self.operators[index]))
+            stack = ';'.join(frame.replace(';', ',') for frame in frames)
+            stacks[stack] = stacks.get(stack, 0) + self.times[index]
+        return ''.join(f"{stack} {ns}\n" for stack, ns in stacks.items())
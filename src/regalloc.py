@@ -0,0 +1,161 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: TempAllocator - Reutiliza los temporales T<n> de CodeGen una vez que están muertos
+#Calcula el intervalo de vida de cada temporal sobre los cuadruplos y los reparte con linear scan
+#en el menor número de nombres posible, en tiempo casi lineal en el largo de la tabla
+
+import heapq
+
+from codegen import Quadruple
+from symbols import JUMPS
+from cfg import CFG, bits, reads, writes
+
+class TempAllocator:
+    def __init__(self, quadruples, temp_count):
+        self.quadruples = quadruples
+        self.temps = [f"T{i}" for i in range(temp_count)]
+        self.peak_live = 0
+        self.temps_before = 0
+        self.temps_after = 0
+
+    def allocate(self):
+        quads = self.quadruples
+        size = len(quads)
+        temps = set(self.temps)
+
+        names = set()
+        for quad in quads:
+            for arg in (quad.arg1, quad.arg2, quad.result):
+                if isinstance(arg, str):
+                    names.add(arg)
+        used_temps = [temp for temp in self.temps if temp in names]
+        self.temps_before = len(used_temps)
+
+        intervals, pinned = self._intervals(quads, temps)
+
+        #Nombres disponibles: T0, T1, ... sin chocar con variables ni temporales fijos
+        reserved = (names - set(used_temps)) | pinned
+        pool = []
+        def color_name(color):
+            while len(pool) <= color:
+                k = int(pool[-1][1:]) + 1 if pool else 0
+                while f"T{k}" in reserved:
+                    k += 1
+                pool.append(f"T{k}")
+            return pool[color]
+
+        #Linear scan: los intervalos por inicio; un color se libera cuando su intervalo termina
+        #antes (o justo donde) empieza el siguiente, y se toma el menor color libre
+        rename = {temp: temp for temp in pinned}
+        active = []         #heap de (fin, color)
+        free = []           #heap de colores libres
+        colors = 0
+        self.peak_live = 0
+        for begin, end, temp in sorted((begin, end, temp) for temp, (begin, end) in intervals.items()):
+            while active and active[0][0] <= begin:
+                heapq.heappush(free, heapq.heappop(active)[1])
+            if temp in pinned:
+                self.peak_live = max(self.peak_live, len(active) + 1)
+                continue
+            if free:
+                color = heapq.heappop(free)
+            else:
+                color = colors
+                colors += 1
+            heapq.heappush(active, (end, color))
+            rename[temp] = color_name(color)
+            self.peak_live = max(self.peak_live, len(active))
+
+        self.temps_after = len(set(rename.values()))
+
+        def renamed(arg):
+            return rename.get(arg, arg) if isinstance(arg, str) else arg
+
+        result = []
+        for quad in quads:
+            if quad.operator in JUMPS:
+                result.append(Quadruple(quad.operator, renamed(quad.arg1), quad.arg2, quad.result, quad.lineno))
+            elif quad.operator == 'declare_array':
+                result.append(Quadruple(quad.operator, quad.arg1, renamed(quad.arg2), renamed(quad.result), quad.lineno))
+            else:
+                result.append(Quadruple(quad.operator, renamed(quad.arg1), renamed(quad.arg2), renamed(quad.result), quad.lineno))
+        return result
+
+    #Intervalos de vida [inicio, fin) de cada temporal en el orden de la tabla y los temporales
+    #que pueden leerse antes de escribirse (conservan su nombre: get_value devuelve el propio
+    #nombre en ese caso). Un temporal que solo aparece en un bloque y se escribe antes de leerse
+    #vive de su primera definición a su último uso, sin flujo de datos. Los demás (los que cruzan
+    #bloques o se leen antes de escribirse) pasan por la vivacidad por bloque, y su intervalo se
+    #extiende a los bloques donde están vivos a la entrada o a la salida
+    def _intervals(self, quads, temps):
+        size = len(quads)
+        intervals = {}
+        block_of = {}
+        spread = {}
+        local = {}
+        if not size:
+            return intervals, set()
+        graph = CFG(quads)
+        for block in graph.blocks:
+            for i in range(block.start, block.start + len(block.quads)):
+                quad = quads[i]
+                for arg in reads(quad):
+                    if isinstance(arg, str) and arg in temps:
+                        self._extend(intervals, arg, i, i)
+                        first = block_of.setdefault(arg, block.index)
+                        if first != block.index:
+                            spread.setdefault(arg, {first}).add(block.index)
+                            local[arg] = False
+                        elif arg not in local:
+                            local[arg] = False
+                for arg in writes(quad):
+                    if arg in temps:
+                        self._extend(intervals, arg, i, i + 1)
+                        first = block_of.setdefault(arg, block.index)
+                        if first != block.index:
+                            spread.setdefault(arg, {first}).add(block.index)
+                            local[arg] = False
+                        else:
+                            local.setdefault(arg, True)
+
+        crossing = [temp for temp in intervals if not local.get(temp)]
+        if not crossing:
+            return intervals, set()
+        live_in, live_out = self._liveness(graph, crossing, block_of, spread)
+        for block in graph.blocks:
+            last = block.start + len(block.quads) - 1
+            for n in bits(live_in[block.index]):
+                self._extend(intervals, crossing[n], block.start, block.start)
+            for n in bits(live_out[block.index]):
+                self._extend(intervals, crossing[n], last, last + 1)
+        pinned = {crossing[n] for n in bits(live_in[0])}
+        return intervals, pinned
+
+    #Vivacidad por bloque de los temporales de crossing (bit n = crossing[n]). use/def solo se
+    #calculan en los bloques donde aparecen, así el costo depende de lo que cruza bloques y no del
+    #largo del programa
+    def _liveness(self, graph, crossing, block_of, spread):
+        universe = {temp: n for n, temp in enumerate(crossing)}
+        touched = set()
+        for temp in crossing:
+            touched.update(spread.get(temp, (block_of[temp],)))
+        use = [0] * len(graph.blocks)
+        define = [0] * len(graph.blocks)
+        for index in touched:
+            for quad in reversed(graph.blocks[index].quads):
+                for name in writes(quad):
+                    if name in universe:
+                        define[index] |= 1 << universe[name]
+                        use[index] &= ~(1 << universe[name])
+                for name in reads(quad):
+                    if isinstance(name, str) and name in universe:
+                        use[index] |= 1 << universe[name]
+        return graph.solve(lambda block, out: use[block.index] | (out & ~define[block.index]),
+                           direction='backward')
+
+    def _extend(self, intervals, temp, begin, end):
+        if temp in intervals:
+            low, high = intervals[temp]
+            intervals[temp] = (min(low, begin), max(high, end))
+        else:
+            intervals[temp] = (begin, end)
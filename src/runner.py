@@ -0,0 +1,137 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Runner - Ejecución reentrante de IR compilado, con pool de hilos y frente asyncio
+#run() ejecuta una tabla de cuadruplos (o los bytes de un .csir) con un RunContext y devuelve un
+#RunResult con la salida capturada y el estado final. Cada ejecución crea su propio motor, su
+#StringOutput y su guard de límites, así que muchas ejecuciones pueden correr al mismo tiempo en un
+#proceso; lo único compartido son caches que no cambian el resultado (tablas LALR, front end,
+#programas del JIT). compile_source() compila con un Parser por hilo y los errores léxicos y de
+#sintaxis en el resultado.
+#ThreadPoolScheduler reparte ejecuciones en hilos y AsyncRunner las multiplexa desde asyncio con
+#un semáforo que acota cuántas corren a la vez
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from parse import Parser
+from irfile import loads
+from arrays import DEFAULT_BACKEND
+from output import StringOutput
+from driver import ENGINES, CompileOptions, compile_quadruples
+
+#Ejecuciones simultáneas por omisión en AsyncRunner
+DEFAULT_CONCURRENCY = 64
+
+#Contexto de una ejecución: motor, almacenamiento de arreglos, límites (limits.ExecutionLimits)
+#y un nombre para identificar el resultado
+class RunContext:
+    def __init__(self, engine='vm', arrays=DEFAULT_BACKEND, limits=None, name=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}")
+        self.engine = engine
+        self.arrays = arrays
+        self.limits = limits
+        self.name = name
+
+#Resultado de una ejecución: salida, variables finales (None si hubo error) y el error, si hubo,
+#como texto y como excepción (p. ej. ResourceLimitError.quad_index)
+class RunResult:
+    def __init__(self, name, output='', variables=None, error=None, exception=None, seconds=0.0):
+        self.name = name
+        self.output = output
+        self.variables = variables
+        self.error = error
+        self.exception = exception
+        self.seconds = seconds
+
+    @property
+    def ok(self):
+        return self.error is None
+
+#Ejecuta un programa compilado; no lanza excepciones del programa, quedan en el resultado
+def run(program, context=None):
+    context = context if context is not None else RunContext()
+    if isinstance(program, (bytes, bytearray, memoryview)):
+        program = loads(program)
+    output = StringOutput()
+    engine = ENGINES[context.engine](output=output, array_backend=context.arrays, limits=context.limits)
+    start = time.perf_counter()
+    variables = error = exception = None
+    try:
+        engine.interpret(program)
+        variables = dict(engine.memory_var_data)
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        exception = exc
+    return RunResult(context.name, output.getvalue(), variables, error, exception, time.perf_counter() - start)
+
+#Parser del hilo actual (un Parser no se comparte entre hilos)
+_local = threading.local()
+
+def _thread_parser(lexer):
+    parsers = getattr(_local, 'parsers', None)
+    if parsers is None:
+        parsers = _local.parsers = {}
+    if lexer not in parsers:
+        parsers[lexer] = Parser(lexer)
+    return parsers[lexer]
+
+#Compila un texto fuente a los cuadruplos finales con el mismo pipeline que driver.py (cache del
+#front end incluido) y un Parser por hilo. Devuelve (cuadruplos, diagnósticos del parser)
+def compile_source(data, optimize=False, lexer='ply', cache=True):
+    options = CompileOptions(optimize=optimize, lexer=lexer, cache=cache)
+    compilation = compile_quadruples(data, options, _thread_parser(lexer))
+    return compilation.quadruples, compilation.diagnostics
+
+#Pool de hilos para ejecuciones; map() devuelve los resultados en el orden de entrada
+class ThreadPoolScheduler:
+    def __init__(self, max_workers=None):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='csc-run')
+
+    #Future con el RunResult
+    def submit(self, program, context=None):
+        return self._pool.submit(run, program, context)
+
+    def map(self, programs, context=None):
+        futures = [self.submit(program, context) for program in programs]
+        for future in futures:
+            yield future.result()
+
+    def shutdown(self, wait=True):
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+#Frente asyncio: cada run() espera su lugar en el semáforo y se ejecuta en el pool de hilos, así
+#el ciclo de eventos no se bloquea y nunca corren más de max_concurrency ejecuciones a la vez.
+#Sin scheduler crea (y cierra en close) un ThreadPoolScheduler de max_concurrency hilos
+class AsyncRunner:
+    def __init__(self, max_concurrency=DEFAULT_CONCURRENCY, scheduler=None):
+        self.max_concurrency = max_concurrency
+        self._owns_scheduler = scheduler is None
+        self._scheduler = scheduler if scheduler is not None else ThreadPoolScheduler(max_concurrency)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, program, context=None):
+        async with self._semaphore:
+            return await asyncio.wrap_future(self._scheduler.submit(program, context))
+
+    #Resultados en el orden de entrada
+    async def run_all(self, programs, context=None):
+        return await asyncio.gather(*(self.run(program, context) for program in programs))
+
+    def close(self):
+        if self._owns_scheduler:
+            self._scheduler.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
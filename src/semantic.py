@@ -3,16 +3,36 @@
 # Descripción: SemanticExecuter - El siguiente codigo es un ejecutor y analizador semantico
 #Recorre y evalua  todas las entradas del codigo intermedio
 
-class SemanticError(Exception):
-    pass
+from symbols import JUMPS, LOOP_KERNEL, SymbolTable, resolve
+from output import BufferedOutput
+from errors import SemanticError
+from limits import make_guard
+from arrays import DEFAULT_BACKEND, new_array, load, store
 
 class SemanticExecuter:
-    def __init__(self):
-        self.memory_var_data = {}
+    def __init__(self, output=None, array_backend=DEFAULT_BACKEND, limits=None):
+        #Destino de write/writeln (output.py); por omisión stdout con buffer
+        self.output = output if output is not None else BufferedOutput()
+        #Almacenamiento de arreglos (arrays.py): 'array', 'numpy' o 'list'
+        self.array_backend = array_backend
+        #Límites de instrucciones, tiempo y celdas de arreglos (limits.ExecutionLimits) o None
+        self.limits = limits
+        #Frame de slots: variables y temporales seguidos de constantes (ver symbols.resolve)
+        self.symbols = SymbolTable()
+        self.frame = []
 
+    #Vista nombre -> valor de las variables asignadas (arma el diccionario completo; para quien
+    #llama desde afuera, get_value va directo al slot)
+    @property
+    def memory_var_data(self):
+        return self.symbols.variables(self.frame)
+
+    #Un slot sin asignar guarda el propio nombre, así que también devuelve arg
     def get_value(self, arg):
-        if isinstance(arg, str) and arg in self.memory_var_data:
-            return self.memory_var_data[arg]
+        if isinstance(arg, str):
+            slot = self.symbols.slots.get(arg)
+            if slot is not None and slot < len(self.frame):
+                return self.frame[slot]
         return arg
     
     #Devuelve los tipos de datos
@@ -44,86 +64,106 @@ class SemanticExecuter:
             raise SemanticError(f"Invalid operation {type1} {op} {type2}")
 
     def interpret(self, quadruple_table):
-        quad_table_size = len(quadruple_table)
+        self.symbols, resolved_table = resolve(quadruple_table)
+        self.frame = frame = self.symbols.frame()
+        guard = make_guard(self.limits, ((index, row[3]) for index, row in enumerate(resolved_table)
+                                         if row[0] in JUMPS),
+                           [index for index, row in enumerate(resolved_table) if row[0] == LOOP_KERNEL])
+        try:
+            self._run(resolved_table, frame, self.output.write, guard)
+        finally:
+            self.output.flush()
+
+    def _run(self, resolved_table, frame, emit, guard=None):
+        quad_table_size = len(resolved_table)
         quad_id = 0
 
         #Evaluación y generación de operaciones
         while quad_id < quad_table_size:
-            quad = quadruple_table[quad_id]
+            operator, arg1, arg2, result = resolved_table[quad_id]
 
-            arg1_value = self.get_value(quad.arg1)
-            arg2_value = self.get_value(quad.arg2)
+            if operator == '=':
+                frame[result] = frame[arg1]
+            elif operator in ('+', '-', '*', '/', '%'):
+                arg1_value = frame[arg1]
+                arg2_value = frame[arg2]
+                if arg1_value is None or arg2_value is None:
+                    raise ValueError(f"Null value encountered in operation {operator} with args {arg1_value} and {arg2_value}")
 
-            arg1_type = self.get_type(arg1_value)
-            arg2_type = self.get_type(arg2_value)
+                result_type = self._check_operation(self.get_type(arg1_value), self.get_type(arg2_value), operator)
 
-            if quad.operator == '=':
-                self.memory_var_data[quad.result] = arg1_value
-            elif quad.operator in ('+', '-', '*', '/', '%'):
-                if arg1_value is None or arg2_value is None:
-                    raise ValueError(f"Null value encountered in operation {quad.operator} with args {arg1_value} and {arg2_value}")
-
-                result_type = self._check_operation(arg1_type, arg2_type, quad.operator)
-
-                if quad.operator == '+':
-                    self.memory_var_data[quad.result] = arg1_value + arg2_value
-                elif quad.operator == '-':
-                    self.memory_var_data[quad.result] = arg1_value - arg2_value
-                elif quad.operator == '*':
-                    self.memory_var_data[quad.result] = arg1_value * arg2_value
-                elif quad.operator == '/':
-                    self.memory_var_data[quad.result] = arg1_value / arg2_value
-                elif quad.operator == '%':
-                    self.memory_var_data[quad.result] = arg1_value % arg2_value
+                if operator == '+':
+                    frame[result] = arg1_value + arg2_value
+                elif operator == '-':
+                    frame[result] = arg1_value - arg2_value
+                elif operator == '*':
+                    frame[result] = arg1_value * arg2_value
+                elif operator == '/':
+                    frame[result] = arg1_value / arg2_value
+                elif operator == '%':
+                    frame[result] = arg1_value % arg2_value
             
-            elif quad.operator == '==':
-                self.memory_var_data[quad.result] = arg1_value == arg2_value
-            elif quad.operator == '!=':
-                self.memory_var_data[quad.result] = arg1_value != arg2_value
-            elif quad.operator == '<':
-                self.memory_var_data[quad.result] = arg1_value < arg2_value
-            elif quad.operator == '<=':
-                self.memory_var_data[quad.result] = arg1_value <= arg2_value
-            elif quad.operator == '>':
-                self.memory_var_data[quad.result] = arg1_value > arg2_value
-            elif quad.operator == '>=':
-                self.memory_var_data[quad.result] = arg1_value >= arg2_value
+            elif operator == '==':
+                frame[result] = frame[arg1] == frame[arg2]
+            elif operator == '!=':
+                frame[result] = frame[arg1] != frame[arg2]
+            elif operator == '<':
+                frame[result] = frame[arg1] < frame[arg2]
+            elif operator == '<=':
+                frame[result] = frame[arg1] <= frame[arg2]
+            elif operator == '>':
+                frame[result] = frame[arg1] > frame[arg2]
+            elif operator == '>=':
+                frame[result] = frame[arg1] >= frame[arg2]
             
             #lectura y diferencia entre write y writeln
-            elif quad.operator == 'write':
-                print(arg1_value, end='')
-            elif quad.operator == 'writeln':
-                print(arg1_value)
-
-            #Lectura y evaluación de saltos    
-            elif quad.operator == 'goto':     #salta si se indica
-                quad_id = quad.result - 1
-            elif quad.operator == 'gototrue': #salta si la cond es verdadera
-                if arg1_value:
-                    quad_id = quad.result - 1
-            elif quad.operator == 'gotofalse': #salta si la cond es falsa
-                if not arg1_value:
-                    quad_id = quad.result - 1
+            elif operator == 'write':
+                emit(str(frame[arg1]))
+            elif operator == 'writeln':
+                emit(str(frame[arg1]) + '\n')
+
+            #Lectura y evaluación de saltos; los saltos hacia atrás pasan por los límites
+            elif operator == 'goto':     #salta si se indica
+                if guard is not None and result <= quad_id:
+                    guard.jump(quad_id)
+                quad_id = result - 1
+            elif operator == 'gototrue': #salta si la cond es verdadera
+                if frame[arg1]:
+                    if guard is not None and result <= quad_id:
+                        guard.jump(quad_id)
+                    quad_id = result - 1
+            elif operator == 'gotofalse': #salta si la cond es falsa
+                if not frame[arg1]:
+                    if guard is not None and result <= quad_id:
+                        guard.jump(quad_id)
+                    quad_id = result - 1
             
             #Evaluaciones de arreglos
-            elif quad.operator == 'declare_array':
-                array_name = quad.arg2
-                array_size = self.get_value(quad.result)
-                self.memory_var_data[array_name] = [0] * array_size
+            #arg1 es el tipo declarado del arreglo
+            elif operator == 'declare_array':
+                if guard is not None:
+                    guard.allocate(quad_id, frame[result])
+                frame[arg2] = new_array(arg1, frame[result], self.array_backend)
             
-            elif quad.operator == 'array_assign':
-                array_name = quad.arg1
-                index = self.get_value(quad.arg2)
-                value = self.get_value(quad.result)
-                self.memory_var_data[array_name][index] = value
+            elif operator == 'array_assign':
+                store(self._array(arg1), frame[arg2], frame[result], self.symbols.names[arg1])
             
-            elif quad.operator == 'array_access':
-                array_name = quad.arg1
-                index = self.get_value(quad.arg2)
-                self.memory_var_data[quad.result] = self.memory_var_data[array_name][index]
+            elif operator == 'array_access':
+                frame[result] = load(self._array(arg1), frame[arg2], self.symbols.names[arg1])
+
+            #Ciclo en bloque (loops.py); False si hay que ejecutar el ciclo escalar que le sigue
+            elif operator == 'loop_kernel':
+                frame[result] = arg1.run(frame, guard, quad_id)
                 
             quad_id += 1
 
+    #Arreglo guardado en un slot; un slot nunca asignado equivale a una variable inexistente
+    def _array(self, slot):
+        value = self.frame[slot]
+        if slot >= len(self.symbols.names) or value is self.symbols.names[slot]:
+            raise KeyError(value)
+        return value
+
 # Ejemplo de uso con uso con el AST
 """
 ast2 = ('programstart', 'test', (('statement', ('array_declaration', ('datatype', 'int'), 'arr', 10)), ('statement', ('array_assignment', 'arr', ('factor', 0), ('plus', ('factor', 1), ('factor', 3)))), ('statement', ('array_assignment', 'arr', ('plus', ('factor', 1), ('factor', 3)), ('mult', ('factor', 5), ('factor', 8)))), ('statement', ('assignment', 'x', '=', ('plus', ('factor', ('array_access', 'arr', ('factor', 0))), ('factor', ('array_access', 'arr', ('factor', 1)))))), ('statement', ('write', ('factor', ('array_access', 'arr', ('plus', ('factor', 0), ('factor', 1))))))))
@@ -0,0 +1,83 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: Resolución de símbolos - asigna a cada variable y temporal un slot entero
+#dentro de un frame preasignado y etiqueta las constantes de forma explícita
+
+from codegen import quadruple_rows
+
+#Operadores cuyo resultado se escribe en memoria (quad.result)
+WRITES_RESULT = ('=', '+', '-', '*', '/', '%', '==', '!=', '<', '<=', '>', '>=', 'array_access')
+
+#Operadores de salto: quad.result es un índice de cuadruplo, no un operando
+JUMPS = ('goto', 'gototrue', 'gotofalse')
+
+#Ciclo en bloque de loops.py: arg1 es el kernel (lee y escribe sus propias variables), result una bandera
+LOOP_KERNEL = 'loop_kernel'
+
+#Tabla de símbolos resuelta
+#Los slots [0, len(names)) son variables y temporales; los siguientes son constantes.
+#Un slot de variable inicia con su propio nombre, igual que get_value cuando la variable no existe
+class SymbolTable:
+    def __init__(self):
+        self.slots = {}
+        self.names = []
+        self.constants = []
+        self._constant_slots = {}
+
+    def declare(self, name):
+        if name not in self.slots:
+            self.slots[name] = len(self.names)
+            self.names.append(name)
+        return self.slots[name]
+
+    #Slot de un operando: variable si se escribe en algún cuadruplo, si no constante.
+    #Se llama después de declarar todas las variables
+    def operand(self, arg):
+        if isinstance(arg, str) and arg in self.slots:
+            return self.slots[arg]
+        key = (type(arg), arg)
+        if key not in self._constant_slots:
+            self._constant_slots[key] = len(self.names) + len(self.constants)
+            self.constants.append(arg)
+        return self._constant_slots[key]
+
+    def is_constant(self, slot):
+        return slot >= len(self.names)
+
+    #Frame inicial: nombres de variables seguidos del pool de constantes
+    def frame(self):
+        return self.names + self.constants
+
+    #Variables con valor asignado en un frame ya ejecutado
+    def variables(self, frame):
+        return {name: value for name, value in zip(self.names, frame) if value is not name}
+
+#Resuelve la tabla de cuadruplos a tuplas (operator, arg1, arg2, result) de slots enteros.
+#En saltos result queda como índice de destino, en declare_array arg1 queda como tipo de dato
+#y en loop_kernel arg1 es el kernel ligado a los slots (BoundKernel).
+#Recorre la tabla dos veces con quadruple_rows en vez de copiarla, así un irfile.IRProgram se lee
+#directo del buffer sin decodificarse antes a una lista
+def resolve(quadruple_table):
+    symbols = SymbolTable()
+    for op, arg1, arg2, result in quadruple_rows(quadruple_table):
+        if op in WRITES_RESULT:
+            symbols.declare(result)
+        elif op == 'declare_array':
+            symbols.declare(arg2)
+        elif op == LOOP_KERNEL:
+            for name in arg1.writes() + (result,):
+                symbols.declare(name)
+
+    table = []
+    for op, arg1, arg2, result in quadruple_rows(quadruple_table):
+        if op in JUMPS:
+            table.append((op, symbols.operand(arg1), None, result))
+        elif op == 'declare_array':
+            table.append((op, arg1, symbols.slots[arg2], symbols.operand(result)))
+        elif op == LOOP_KERNEL:
+            table.append((op, arg1.bind(symbols.operand), None, symbols.slots[result]))
+        elif op in WRITES_RESULT:
+            table.append((op, symbols.operand(arg1), symbols.operand(arg2), symbols.slots[result]))
+        else:
+            table.append((op, symbols.operand(arg1), symbols.operand(arg2), symbols.operand(result)))
+    return symbols, table
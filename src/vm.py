@@ -0,0 +1,325 @@
+# Autor: Andrea Catalina Fernández Mena A01197705
+# Fecha: 18/10/2026
+# Descripción: BytecodeVM - Ejecutor alternativo basado en registros
+#Traduce los cuadruplos a opcodes enteros con operandos ya resueltos a registros
+#y los ejecuta en un ciclo de despacho compacto, con la misma salida que SemanticExecuter
+
+import operator
+import time
+
+from semantic import SemanticExecuter
+from symbols import resolve
+from output import BufferedOutput
+from arrays import DEFAULT_BACKEND, FAST_ARRAYS, new_array, load, store
+from limits import make_guard
+
+#Opcodes
+OP_MOVE = 0
+OP_ADD = 1
+OP_SUB = 2
+OP_MUL = 3
+OP_DIV = 4
+OP_MOD = 5
+OP_EQ = 6
+OP_NE = 7
+OP_LT = 8
+OP_LE = 9
+OP_GT = 10
+OP_GE = 11
+OP_GOTO = 12
+OP_GOTOTRUE = 13
+OP_GOTOFALSE = 14
+OP_WRITE = 15
+OP_WRITELN = 16
+OP_DECLARE_ARRAY = 17
+OP_ARRAY_ASSIGN = 18
+OP_ARRAY_ACCESS = 19
+#Operadores sin efecto en SemanticExecuter (&&, ||, ...)
+OP_NOP = 20
+OP_LOOP_KERNEL = 21
+#Instrumentación: cuenta una ejecución del cuadruplo a (solo en el bytecode de counting())
+OP_COUNT = 22
+#Perfil: cuenta el cuadruplo a y le suma al anterior el tiempo desde la sonda anterior (profiling())
+OP_PROFILE = 23
+#Saltos hacia atrás con verificación de límites (solo en el bytecode de limited()); b es el índice
+#del cuadruplo. Mismo orden que OP_GOTO, OP_GOTOTRUE y OP_GOTOFALSE
+OP_LIMIT_GOTO = 24
+OP_LIMIT_GOTOTRUE = 25
+OP_LIMIT_GOTOFALSE = 26
+
+_JUMP_OPCODES = frozenset((OP_GOTO, OP_GOTOTRUE, OP_GOTOFALSE, OP_LIMIT_GOTO, OP_LIMIT_GOTOTRUE, OP_LIMIT_GOTOFALSE))
+
+OPCODES = {
+    '=': OP_MOVE,
+    '+': OP_ADD,
+    '-': OP_SUB,
+    '*': OP_MUL,
+    '/': OP_DIV,
+    '%': OP_MOD,
+    '==': OP_EQ,
+    '!=': OP_NE,
+    '<': OP_LT,
+    '<=': OP_LE,
+    '>': OP_GT,
+    '>=': OP_GE,
+    'goto': OP_GOTO,
+    'gototrue': OP_GOTOTRUE,
+    'gotofalse': OP_GOTOFALSE,
+    'write': OP_WRITE,
+    'writeln': OP_WRITELN,
+    'declare_array': OP_DECLARE_ARRAY,
+    'array_assign': OP_ARRAY_ASSIGN,
+    'array_access': OP_ARRAY_ACCESS,
+    'loop_kernel': OP_LOOP_KERNEL,
+}
+
+_ARITHMETIC = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+}
+
+_NUMERIC = frozenset((int, float, bool))
+
+#Camino lento de la aritmética: mismas validaciones (y errores) que SemanticExecuter
+def checked_arithmetic(arg1_value, arg2_value, op):
+    if arg1_value is None or arg2_value is None:
+        raise ValueError(f"Null value encountered in operation {op} with args {arg1_value} and {arg2_value}")
+    checker = SemanticExecuter()
+    checker._check_operation(checker.get_type(arg1_value), checker.get_type(arg2_value), op)
+    return _ARITHMETIC[op](arg1_value, arg2_value)
+
+#Arreglo que no es lista: si el registro nunca se asignó, mismo KeyError que memory_var_data[array_name]
+def array_operand(bytecode, regs, index):
+    value = regs[index]
+    if value is bytecode.registers[index] and isinstance(value, str):
+        raise KeyError(value)
+    return value
+
+#Programa ya traducido: instrucciones y valores iniciales de los registros
+class Bytecode:
+    def __init__(self, code, symbols):
+        self.code = code
+        self.symbols = symbols
+        self.registers = symbols.frame()
+        #Ejecuciones por cuadruplo cuando el bytecode tiene instrucciones OP_COUNT u OP_PROFILE
+        self.counts = None
+        #Nanosegundos por cuadruplo con OP_PROFILE; el último lugar es el tiempo antes de la primera sonda
+        self.times = None
+        #limits.LimitGuard de los saltos OP_LIMIT_* y de declare_array
+        self.guard = None
+
+    def __len__(self):
+        return len(self.code)
+
+#Traducción de cuadruplos a bytecode sobre los slots de symbols.resolve:
+#los registros de variables van primero y las constantes son registros de solo lectura
+def assemble(quadruple_table):
+    symbols, resolved_table = resolve(quadruple_table)
+    code = []
+    for operator, arg1, arg2, result in resolved_table:
+        op = OPCODES.get(operator, OP_NOP)
+        if op == OP_NOP:
+            code.append((OP_NOP, 0, 0, 0))
+        elif op in (OP_GOTO, OP_GOTOTRUE, OP_GOTOFALSE):
+            code.append((op, arg1, 0, result))
+        elif op in (OP_WRITE, OP_WRITELN):
+            code.append((op, arg1, 0, 0))
+        elif op == OP_DECLARE_ARRAY:
+            code.append((op, arg2, result, arg1))
+        else:
+            code.append((op, arg1, arg2, result))
+
+    return Bytecode(code, symbols)
+
+#Bytecode con una sonda (OP_COUNT u OP_PROFILE) antes de cada instrucción y los saltos reubicados.
+#El ciclo de despacho es el mismo; las ejecuciones quedan en counts[índice del cuadruplo]
+def _probed(bytecode, probe):
+    code = []
+    for index, (op, a, b, c) in enumerate(bytecode.code):
+        code.append((probe, index, 0, 0))
+        if op in _JUMP_OPCODES:
+            c *= 2
+        code.append((op, a, b, c))
+    probed = Bytecode(code, bytecode.symbols)
+    probed.counts = [0] * len(bytecode.code)
+    probed.guard = bytecode.guard
+    return probed
+
+def counting(bytecode):
+    return _probed(bytecode, OP_COUNT)
+
+#Como counting(), y además times[índice] acumula el tiempo de una sonda a la siguiente: lo que
+#tarda el cuadruplo más su despacho (y su sonda)
+def profiling(bytecode):
+    profiled = _probed(bytecode, OP_PROFILE)
+    profiled.times = [0] * (len(bytecode.code) + 1)
+    return profiled
+
+#Bytecode con los saltos hacia atrás cambiados por OP_LIMIT_* (sin cambiar índices), b de
+#OP_LOOP_KERNEL con el índice del cuadruplo y el guard de la ejecución; sin límites devuelve el
+#mismo bytecode
+def limited(bytecode, limits):
+    guard = make_guard(limits, ((index, c) for index, (op, a, b, c) in enumerate(bytecode.code)
+                                if op in (OP_GOTO, OP_GOTOTRUE, OP_GOTOFALSE)),
+                       [index for index, (op, a, b, c) in enumerate(bytecode.code) if op == OP_LOOP_KERNEL])
+    if guard is None:
+        return bytecode
+    code = []
+    for index, (op, a, b, c) in enumerate(bytecode.code):
+        if op in (OP_GOTO, OP_GOTOTRUE, OP_GOTOFALSE) and c <= index:
+            op += OP_LIMIT_GOTO - OP_GOTO
+            b = index
+        elif op == OP_LOOP_KERNEL:
+            b = index
+        code.append((op, a, b, c))
+    checked = Bytecode(code, bytecode.symbols)
+    checked.guard = guard
+    return checked
+
+class BytecodeVM:
+    #Con count=True se cuentan las ejecuciones de cada cuadruplo (counts) para la instrumentación;
+    #con profile=True además se mide el tiempo de cada uno en nanosegundos (times, ver profiler.py).
+    #limits (limits.ExecutionLimits) acota instrucciones, tiempo y celdas de arreglos
+    def __init__(self, output=None, array_backend=DEFAULT_BACKEND, count=False, profile=False, limits=None):
+        self.output = output if output is not None else BufferedOutput()
+        self.array_backend = array_backend
+        self.memory_var_data = {}
+        self.count = count
+        self.profile = profile
+        self.limits = limits
+        self.counts = None
+        self.times = None
+
+    def interpret(self, quadruple_table):
+        self.run(assemble(quadruple_table))
+
+    def run(self, bytecode):
+        bytecode = limited(bytecode, self.limits)
+        if self.profile:
+            bytecode = profiling(bytecode)
+        elif self.count:
+            bytecode = counting(bytecode)
+        regs = list(bytecode.registers)
+        try:
+            self._dispatch(bytecode, regs, self.output.write)
+        finally:
+            self.output.flush()
+            self.counts = bytecode.counts
+            if bytecode.times is not None:
+                self.times = bytecode.times[:-1]
+
+        #Estado final con la misma forma que SemanticExecuter.memory_var_data
+        self.memory_var_data = bytecode.symbols.variables(regs)
+
+    def _dispatch(self, bytecode, regs, emit):
+        code = bytecode.code
+        names = bytecode.symbols.names
+        numeric = _NUMERIC
+        fast_arrays = FAST_ARRAYS
+        counts = bytecode.counts
+        times = bytecode.times
+        guard = bytecode.guard
+        clock = time.perf_counter_ns
+        last = len(times) - 1 if times is not None else 0
+        size = len(code)
+        pc = 0
+        since = clock()
+
+        #Ciclo de despacho: opcodes ordenados por frecuencia en los ciclos
+        while pc < size:
+            op, a, b, c = code[pc]
+
+            if op == OP_MOVE:
+                regs[c] = regs[a]
+            elif op <= OP_MOD:
+                x = regs[a]
+                y = regs[b]
+                if x.__class__ in numeric and y.__class__ in numeric:
+                    if op == OP_ADD:
+                        regs[c] = x + y
+                    elif op == OP_SUB:
+                        regs[c] = x - y
+                    elif op == OP_MUL:
+                        regs[c] = x * y
+                    elif op == OP_DIV:
+                        regs[c] = x / y
+                    else:
+                        regs[c] = x % y
+                else:
+                    regs[c] = checked_arithmetic(x, y, ('+', '-', '*', '/', '%')[op - OP_ADD])
+            elif op <= OP_GE:
+                x = regs[a]
+                y = regs[b]
+                if op == OP_LT:
+                    regs[c] = x < y
+                elif op == OP_GT:
+                    regs[c] = x > y
+                elif op == OP_LE:
+                    regs[c] = x <= y
+                elif op == OP_GE:
+                    regs[c] = x >= y
+                elif op == OP_EQ:
+                    regs[c] = x == y
+                else:
+                    regs[c] = x != y
+            elif op == OP_GOTOFALSE:
+                if not regs[a]:
+                    pc = c
+                    continue
+            elif op == OP_GOTO:
+                pc = c
+                continue
+            elif op == OP_GOTOTRUE:
+                if regs[a]:
+                    pc = c
+                    continue
+            elif op == OP_WRITELN:
+                emit(str(regs[a]) + '\n')
+            elif op == OP_WRITE:
+                emit(str(regs[a]))
+            #Camino rápido con el índice dentro del rango; el resto (y los errores) en load/store
+            elif op == OP_ARRAY_ACCESS:
+                array = regs[a]
+                index = regs[b]
+                if array.__class__ in fast_arrays and index.__class__ is int and 0 <= index < len(array):
+                    regs[c] = array[index]
+                else:
+                    regs[c] = load(array_operand(bytecode, regs, a), index, names[a])
+            elif op == OP_ARRAY_ASSIGN:
+                array = regs[a]
+                index = regs[b]
+                if array.__class__ in fast_arrays and index.__class__ is int and 0 <= index < len(array):
+                    try:
+                        array[index] = regs[c]
+                    except (TypeError, OverflowError):
+                        store(array, index, regs[c], names[a])
+                else:
+                    store(array_operand(bytecode, regs, a), index, regs[c], names[a])
+            elif op == OP_DECLARE_ARRAY:
+                if guard is not None:
+                    #Con sondas cada cuadruplo ocupa dos instrucciones
+                    guard.allocate(pc // 2 if counts is not None else pc, regs[b])
+                regs[a] = new_array(c, regs[b], self.array_backend)
+            elif op == OP_LOOP_KERNEL:
+                regs[c] = a.run(regs, guard, b)
+            elif op == OP_COUNT:
+                counts[a] += 1
+            elif op == OP_PROFILE:
+                now = clock()
+                times[last] += now - since
+                counts[a] += 1
+                last = a
+                since = now
+            elif op >= OP_LIMIT_GOTO:
+                if op == OP_LIMIT_GOTO or (not regs[a] if op == OP_LIMIT_GOTOFALSE else regs[a]):
+                    guard.jump(b)
+                    pc = c
+                    continue
+
+            pc += 1
+
+        if times is not None:
+            times[last] += clock() - since